@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import timeit
+
+import numpy as np
+
+from vaccel import Arg
+from vaccel.ops.tf import Tensor as TFTensor
+from vaccel.ops.tf import TensorType as TFTensorType
+from vaccel.ops.tf.lite import Tensor as TFLiteTensor
+from vaccel.ops.tf.lite import TensorType as TFLiteTensorType
+from vaccel.ops.torch import Tensor as TorchTensor
+from vaccel.ops.torch import TensorType as TorchTensorType
+
+TENSORS = {
+    "torch": (TorchTensor, TorchTensorType.FLOAT),
+    "tf": (TFTensor, TFTensorType.FLOAT),
+    "tflite": (TFLiteTensor, TFLiteTensorType.FLOAT32),
+}
+
+
+def report(name: str, count: int, single: float, batch: float):
+    print(
+        f"{name:>8}: {count} objects: "
+        f"per-object {single * 1e6:9.1f} us, "
+        f"batch {batch * 1e6:9.1f} us, "
+        f"speedup {single / batch:5.2f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare batch and per-object tensor/arg construction."
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=int,
+        nargs="+",
+        default=[1, 8, 64, 512],
+        help="Number of objects to construct.",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=16,
+        help="Number of float32 elements per tensor/arg.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=200,
+        help="Number of timed constructions.",
+    )
+    args = parser.parse_args()
+
+    data = np.ones(args.size, dtype=np.float32)
+    dims = [args.size]
+    buf = data.tobytes()
+
+    for count in args.count:
+        for name, (tensor_cls, tensor_type) in TENSORS.items():
+            items = [(dims, tensor_type, data)] * count
+            single = min(
+                timeit.repeat(
+                    lambda tensor_cls=tensor_cls, items=items: [
+                        tensor_cls.from_numpy(d)._c_ptr for _, _, d in items
+                    ],
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            batch = min(
+                timeit.repeat(
+                    lambda tensor_cls=tensor_cls, items=items: tensor_cls.batch(
+                        items
+                    ),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            report(name, count, single, batch)
+
+        single = min(
+            timeit.repeat(
+                lambda count=count: [Arg(buf)._c_ptr for _ in range(count)],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        batch = min(
+            timeit.repeat(
+                lambda count=count: Arg.batch([(buf,)] * count),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        report("arg", count, single, batch)
+
+
+if __name__ == "__main__":
+    main()
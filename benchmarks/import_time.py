@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+IMPORTTIME_RE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|"
+    r"(?P<indent>\s+)(?P<module>\S+)$"
+)
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            timings[match.group("module")] = (
+                int(match.group("self")),
+                int(match.group("cumulative")),
+            )
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the import time of a module with -X importtime."
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        type=str,
+        default="vaccel",
+        help="Module to import.",
+    )
+    parser.add_argument(
+        "-i",
+        "--iterations",
+        type=int,
+        default=10,
+        help="Number of fresh interpreter runs.",
+    )
+    parser.add_argument(
+        "-t",
+        "--top",
+        type=int,
+        default=15,
+        help="Number of slowest modules (by self time) to report.",
+    )
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.iterations)]
+
+    totals = [run[args.module][1] for run in runs if args.module in run]
+    print(
+        f"{args.module}: cumulative import time over {len(totals)} runs: "
+        f"median {statistics.median(totals) / 1000:.2f} ms, "
+        f"min {min(totals) / 1000:.2f} ms, "
+        f"max {max(totals) / 1000:.2f} ms"
+    )
+
+    self_times = {}
+    for run in runs:
+        for module, (self_us, _) in run.items():
+            self_times.setdefault(module, []).append(self_us)
+    slowest = sorted(
+        self_times.items(),
+        key=lambda item: statistics.median(item[1]),
+        reverse=True,
+    )[: args.top]
+
+    print(f"\nSlowest {len(slowest)} modules (median self time):")
+    for module, times in slowest:
+        print(f"  {statistics.median(times) / 1000:8.2f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
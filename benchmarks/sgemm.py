@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import timeit
+
+import numpy as np
+
+from vaccel import Session
+
+
+def measure(session: Session, size: int, repeat: int) -> (float, float):
+    a = np.ones((size, size), dtype=np.float32)
+    b = np.ones((size, size), dtype=np.float32)
+    out = np.empty((size, size), dtype=np.float32)
+    a_list, b_list = a.ravel().tolist(), b.ravel().tolist()
+    dims = (size, size, size)
+
+    lists = timeit.timeit(
+        lambda: session.sgemm(
+            *dims, 1.0, a_list, size, b_list, size, 0.0, size
+        ),
+        number=repeat,
+    )
+    arrays = timeit.timeit(
+        lambda: session.sgemm(*dims, 1.0, a, size, b, size, 0.0, size, out=out),
+        number=repeat,
+    )
+    return lists / repeat, arrays / repeat
+
+
+def measure_batched(
+    session: Session, size: int, batch: int, repeat: int
+) -> (float, float):
+    a = np.ones((batch, size, size), dtype=np.float32)
+    b = np.ones((batch, size, size), dtype=np.float32)
+    out = np.empty((batch, size, size), dtype=np.float32)
+
+    def loop():
+        for i in range(batch):
+            session.sgemm(
+                size, size, size, 1.0, a[i], size, b[i], size, 0.0, size,
+                out=out[i],
+            )  # fmt: skip
+
+    looped = timeit.timeit(loop, number=repeat)
+    batched = timeit.timeit(
+        lambda: session.sgemm_batched(a, b, out), number=repeat
+    )
+    return looped / repeat, batched / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare SGEMM with list, NumPy and batched matrices."
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        nargs="+",
+        default=[64, 256, 1024],
+        help="Dimension of the square matrices.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed operations.",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        type=int,
+        default=1000,
+        help="Number of matrices of the batched SGEMM.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Dimension of the square matrices of the batched SGEMM.",
+    )
+    args = parser.parse_args()
+
+    session = Session()
+    for size in args.size:
+        lists, arrays = measure(session, size, args.repeat)
+        print(
+            f"{size:5d}x{size:<5d}: "
+            f"lists {lists * 1e3:10.2f} ms, "
+            f"numpy {arrays * 1e3:10.2f} ms, "
+            f"speedup {lists / arrays:7.2f}x"
+        )
+
+    looped, batched = measure_batched(
+        session, args.batch_size, args.batch, args.repeat
+    )
+    print(
+        f"{args.batch} x {args.batch_size}x{args.batch_size}: "
+        f"loop {looped * 1e3:10.2f} ms, "
+        f"batched {batched * 1e3:10.2f} ms, "
+        f"speedup {looped / batched:7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
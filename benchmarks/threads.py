@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from vaccel import Arg, Session
+from vaccel._c_types import CList
+from vaccel.ops.torch import Tensor, TensorType
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def prepost(session: Session, size: int):
+    # CPU-bound Python pre-processing, followed by arg/tensor marshalling and
+    # post-processing of the results
+    data = [float(i % 255) / 255.0 for i in range(size)]
+    tensor = Tensor([size], TensorType.FLOAT, data)
+    args = CList([Arg(tensor.to_bytes()), Arg(b"meta")])
+    session.noop()
+    return sum(tensor.as_memoryview().cast("f")) + len(args)
+
+
+def noop(session: Session, size: int):
+    _ = size
+    session.noop()
+
+
+WORKLOADS = {"prepost": prepost, "noop": noop}
+
+
+def run(workload, nr_threads: int, iterations: int, size: int) -> float:
+    barrier = threading.Barrier(nr_threads + 1)
+
+    def worker():
+        with Session() as session:
+            barrier.wait()
+            for _ in range(iterations):
+                workload(session, size)
+
+    with ThreadPoolExecutor(max_workers=nr_threads) as executor:
+        futures = [executor.submit(worker) for _ in range(nr_threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return nr_threads * iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure how operations scale across threads."
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, os.cpu_count() or 1],
+        help="Number of threads, each with its own session.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workload",
+        choices=WORKLOADS,
+        nargs="+",
+        default=list(WORKLOADS),
+        help="Workloads to run.",
+    )
+    parser.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Number of operations per thread.",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=1024,
+        help="Number of elements processed per operation.",
+    )
+    args = parser.parse_args()
+
+    print(f"GIL enabled: {gil_enabled()}")
+    for name in args.workload:
+        baseline = None
+        for nr_threads in sorted(set(args.threads)):
+            rate = run(WORKLOADS[name], nr_threads, args.iterations, args.size)
+            baseline = baseline or rate
+            print(
+                f"{name:>8}: {nr_threads:3d} threads: "
+                f"{rate:12.1f} ops/s, "
+                f"speedup {rate / baseline:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
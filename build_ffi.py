@@ -1,8 +1,10 @@
 """Build script for CFFI module library."""
 
+import importlib.util
 import os
 import re
 import subprocess
+from pathlib import Path
 from typing import Any
 
 import cffi
@@ -12,6 +14,152 @@ PKG = "vaccel"
 PKG_MIN_VERSION = "0.8.0"
 MODULE_NAME = f"{PKG}._lib{PKG}"
 HEADER_INCLUDE = f'#include "{PKG}.h"'
+ENUMS_FILE = Path(__file__).parent / PKG / "_enums.py"
+ENUM_PREFIXES = (
+    "VACCEL_ARG_",
+    "VACCEL_OP_",
+    "VACCEL_PLUGIN_",
+    "VACCEL_RESOURCE_",
+    "VACCEL_TORCH_",
+    "VACCEL_TF_",
+    "VACCEL_TFLITE_",
+)
+# Batch helpers compiled into the module, so that N objects can be created, or
+# N operations run, with a single FFI call. On failure, any objects already
+# created are deleted and all output pointers are NULL.
+HELPERS_CDEF = """
+int vaccel_py_args_from_bufs(struct vaccel_arg **args, size_t nr_args,
+                             void **bufs, const size_t *sizes,
+                             const uint32_t *types, const uint32_t *ids);
+int vaccel_py_torch_tensors_new(struct vaccel_torch_tensor **tensors,
+                                size_t nr_tensors, const size_t *nr_dims,
+                                const int64_t *dims, const int *data_types,
+                                void **data, const size_t *sizes);
+int vaccel_py_tf_tensors_new(struct vaccel_tf_tensor **tensors,
+                             size_t nr_tensors, const size_t *nr_dims,
+                             const int64_t *dims, const int *data_types,
+                             void **data, const size_t *sizes);
+int vaccel_py_tflite_tensors_new(struct vaccel_tflite_tensor **tensors,
+                                 size_t nr_tensors, const size_t *nr_dims,
+                                 const int32_t *dims, const int *data_types,
+                                 void **data, const size_t *sizes);
+int vaccel_py_sgemm_batched(struct vaccel_session *sess, size_t batch,
+                            int64_t m, int64_t n, int64_t k, float alpha,
+                            float *a, int64_t stride_a, int64_t lda,
+                            float *b, int64_t stride_b, int64_t ldb,
+                            float beta, float *c, int64_t stride_c,
+                            int64_t ldc);
+"""
+ARGS_HELPER_SOURCE = """
+int vaccel_py_args_from_bufs(struct vaccel_arg **args, size_t nr_args,
+                             void **bufs, const size_t *sizes,
+                             const uint32_t *types, const uint32_t *ids)
+{
+    size_t i;
+    int ret;
+
+    for (i = 0; i < nr_args; i++)
+        args[i] = NULL;
+
+    for (i = 0; i < nr_args; i++) {
+        ret = vaccel_arg_from_buf(&args[i], bufs[i], sizes[i], types[i],
+                                  ids[i]);
+        if (ret)
+            goto fail;
+    }
+
+    return 0;
+
+fail:
+    while (i-- > 0) {
+        vaccel_arg_delete(args[i]);
+        args[i] = NULL;
+    }
+    return ret;
+}
+"""
+TENSORS_HELPER_TEMPLATE = """
+int vaccel_py_{prefix}_tensors_new(struct vaccel_{prefix}_tensor **tensors,
+                                   size_t nr_tensors, const size_t *nr_dims,
+                                   const {dim_type} *dims,
+                                   const int *data_types, void **data,
+                                   const size_t *sizes)
+{{
+    size_t i;
+    int ret;
+
+    for (i = 0; i < nr_tensors; i++)
+        tensors[i] = NULL;
+
+    for (i = 0; i < nr_tensors; i++) {{
+        ret = vaccel_{prefix}_tensor_new(&tensors[i], nr_dims[i], dims,
+                                         data_types[i]);
+        if (ret)
+            goto fail;
+        dims += nr_dims[i];
+
+        ret = vaccel_{prefix}_tensor_set_data(tensors[i], data[i], sizes[i]);
+        if (ret) {{
+            i++;
+            goto fail;
+        }}
+    }}
+
+    return 0;
+
+fail:
+    while (i-- > 0) {{
+        if (tensors[i])
+            vaccel_{prefix}_tensor_delete(tensors[i]);
+        tensors[i] = NULL;
+    }}
+    return ret;
+}}
+"""
+SGEMM_HELPER_SOURCE = """
+int vaccel_py_sgemm_batched(struct vaccel_session *sess, size_t batch,
+                            int64_t m, int64_t n, int64_t k, float alpha,
+                            float *a, int64_t stride_a, int64_t lda,
+                            float *b, int64_t stride_b, int64_t ldb,
+                            float beta, float *c, int64_t stride_c,
+                            int64_t ldc)
+{
+    size_t i;
+    int ret;
+
+    for (i = 0; i < batch; i++) {
+        ret = vaccel_sgemm(sess, m, n, k, alpha, a + i * stride_a, lda,
+                           b + i * stride_b, ldb, beta, c + i * stride_c,
+                           ldc);
+        if (ret)
+            return ret;
+    }
+
+    return 0;
+}
+"""
+HELPERS_SOURCE = (
+    ARGS_HELPER_SOURCE
+    + SGEMM_HELPER_SOURCE
+    + "".join(
+        TENSORS_HELPER_TEMPLATE.format(prefix=prefix, dim_type=dim_type)
+        for prefix, dim_type in (
+            ("torch", "int64_t"),
+            ("tf", "int64_t"),
+            ("tflite", "int32_t"),
+        )
+    )
+)
+ENUMS_TEMPLATE = """\
+# SPDX-License-Identifier: Apache-2.0
+
+\"\"\"Precomputed C enum constants.
+
+Generated by `build_ffi.py` from the vAccel headers. Do not edit.
+\"\"\"
+
+ENUM_CONSTANTS = {constants}
+"""
 
 
 def generate_cdef(pkg: str, pkg_min_version: str) -> (str, dict[str, Any]):
@@ -129,7 +277,7 @@ def remove_static_inline_functions(source: str) -> str:
         body_start = source.find("{", match.end())
         if body_start == -1:
             # Malformed inline without a body, treat as normal text
-            result.append(source[match.start():match.end()])
+            result.append(source[match.start() : match.end()])
             i = match.end()
             continue
 
@@ -200,15 +348,77 @@ def sanitize_cdef(cdef: str, pkg: str) -> str:
     return "\n".join(filtered_lines)
 
 
+def load_lib(path: str) -> Any | None:
+    """Load the compiled module and return its `lib`, or None on failure."""
+    spec = importlib.util.spec_from_file_location(MODULE_NAME, path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        return None
+    return module.lib
+
+
+def enum_tables(
+    lib: Any | None, prefixes: tuple[str, ...]
+) -> dict[str, dict[str, int]]:
+    """Collect the C enum constants of the compiled module by prefix.
+
+    The members of each table are the constants of `dir(lib)` starting with
+    the prefix, as found by `CEnumBuilder`. If `lib` is None, no tables are
+    collected and `CEnumBuilder` scans the library at runtime instead.
+    """
+    if lib is None:
+        return {}
+    names = dir(lib)
+    return {
+        prefix: {
+            name[len(prefix) :]: getattr(lib, name)
+            for name in names
+            if name.startswith(prefix)
+        }
+        for prefix in prefixes
+    }
+
+
+def generate_enums(lib: Any | None, prefixes: tuple[str, ...]) -> str:
+    """Generate the source of a module with the C enum constant tables."""
+    lines = ["{"]
+    for prefix, members in enum_tables(lib, prefixes).items():
+        lines.append(f'    "{prefix}": {{')
+        lines.extend(
+            f'        "{name}": {value},' for name, value in members.items()
+        )
+        lines.append("    },")
+    lines.append("}")
+    return ENUMS_TEMPLATE.format(constants="\n".join(lines))
+
+
+def write_if_changed(path: Path, content: str) -> None:
+    """Write content to path, leaving the file untouched if it is current."""
+    if path.is_file() and path.read_text() == content:
+        return
+    path.write_text(content)
+
+
 def compile_ffi() -> cffi.FFI:
     """Generate and compile ffi bindings."""
     (cdef, kwargs) = generate_cdef(PKG, PKG_MIN_VERSION)
     sanitized_cdef = sanitize_cdef(cdef, PKG)
 
     ffibuilder = cffi.FFI()
-    ffibuilder.set_source(MODULE_NAME, HEADER_INCLUDE, **kwargs, py_limited_api=True)
+    ffibuilder.set_source(
+        MODULE_NAME,
+        HEADER_INCLUDE + HELPERS_SOURCE,
+        **kwargs,
+        py_limited_api=True,
+    )
     ffibuilder.cdef(sanitized_cdef)
-    ffibuilder.compile(verbose=True)
+    ffibuilder.cdef(HELPERS_CDEF)
+    lib_path = ffibuilder.compile(verbose=True)
+    write_if_changed(
+        ENUMS_FILE, generate_enums(load_lib(lib_path), ENUM_PREFIXES)
+    )
     return ffibuilder
 
 
@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
-from pathlib import Path
 
 from vaccel import Resource, ResourceType, Session
 
@@ -34,11 +33,8 @@ def main():
         resource = Resource(args.model_path, ResourceType.MODEL)
         resource.register(session)
 
-    with Path(args.image_file).open("rb") as f:
-        image = f.read()
-
     for _i in range(args.iterations):
-        (prediction, _) = session.classify(image)
+        (prediction, _) = session.classify(args.image_file)
         print(f"Prediction: {prediction}")
 
 
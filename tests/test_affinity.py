@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from vaccel import local_session
+from vaccel.affinity import (
+    allowed_cpus,
+    numa_nodes,
+    parse_cpulist,
+    pinned_thread_pool,
+    worker_cpusets,
+)
+
+needs_affinity = pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="CPU affinity not supported"
+)
+
+
+@pytest.fixture
+def node_sysfs(tmp_path):
+    cpus = sorted(allowed_cpus())
+    half = max(len(cpus) // 2, 1)
+    for node, node_cpus in enumerate((cpus[:half], cpus[half:])):
+        node_path = tmp_path / f"node{node}"
+        node_path.mkdir()
+        (node_path / "cpulist").write_text(
+            ",".join(str(cpu) for cpu in node_cpus) + "\n"
+        )
+    (tmp_path / "possible").write_text("0-1\n")
+    return tmp_path
+
+
+def test_parse_cpulist():
+    assert parse_cpulist("0-3,8,10-11\n") == {0, 1, 2, 3, 8, 10, 11}
+    assert parse_cpulist("\n") == set()
+    with pytest.raises(ValueError, match="invalid literal"):
+        parse_cpulist("0-a")
+
+
+def test_numa_nodes(node_sysfs, tmp_path):
+    nodes = numa_nodes(node_sysfs)
+    assert set().union(*nodes.values()) == allowed_cpus()
+    assert numa_nodes(tmp_path / "missing") == {0: allowed_cpus()}
+
+
+def test_worker_cpusets():
+    nodes = {0: {0, 1}, 1: {2, 3}}
+    assert worker_cpusets(3, "node", nodes) == [{0, 1}, {2, 3}, {0, 1}]
+    assert worker_cpusets(5, "cpu", nodes) == [{0}, {2}, {1}, {3}, {0}]
+    with pytest.raises(ValueError, match="Unsupported placement"):
+        worker_cpusets(1, "socket", nodes)
+
+
+@needs_affinity
+def test_pinned_thread_pool():
+    cpusets = worker_cpusets(2)
+
+    def task():
+        return os.sched_getaffinity(0), local_session().id
+
+    with pinned_thread_pool(max_workers=2) as pool:
+        results = [pool.submit(task).result() for _ in range(8)]
+
+    for affinity, session_id in results:
+        assert affinity in cpusets
+        assert session_id > 0
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+from vaccel._c_types.arena import ScratchArena, scratch_arena
+from vaccel._libvaccel import ffi
+
+
+def test_arena_reuse():
+    arena = ScratchArena()
+    c_obj = arena.acquire("char", 16)
+    c_obj[0:5] = b"dirty"
+    arena.release(c_obj)
+
+    reused = arena.acquire("char", 16)
+    assert reused == c_obj
+    assert ffi.buffer(reused)[:] == bytes(16)
+    assert arena.stats()["hits"] == 1
+    assert arena.stats()["misses"] == 1
+
+
+def test_arena_borrow():
+    arena = ScratchArena()
+    with arena.borrow("uint8_t") as status:
+        assert ffi.typeof(status) == ffi.typeof("uint8_t[1]")
+        status[0] = 1
+    assert arena.stats()["cached_bytes"] == 1
+    with arena.borrow("uint8_t") as status:
+        assert status[0] == 0
+
+
+def test_arena_bounded():
+    arena = ScratchArena(max_cached_bytes=32, max_per_type=2)
+    items = [arena.acquire("char", 8) for _ in range(3)]
+    for item in items:
+        arena.release(item)
+    assert arena.stats()["cached_bytes"] == 16
+
+    arena.clear()
+    arena.release(arena.acquire("char", 64))
+    assert arena.stats()["cached_bytes"] == 0
+
+
+def test_arena_per_thread():
+    arenas = []
+    thread = threading.Thread(target=lambda: arenas.append(scratch_arena()))
+    thread.start()
+    thread.join()
+    assert scratch_arena() is scratch_arena()
+    assert arenas[0] is not scratch_arena()
@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import numpy as np
 import pytest
 
 from vaccel import Session
+from vaccel.ops.blas import sgemm_tiled
 
 
 @pytest.fixture
@@ -36,3 +38,134 @@ def test_sgemm_genop(test_data):
         beta=test_data["beta"],
         ldc=test_data["ldc"],
     )
+
+
+def test_sgemm_numpy(test_data):
+    rng = np.random.default_rng(0)
+    a = rng.random((12, 12), dtype=np.float32)
+    b = rng.random((12, 12), dtype=np.float32)
+    session = Session()
+
+    c = session.sgemm(12, 12, 12, 1.0, a, 12, b, 12, 0.0, 12)
+    assert isinstance(c, np.ndarray)
+    assert c.shape == (12, 12)
+    assert c.dtype == np.float32
+    assert c.flags.c_contiguous
+    assert c.base is None
+
+    out = np.ones((12, 12), dtype=np.float32)
+    res = session.sgemm(
+        12, 12, 12, 2.0, memoryview(a), 12, b.astype(np.float64), 12, 1.0, 12,
+        out=out,
+    )  # fmt: skip
+    assert res is out
+
+    c = session.sgemm(4, 6, 12, 1.0, a, 12, b, 12, 0.0, 8)
+    assert c.shape == (4, 6)
+    assert c.flags.c_contiguous
+
+    lists = session.sgemm(
+        m=test_data["m"],
+        n=test_data["n"],
+        k=test_data["k"],
+        alpha=1.0,
+        a=test_data["a"],
+        lda=test_data["lda"],
+        b=test_data["b"],
+        ldb=test_data["ldb"],
+        beta=0.0,
+        ldc=test_data["ldc"],
+    )
+    assert isinstance(lists, list)
+    assert len(lists) == 144
+
+
+def test_sgemm_invalid():
+    session = Session()
+    a = np.ones((4, 4), dtype=np.float32)
+    with pytest.raises(ValueError, match="at least 16"):
+        session.sgemm(4, 4, 4, 1.0, a[:2], 4, a, 4, 0.0, 4)
+    with pytest.raises(TypeError, match="writable"):
+        session.sgemm(
+            4, 4, 4, 1.0, a, 4, a, 4, 0.0, 4, out=memoryview(a).toreadonly()
+        )
+    with pytest.raises(TypeError, match="float"):
+        session.sgemm(
+            4, 4, 4, 1.0, a, 4, a, 4, 0.0, 4, out=np.zeros(16, np.float64)
+        )
+
+
+def test_sgemm_batched():
+    rng = np.random.default_rng(0)
+    a = rng.random((16, 4, 3), dtype=np.float32)
+    b = rng.random((16, 3, 5), dtype=np.float32)
+    session = Session()
+
+    c = session.sgemm_batched(a, b)
+    assert isinstance(c, np.ndarray)
+    assert c.shape == (16, 4, 5)
+    assert c.dtype == np.float32
+
+    out = np.ones((16, 4, 5), dtype=np.float32)
+    res = session.sgemm_batched(a, b[0].astype(np.float64), out, 2.0, 1.0)
+    assert res is out
+
+    with pytest.raises(ValueError, match="do not match"):
+        session.sgemm_batched(a, b[:8])
+    with pytest.raises(ValueError, match="do not match"):
+        session.sgemm_batched(a, b[:, :2])
+    with pytest.raises(ValueError, match="shape"):
+        session.sgemm_batched(a, b, out=np.zeros((16, 5, 4), np.float32))
+    with pytest.raises(TypeError, match="writable"):
+        session.sgemm_batched(a, b, out=memoryview(out).toreadonly())
+
+
+class NumpySession:
+    """Session stub whose `sgemm()` computes the result with NumPy."""
+
+    def sgemm(self, m, n, k, alpha, a, lda, b, ldb, beta, ldc, *, out):  # noqa: PLR0917
+        a = np.asarray(a).reshape(m, lda)[:, :k]
+        b = np.asarray(b).reshape(k, ldb)[:, :n]
+        c = np.asarray(out).reshape(m, ldc)[:, :n]
+        c[...] = alpha * (a @ b) + beta * c
+        return out
+
+
+def test_sgemm_tiled(tmp_path):
+    rng = np.random.default_rng(0)
+    a = rng.random((70, 45), dtype=np.float32)
+    b = rng.random((45, 33), dtype=np.float32)
+    np.save(tmp_path / "a.npy", a)
+    np.save(tmp_path / "b.npy", b)
+    sessions = [NumpySession(), NumpySession()]
+
+    c = sgemm_tiled(
+        sessions,
+        tmp_path / "a.npy",
+        tmp_path / "b.npy",
+        tmp_path / "c.npy",
+        tile_size=16,
+    )
+    assert isinstance(c, np.memmap)
+    np.testing.assert_allclose(c, a @ b, rtol=1e-5)
+    np.testing.assert_allclose(np.load(tmp_path / "c.npy"), a @ b, rtol=1e-5)
+
+    out = np.ones((70, 33), dtype=np.float32)
+    res = sgemm_tiled(
+        sessions[0], a, b, out, alpha=2.0, beta=0.5, tile_size=(32, 8, 20)
+    )
+    assert res is out
+    np.testing.assert_allclose(out, 2 * a @ b + 0.5, rtol=1e-5)
+
+    with pytest.raises(ValueError, match="do not match"):
+        sgemm_tiled(sessions, a, a)
+
+
+def test_sgemm_tiled_session(tmp_path):
+    a = np.ones((40, 20), dtype=np.float32)
+    b = np.ones((20, 30), dtype=np.float32)
+    c = sgemm_tiled(
+        [Session(), Session()], a, b, tmp_path / "c.npy", tile_size=16
+    )
+    assert c.shape == (40, 30)
+    assert np.load(tmp_path / "c.npy").shape == (40, 30)
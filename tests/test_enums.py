@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from build_ffi import ENUM_PREFIXES, enum_tables, generate_enums
+from vaccel._c_types.utils import ENUM_CONSTANTS, CEnumBuilder
+from vaccel._libvaccel import lib
+
+
+def test_enum_tables():
+    tables = enum_tables(lib, ENUM_PREFIXES)
+    assert list(tables) == list(ENUM_PREFIXES)
+    for prefix, members in tables.items():
+        assert members
+        for name, value in members.items():
+            assert getattr(lib, prefix + name) == value
+    for prefix, members in ENUM_CONSTANTS.items():
+        assert members == tables[prefix]
+
+    source = generate_enums(lib, ENUM_PREFIXES)
+    namespace = {}
+    exec(source, namespace)  # noqa: S102
+    assert namespace["ENUM_CONSTANTS"] == tables
+
+
+def test_enum_builder_fallback():
+    assert enum_tables(None, ENUM_PREFIXES) == {}
+
+    tables = enum_tables(lib, ENUM_PREFIXES)
+    builder = CEnumBuilder(lib, constants={})
+    for i, prefix in enumerate(ENUM_PREFIXES):
+        enum_cls = builder.from_prefix(f"Enum{i}", prefix)
+        members = {
+            name: member.value for name, member in enum_cls.__members__.items()
+        }
+        assert members == tables[prefix]
@@ -4,7 +4,8 @@ import random
 
 import pytest
 
-from vaccel import Resource, ResourceType, Session
+from vaccel import Arg, ArgType, Resource, ResourceType, Session
+from vaccel._c_types import CList
 
 
 @pytest.fixture
@@ -59,3 +60,28 @@ def test_exec_with_res_no_args(test_lib):
     lib.register(session)
     res = session.exec_with_resource(lib, test_lib["symbol"])
     assert res is None
+
+
+def test_arg_batch(test_args):
+    args = Arg.batch([(test_args["read"][0],), (b"data", ArgType.RAW)])
+    assert [arg.buf for arg in args] == [test_args["read"][0], b"data"]
+    assert all(arg.type == ArgType.RAW for arg in args)
+
+
+def test_arg_deferred(test_args):
+    args = [Arg(test_args["read"][0]), Arg(b"data")]
+    assert all(arg._c_obj_pending for arg in args)
+    CList(args)
+    assert not any(arg._c_obj_pending for arg in args)
+    assert [arg.buf for arg in args] == [test_args["read"][0], b"data"]
+
+
+def test_exec_with_arg_objects(test_lib, test_args):
+    session = Session()
+    res = session.exec(
+        test_lib["path"],
+        test_lib["symbol"],
+        [Arg(test_args["read"][0])],
+        test_args["write"],
+    )
+    assert res == test_args["read"]
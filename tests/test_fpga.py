@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import numpy as np
 import pytest
 
 from vaccel import Session
@@ -53,3 +54,54 @@ def test_fpga_vadd(test_data):
             test_data["float"]["a"], test_data["float"]["b"], strict=True
         )
     ]
+
+
+def test_fpga_numpy():
+    session = Session()
+    a = np.arange(10, dtype=np.float32)
+    b = np.full(10, 2, dtype=np.float32)
+
+    out = session.fpga_arraycopy(np.arange(10, dtype=np.int32))
+    assert isinstance(out, np.ndarray)
+    assert out.tolist() == list(range(10))
+
+    c = np.empty(10, dtype=np.float32)
+    assert session.fpga_vadd(a, memoryview(b), out=c) is c
+    np.testing.assert_array_equal(c, a + b)
+
+    add, mult = session.fpga_parallel(a, b)
+    np.testing.assert_array_equal(add, a + b)
+    assert mult.dtype == np.float32
+
+    assert session.fpga_mmult(a, b).shape == (10,)
+    with pytest.raises(ValueError, match="at least 10"):
+        session.fpga_mmult(a, b[:5])
+    with pytest.raises(TypeError, match="int"):
+        session.fpga_arraycopy(np.arange(10, dtype=np.int32), out=c)
+
+
+def test_fpga_stream(tmp_path):
+    session = Session()
+    a = np.arange(1000, dtype=np.float32)
+    b = np.ones(1000)
+
+    chunks = [c.copy() for c in session.fpga_vadd_stream(a, b, 300)]
+    assert [len(c) for c in chunks] == [300, 300, 300, 100]
+    np.testing.assert_array_equal(np.concatenate(chunks), a + 1)
+
+    a.tofile(tmp_path / "a.bin")
+    out = np.lib.format.open_memmap(
+        tmp_path / "out.npy", mode="w+", dtype=np.float32, shape=a.shape
+    )
+    b_chunks = (b[i : i + 300] for i in range(0, 1000, 300))
+    res = session.fpga_vadd_stream(tmp_path / "a.bin", b_chunks, 300, out=out)
+    assert res is out
+    np.testing.assert_array_equal(out, a + 1)
+    np.testing.assert_array_equal(
+        out, session.fpga_vadd(a, b.astype(np.float32))
+    )
+
+    with pytest.raises(ValueError, match="equal length"):
+        list(session.fpga_vadd_stream(a, [b], 300))
+    with pytest.raises(ValueError, match="at most 300"):
+        list(session.fpga_vadd_stream([a], [b], 300))
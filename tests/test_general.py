@@ -1,6 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
-from vaccel import PluginType, Session
+import subprocess
+import sys
+import threading
+
+from vaccel import PluginType, Session, local_session
+from vaccel.ops.image import ImageMixin
+from vaccel.ops.tf import TFMixin
 
 
 def test_session():
@@ -20,6 +26,50 @@ def test_session():
     assert ses_c.is_remote == 0
 
 
+def test_session_close():
+    session = Session()
+    assert not session.closed
+    session.close()
+    assert session.closed
+    session.close()
+
+    with Session() as session:
+        assert session.id > 0
+    assert session.closed
+
+
+def test_local_session():
+    session = local_session()
+    assert local_session() is session
+    assert local_session(flags=PluginType.DEBUG) is not session
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(local_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not session
+    assert sessions[0].closed
+    assert not session.closed
+
+
 def test_noop():
     session = Session(flags=0)
     session.noop()
+
+
+def test_session_ops():
+    session = Session()
+    assert isinstance(session, TFMixin)
+    assert isinstance(session, ImageMixin)
+    assert Session.classify is ImageMixin.classify
+    assert callable(session.classify_batch)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, vaccel; "
+        "vaccel.Session; "
+        "lazy = ('numpy', 'torch'); "
+        "sys.exit(any(m in sys.modules for m in lazy))"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from vaccel import Session
@@ -45,3 +46,38 @@ def test_image_depth(test_image):
     session = Session()
     res = session.depth(test_image)
     assert res == "This is a dummy imgname!"
+
+
+def test_image_batch(test_image):
+    session = Session()
+    res = session.classify_batch([test_image] * 8, workers=3)
+    assert (
+        res
+        == [("This is a dummy classification tag!", "This is a dummy imgname!")]
+        * 8
+    )
+    assert (
+        session.detect_batch([test_image] * 3, workers=1)
+        == ["This is a dummy imgname!"] * 3
+    )
+    assert session.depth_batch([]) == []
+    with pytest.raises(ValueError, match="workers"):
+        session.pose_batch([test_image], workers=0)
+
+
+def test_image_inputs(vaccel_paths, test_image):
+    session = Session()
+    image_path = vaccel_paths["images"] / "example.jpg"
+    expected = session.detect(test_image)
+    assert session.detect(image_path) == expected
+    assert session.segment(str(image_path)) == session.segment(test_image)
+    assert session.detect(memoryview(bytearray(test_image))) == expected
+    assert session.detect(np.frombuffer(test_image, dtype=np.uint8)) == expected
+    assert (
+        session.pose_batch([image_path, test_image])
+        == [session.pose(test_image)] * 2
+    )
+    with pytest.raises(TypeError, match="C-contiguous"):
+        session.detect(np.zeros(4, dtype=np.float32))
+    with pytest.raises(TypeError, match="int"):
+        session.detect(1)
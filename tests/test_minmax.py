@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from vaccel import Session
@@ -20,3 +21,63 @@ def test_min_max_genop(test_input):
     assert outdata == test_input[: len(outdata)]
     assert min_val == -1.0
     assert max_val == 10000.0
+
+
+def test_minmax_numpy():
+    data = np.linspace(-1.0, 1.0, 101)
+    session = Session()
+    outdata, min_val, max_val = session.minmax(data, len(data), 5, 100)
+    assert isinstance(outdata, np.ndarray)
+    assert outdata.shape == data.shape
+    np.testing.assert_array_equal(outdata, data)
+    assert (min_val, max_val) == (-1.0, 10000.0)
+
+    out = np.empty(101)
+    res, _, _ = session.minmax(memoryview(data), 101, 5, 100, out=out)
+    assert res is out
+    np.testing.assert_array_equal(out, data)
+    with pytest.raises(ValueError, match="at least 102"):
+        session.minmax(data, 102, 5, 100)
+    with pytest.raises(ValueError, match="at least 101"):
+        session.minmax(data, 101, 5, 100, out=np.empty(100))
+    with pytest.raises(TypeError, match="writable"):
+        session.minmax(data, 101, 5, 100, out=memoryview(out).toreadonly())
+
+
+def test_minmax_chunked(tmp_path):
+    data = np.random.default_rng(0).normal(size=10_000)
+    data.tofile(tmp_path / "dump.bin")
+    out = np.lib.format.open_memmap(
+        tmp_path / "out.npy", mode="w+", dtype=np.float64, shape=data.shape
+    )
+    session = Session()
+
+    res, min_val, max_val = session.minmax_chunked(
+        tmp_path / "dump.bin", 5, 100, chunk_size=1024, workers=4, out=out
+    )
+    assert res is out
+    np.testing.assert_array_equal(out, data)
+    assert (min_val, max_val) == (-1.0, 10000.0)
+
+    res, _, _ = session.minmax_chunked(data, 5, 100, chunk_size=999)
+    assert res is None
+    with pytest.raises(ValueError, match="float64"):
+        session.minmax_chunked(data.astype(np.float32), 5, 100)
+    with pytest.raises(ValueError, match="at least 10000"):
+        session.minmax_chunked(data, 5, 100, out=np.empty(10))
+
+
+def test_minmax_chunked_reduction(monkeypatch):
+    def minmax(self, indata, ndata, low_threshold, high_threshold, *, out):
+        _ = (self, low_threshold, high_threshold)
+        out[:ndata] = indata[:ndata]
+        return (out, float(indata.min()), float(indata.max()))
+
+    monkeypatch.setattr(Session, "minmax", minmax)
+    data = np.random.default_rng(0).normal(size=10_000)
+    session = Session()
+    for workers in (1, 4):
+        _, min_val, max_val = session.minmax_chunked(
+            data, 5, 100, chunk_size=999, workers=workers
+        )
+        assert (min_val, max_val) == (data.min(), data.max())
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import numpy as np
+import pytest
+
+from vaccel import Session
+from vaccel.pipeline import ImagePipeline
+
+
+@pytest.fixture
+def image_dir(tmp_path, vaccel_paths):
+    image = (vaccel_paths["images"] / "example.jpg").read_bytes()
+    for i in range(5):
+        (tmp_path / f"img{i}.jpg").write_bytes(image)
+    return tmp_path
+
+
+def test_pipeline(image_dir):
+    expected = Session().classify(image_dir / "img0.jpg")
+    pipeline = ImagePipeline(image_dir, workers=3, readers=2, queue_size=2)
+    results = list(pipeline)
+    assert [path.name for path, _ in results] == [
+        f"img{i}.jpg" for i in range(5)
+    ]
+    assert all(result == expected for _, result in results)
+    assert pipeline.stats()["images"] == 5
+
+    frames = [np.fromfile(image_dir / "img0.jpg", dtype=np.uint8)] * 3
+    pipeline = ImagePipeline(frames, "detect", workers=2)
+    assert [key for key, _ in pipeline] == [0, 1, 2]
+
+
+def test_pipeline_run(image_dir, tmp_path_factory):
+    out = tmp_path_factory.mktemp("out") / "results.jsonl"
+    stats = ImagePipeline(str(image_dir / "*.jpg"), "depth").run(out)
+    assert stats["images"] == 5
+    assert stats["bytes"] == 5 * (image_dir / "img0.jpg").stat().st_size
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert lines[0]["source"] == str(image_dir / "img0.jpg")
+    assert len(lines) == 5
+
+    with pytest.raises(ValueError, match="Unsupported operation"):
+        ImagePipeline(image_dir, "sgemm")
+    with pytest.raises(ValueError, match="workers"):
+        ImagePipeline(image_dir, workers=0)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import gc
+
+import numpy as np
+import pytest
+
+from vaccel import Resource
+from vaccel.ops.tf import Tensor, TensorType
+from vaccel.pool import BufferPool
+
+
+def test_pool_reuse():
+    pool = BufferPool(alignment=128)
+    array = pool.empty((4, 8), np.float32)
+    assert array.shape == (4, 8)
+    assert array.dtype == np.float32
+    assert array.ctypes.data % 128 == 0
+    addr = array.ctypes.data
+    del array
+    gc.collect()
+
+    assert pool.empty((4, 8), np.float32).ctypes.data == addr
+    assert pool.stats()["hits"] == 1
+    pool.empty((8, 4), np.float32)
+    assert pool.stats()["misses"] == 2
+
+
+def test_pool_views_keep_buffer():
+    pool = BufferPool()
+    view = pool.empty(16, np.int32)[::2]
+    gc.collect()
+    assert pool.stats()["cached_bytes"] == 0
+    del view
+    gc.collect()
+    assert pool.stats()["cached_bytes"] == 64
+
+
+def test_pool_bounded():
+    pool = BufferPool(max_cached_bytes=128, max_per_key=2)
+    arrays = [pool.empty(64, np.uint8) for _ in range(3)]
+    del arrays
+    gc.collect()
+    assert pool.stats()["cached_bytes"] == 128
+
+    pool.clear()
+    assert pool.stats()["cached_bytes"] == 0
+    with pytest.raises(ValueError):  # noqa: PT011
+        BufferPool(alignment=48)
+
+
+def test_pool_aligned():
+    pool = BufferPool()
+    aligned = pool.empty(8, np.float64)
+    assert pool.aligned(aligned) is aligned
+
+    data = np.arange(16, dtype=np.float64)[::2]
+    copy = pool.aligned(data)
+    assert copy.ctypes.data % pool.alignment == 0
+    np.testing.assert_array_equal(copy, data)
+    with pytest.raises(ValueError):  # noqa: PT011
+        pool.aligned(data, allow_copy=False)
+
+    buf = pool.aligned(memoryview(bytearray(b"x" * 65))[1:])
+    assert isinstance(buf, memoryview)
+    assert bytes(buf) == b"x" * 64
+    assert pool.buffer(32).nbytes == 32
+
+
+def test_tensor_pool():
+    pool = BufferPool()
+    data = np.arange(32, dtype=np.float32).reshape(4, 8)[:, ::2]
+    tensor = Tensor.from_numpy(data, pool=pool)
+    np.testing.assert_array_equal(tensor.as_numpy(), data)
+    assert tensor._data.ctypes.data % pool.alignment == 0
+    tensor.close()
+    gc.collect()
+    assert pool.stats()["cached_bytes"] == data.nbytes
+
+    pooled = pool.empty(data.shape, data.dtype)
+    tensor = Tensor.from_numpy(pooled, pool=pool)
+    assert tensor._data is pooled
+    tensor.close()
+
+    raw = bytearray(17)
+    tensor = Tensor.from_buffer(
+        [4], TensorType.FLOAT, memoryview(raw)[1:], pool=pool
+    )
+    assert tensor.data == [0.0] * 4
+
+
+def test_resource_pool():
+    pool = BufferPool()
+    data = np.arange(64, dtype=np.uint8)[::2]
+    with Resource.from_numpy(data, pool=pool) as resource:
+        assert resource._data.ctypes.data % pool.alignment == 0
+    gc.collect()
+    assert pool.stats()["cached_bytes"] == data.nbytes
@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import pickle
+import threading
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from vaccel import Resource, ResourceType, Session
+from vaccel import Resource, ResourceType, Session, local_session
 from vaccel._c_types import CBytes
 
 
@@ -57,6 +59,33 @@ def test_resource_from_numpy(test_buffer):
     )
 
 
+def test_resource_from_numpy_strided(test_buffer):
+    data_np = np.repeat(test_buffer["data_np"], 2)[::2]
+    res = Resource.from_numpy(data_np)
+    res_data = res.value.blobs[0].data
+    res_size = res.value.blobs[0].size
+    assert res._c_data.is_copy
+    assert (
+        CBytes.from_c_obj(res_data, res_size).value == test_buffer["data_bytes"]
+    )
+
+
+def test_resource_pickle(test_lib, test_buffer):
+    res = Resource.from_numpy(test_buffer["data_np"])
+    buffers = []
+    data = pickle.dumps(res, protocol=5, buffer_callback=buffers.append)
+    restored = pickle.loads(data, buffers=buffers)
+    res_data = restored.value.blobs[0].data
+    res_size = restored.value.blobs[0].size
+    assert restored.id > res.id
+    assert (
+        CBytes.from_c_obj(res_data, res_size).value == test_buffer["data_bytes"]
+    )
+
+    restored = pickle.loads(pickle.dumps(Resource(test_lib, ResourceType.LIB)))
+    assert restored.value.type == ResourceType.LIB
+
+
 def test_resource_register(test_lib):
     res = Resource(test_lib, ResourceType.LIB)
     ses = Session()
@@ -101,3 +130,64 @@ def test_resource_register_unregister_multi(test_lib, test_buffer):
     assert not ses_b.has_resource(res_a)
     res_b.unregister(ses_b)
     assert not ses_b.has_resource(res_b)
+
+
+def test_session_clone(test_lib):
+    session = Session()
+    res = Resource(test_lib, ResourceType.LIB)
+    res.register(session)
+    assert session.resources == [res]
+
+    with session.clone() as clone:
+        assert clone is not session
+        assert clone.flags == session.flags
+        assert clone.has_resource(res)
+        with session.clone() as other:
+            assert other is not clone
+    assert not clone.closed
+
+    res.unregister(session)
+    assert session.resources == []
+    with session.clone() as reused:
+        assert reused in (clone, other)
+        assert not reused.has_resource(res)
+        assert reused.resources == []
+
+    session.close()
+    assert clone.closed
+    assert other.closed
+
+
+def test_session_resources_close(test_lib):
+    session = Session()
+    res = Resource(test_lib, ResourceType.LIB)
+    res.register(session)
+    res.close()
+    assert session.resources == []
+    with session.clone() as clone:
+        assert clone.resources == []
+
+    res = Resource(test_lib, ResourceType.LIB)
+    res.register(session)
+    session.close()
+    assert session.resources == []
+    assert not res._sessions
+
+
+def test_resource_local_session(test_lib):
+    res = Resource(test_lib, ResourceType.LIB)
+
+    def worker(results):
+        ses = local_session(resources=[res])
+        assert local_session(resources=[res]) is ses
+        results.append(ses.has_resource(res))
+
+    results = []
+    threads = [
+        threading.Thread(target=worker, args=(results,)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 4
@@ -1,10 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import gc
+import pickle
+import struct
+import sys
+import zlib
+
 import numpy as np
 import pytest
 
 from vaccel import Resource, ResourceType, Session
-from vaccel.ops.tf import Buffer, Node, Tensor, TensorType
+from vaccel._c_types.types import materialize
+from vaccel.ops.tf import Buffer, Node, Tensor, TensorType, TFModelRunner
+from vaccel.pool import BufferPool
 
 
 @pytest.fixture(scope="module")
@@ -76,6 +84,115 @@ def test_tensor_from_numpy(test_tensor):
     assert tensor.as_numpy().all() == test_tensor["data_np"].all()
 
 
+def test_tensor_buffer_protocol(test_tensor):
+    tensor = Tensor(
+        test_tensor["dims"], test_tensor["type"], test_tensor["data"]
+    )
+    arr = np.asarray(tensor)
+    assert arr.dtype == test_tensor["data_np"].dtype
+    assert arr.shape == tuple(test_tensor["dims"])
+    assert np.array_equal(arr, test_tensor["data_np"])
+
+    view = tensor.__buffer__(0)
+    assert view.format == "f"
+    assert view.tolist() == test_tensor["data"]
+    assert struct.unpack_from("f", view.cast("B"))[0] == test_tensor["data"][0]
+    assert zlib.crc32(view) == zlib.crc32(test_tensor["data_bytes"])
+    if sys.version_info >= (3, 12):
+        assert memoryview(tensor).tolist() == test_tensor["data"]
+
+
+def test_buffer_buffer_protocol():
+    buf = Buffer(b"none")
+    assert buf.data == b"none"
+    assert np.asarray(buf).tobytes() == b"none"
+    assert buf.__buffer__(0) == b"none"
+
+
+def test_tensor_dlpack(test_tensor):
+    tensor = Tensor.from_dlpack(test_tensor["data_np"])
+    assert tensor.dims == test_tensor["dims"]
+    assert tensor.data_type == test_tensor["type"]
+    assert tensor.__dlpack_device__() == (1, 0)
+    assert np.shares_memory(tensor.as_numpy(), test_tensor["data_np"])
+
+    exported = np.from_dlpack(tensor)
+    assert np.array_equal(exported, test_tensor["data_np"])
+
+
+def test_tensor_from_numpy_view(test_tensor):
+    batch = np.stack([test_tensor["data_np"]] * 4)
+    tensor = Tensor.from_numpy(batch[1:3])
+    assert tensor.dims == [2, *test_tensor["dims"]]
+    assert not tensor._c_data.is_copy
+    assert np.shares_memory(tensor.as_numpy(), batch)
+
+
+def test_tensor_from_numpy_strided(test_tensor):
+    batch = np.stack([test_tensor["data_np"]] * 4)
+    tensor = Tensor.from_numpy(batch.T)
+    assert tensor.dims == [*test_tensor["dims"], 4]
+    assert tensor._c_data.is_copy
+    assert tensor._c_data.copied_nbytes == batch.nbytes
+    assert tensor._c_data.order == "C"
+    assert tensor._c_data.strides == (16, 4)
+    assert np.array_equal(tensor.as_numpy(), batch.T)
+    with pytest.raises(ValueError, match="not C-contiguous"):
+        Tensor.from_numpy(batch.T, allow_copy=False)
+
+
+def test_tensor_close_with_view():
+    pool = BufferPool()
+    data = np.arange(120, dtype=np.float32).reshape(4, 30).T
+    tensor = Tensor.from_numpy(data, pool=pool)
+    addr = tensor.as_numpy().ctypes.data
+    view = tensor.__buffer__(0)
+    tensor.close()
+    assert tensor.closed
+
+    other = pool.empty(data.shape, data.dtype)
+    other.fill(-1)
+    assert other.ctypes.data != addr
+    assert np.array_equal(np.asarray(view), data)
+
+    del view
+    gc.collect()
+    assert pool.empty(data.shape, data.dtype).ctypes.data == addr
+
+
+def test_tensor_pickle(test_tensor):
+    tensor = Tensor.from_numpy(test_tensor["data_np"].reshape(5, 6))
+    buffers = []
+    data = pickle.dumps(tensor, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < len(test_tensor["data_bytes"])
+
+    restored = pickle.loads(data, buffers=buffers)
+    assert restored.dims == [5, 6]
+    assert restored.data_type == test_tensor["type"]
+    assert np.shares_memory(restored.as_numpy(), test_tensor["data_np"])
+
+    restored = pickle.loads(pickle.dumps(tensor, protocol=4))
+    assert restored.to_bytes() == test_tensor["data_bytes"]
+
+
+def test_tensor_shared_memory(test_tensor):
+    tensor = Tensor.from_numpy(test_tensor["data_np"])
+    shm = tensor.to_shared_memory()
+    try:
+        shared = Tensor.from_shared_memory(
+            shm.name, test_tensor["dims"], test_tensor["type"]
+        )
+        assert shared.data == test_tensor["data"]
+        shm.buf[:4] = struct.pack("f", 2.0)
+        assert shared.as_numpy()[0] == 2.0
+        with pytest.raises(ValueError, match="too small"):
+            Tensor.from_shared_memory(shm.name, [64], np.float32)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def test_tf(test_nodes, test_tensor, test_model):
     session = Session()
 
@@ -103,6 +220,46 @@ def test_tf(test_nodes, test_tensor, test_model):
     session.tf_model_unload(model)
 
 
+def test_tf_model_runner(test_nodes, test_tensor, test_model):
+    session = Session()
+
+    model = Resource(test_model, ResourceType.MODEL)
+    model.register(session)
+
+    session.tf_model_load(model)
+
+    in_name = test_nodes["in"]["name"]
+    runner = TFModelRunner(
+        session,
+        model,
+        [in_name],
+        [(test_nodes["out"]["name"], test_nodes["out"]["id"])],
+        run_options=Buffer(b"none"),
+    )
+    statuses = []
+    for _ in range(3):
+        (out_tensors, status) = runner({in_name: test_tensor["data_np"]})
+        assert status.message == "Operation handled by noop plugin"
+        assert status is not runner.status
+        statuses.append(status)
+        assert out_tensors[0].dims == test_tensor["dims"]
+        assert out_tensors[0].to_bytes() == test_tensor["data_bytes"]
+
+    assert len({id(status) for status in statuses}) == 3
+    assert all(status.code == runner.status.code for status in statuses)
+
+    tensor = Tensor.from_numpy(test_tensor["data_np"])
+    (out_tensors, _) = runner({in_name: tensor})
+    assert out_tensors[0].data == test_tensor["data"]
+
+    with pytest.raises(ValueError, match="Missing"):
+        runner({})
+    with pytest.raises(ValueError, match="Unknown"):
+        runner({in_name: tensor, "input_2": tensor})
+
+    session.tf_model_unload(model)
+
+
 def test_tf_with_run_options(test_nodes, test_tensor, test_model):
     session = Session()
 
@@ -184,3 +341,35 @@ def test_tf_from_numpy(test_nodes, test_tensor, test_model):
     assert out_tensors[0].to_bytes() == in_tensors[0].to_bytes()
 
     session.tf_model_unload(model)
+
+
+def test_tensor_batch(test_tensor):
+    tensors = Tensor.batch(
+        [
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data"]),
+            (
+                test_tensor["dims"],
+                test_tensor["type"],
+                test_tensor["data_bytes"],
+            ),
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data_np"]),
+        ]
+    )
+    assert len(tensors) == 3
+    for tensor in tensors:
+        assert tensor.dims == test_tensor["dims"]
+        assert tensor.data_type == test_tensor["type"]
+        assert tensor.to_bytes() == test_tensor["data_bytes"]
+    assert Tensor.batch([]) == []
+
+
+def test_tensor_deferred(test_tensor):
+    tensors = [
+        Tensor(test_tensor["dims"], test_tensor["type"], test_tensor["data"]),
+        Tensor.from_numpy(test_tensor["data_np"]),
+    ]
+    assert all(tensor._c_obj_pending for tensor in tensors)
+    materialize(tensors)
+    for tensor in tensors:
+        assert not tensor._c_obj_pending
+        assert tensor.to_bytes() == test_tensor["data_bytes"]
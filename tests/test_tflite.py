@@ -62,6 +62,17 @@ def test_tensor_from_numpy(test_tensor):
     assert tensor.as_numpy().all() == test_tensor["data_np"].all()
 
 
+def test_tensor_dlpack(test_tensor):
+    tensor = Tensor.from_dlpack(test_tensor["data_np"])
+    assert tensor.dims == test_tensor["dims"]
+    assert tensor.data_type == test_tensor["type"]
+    assert tensor.__dlpack_device__() == (1, 0)
+    assert np.shares_memory(tensor.as_numpy(), test_tensor["data_np"])
+
+    exported = np.from_dlpack(tensor)
+    assert np.array_equal(exported, test_tensor["data_np"])
+
+
 def test_tflite(test_tensor, test_model):
     session = Session()
 
@@ -126,3 +137,23 @@ def test_tflite_from_numpy(test_tensor, test_model):
     assert out_tensors[0].to_bytes() == in_tensors[0].to_bytes()
 
     session.tflite_model_unload(model)
+
+
+def test_tensor_batch(test_tensor):
+    tensors = Tensor.batch(
+        [
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data"]),
+            (
+                test_tensor["dims"],
+                test_tensor["type"],
+                test_tensor["data_bytes"],
+            ),
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data_np"]),
+        ]
+    )
+    assert len(tensors) == 3
+    for tensor in tensors:
+        assert tensor.dims == test_tensor["dims"]
+        assert tensor.data_type == test_tensor["type"]
+        assert tensor.to_bytes() == test_tensor["data_bytes"]
+    assert Tensor.batch([]) == []
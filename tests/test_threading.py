@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from vaccel import Arg, Session
+from vaccel._c_types import CList, CStr
+from vaccel._c_types.types import materialize
+from vaccel._c_types.utils import CEnumBuilder
+from vaccel._libvaccel import ffi, lib
+
+NR_THREADS = 8
+
+
+def run_concurrently(func, nr_threads=NR_THREADS):
+    barrier = threading.Barrier(nr_threads)
+
+    def task(idx):
+        barrier.wait()
+        return func(idx)
+
+    with ThreadPoolExecutor(max_workers=nr_threads) as executor:
+        return list(executor.map(task, range(nr_threads)))
+
+
+def c_addr(c_obj):
+    return int(ffi.cast("uintptr_t", c_obj))
+
+
+def test_enum_builder_threads():
+    builder = CEnumBuilder(lib, {"TEST_": {"A": 0, "B": 1}})
+    enums = run_concurrently(lambda _: builder.from_prefix("TestEnum", "TEST_"))
+    assert all(enum is enums[0] for enum in enums)
+
+
+def test_materialize_threads():
+    args = [Arg(bytes([i]) * 8) for i in range(64)]
+
+    def access(idx):
+        if idx % 2:
+            materialize(args)
+        return [c_addr(arg._c_ptr) for arg in args]
+
+    addrs = run_concurrently(access)
+    assert all(a == addrs[0] for a in addrs)
+    assert all(not arg._c_obj_pending for arg in args)
+    assert [arg.buf for arg in args] == [bytes([i]) * 8 for i in range(64)]
+
+
+def test_clist_mutation_threads():
+    c_list = CList(["item"])
+
+    def append(idx):
+        for i in range(50):
+            c_list.append(f"{idx}-{i}")
+
+    run_concurrently(append)
+    assert len(c_list) == 1 + NR_THREADS * 50
+    assert [ffi.string(c_str).decode() for c_str in c_list.value] == [
+        item.value for item in c_list
+    ]
+
+
+def test_cstr_update_threads():
+    c_str = CStr("initial")
+    run_concurrently(lambda idx: c_str.update(f"value-{idx}"))
+    assert c_str.as_str() == c_str._value
+
+
+def test_sessions_threads():
+    def worker(_):
+        with Session() as session:
+            for i in range(100):
+                args = [Arg(i.to_bytes(4, "little")), Arg(b"data")]
+                c_args = CList(args)
+                assert len(c_args) == 2
+                session.noop()
+            return session.id
+
+    ids = run_concurrently(worker)
+    assert len(set(ids)) == NR_THREADS
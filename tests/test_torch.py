@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import gc
+
 import numpy as np
 import pytest
 
@@ -80,6 +82,19 @@ def test_tensor_from_numpy(test_tensor):
         assert torch.equal(tensor.as_torch(), test_tensor["data_torch"])
 
 
+def test_tensor_dlpack(test_tensor):
+    tensor = Tensor.from_dlpack(test_tensor["data_np"])
+    assert tensor.dims == test_tensor["dims"]
+    assert tensor.data_type == test_tensor["type"]
+    assert tensor.__dlpack_device__() == (1, 0)
+    assert np.shares_memory(tensor.as_numpy(), test_tensor["data_np"])
+
+    exported = np.from_dlpack(tensor)
+    assert np.array_equal(exported, test_tensor["data_np"])
+    if HAS_TORCH:
+        assert torch.equal(torch.from_dlpack(tensor), test_tensor["data_torch"])
+
+
 @pytest.mark.skipif(not HAS_TORCH, reason="Torch not installed")
 def test_tensor_from_torch(test_tensor):
     tensor = Tensor.from_torch(test_tensor["data_torch"])
@@ -185,6 +200,33 @@ def test_torch_from_numpy(test_tensor, test_model):
         assert torch.equal(out_tensors[0].as_torch(), in_tensors[0].as_torch())
 
 
+def test_torch_output_view_lifetime(test_tensor, test_model):
+    session = Session()
+
+    model = Resource(test_model, ResourceType.MODEL)
+    model.register(session)
+
+    session.torch_model_load(model)
+
+    in_tensors = [Tensor.from_numpy(test_tensor["data_np"])]
+
+    out_tensors = session.torch_model_run(model, in_tensors)
+    out_np = out_tensors[0].as_numpy()
+    out_bytes = out_tensors[0].as_memoryview()
+    if HAS_TORCH:
+        out_torch = out_tensors[0].as_torch()
+
+    out_tensors[0].close()
+    assert out_tensors[0].closed
+    del out_tensors
+    gc.collect()
+
+    assert np.array_equal(out_np, test_tensor["data_np"])
+    assert out_bytes == test_tensor["data_bytes"]
+    if HAS_TORCH:
+        assert torch.equal(out_torch, test_tensor["data_torch"])
+
+
 @pytest.mark.skipif(not HAS_TORCH, reason="Torch not installed")
 def test_torch_from_torch(test_tensor, test_model):
     session = Session()
@@ -203,3 +245,36 @@ def test_torch_from_torch(test_tensor, test_model):
     assert out_tensors[0].to_bytes() == in_tensors[0].to_bytes()
     assert out_tensors[0].as_numpy().all() == in_tensors[0].as_numpy().all()
     assert torch.equal(out_tensors[0].as_torch(), in_tensors[0].as_torch())
+
+
+def test_tensor_batch(test_tensor):
+    tensors = Tensor.batch(
+        [
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data"]),
+            (
+                test_tensor["dims"],
+                test_tensor["type"],
+                test_tensor["data_bytes"],
+            ),
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data_np"]),
+        ]
+    )
+    assert len(tensors) == 3
+    for tensor in tensors:
+        assert tensor.dims == test_tensor["dims"]
+        assert tensor.data_type == test_tensor["type"]
+        assert tensor.to_bytes() == test_tensor["data_bytes"]
+    assert Tensor.batch([]) == []
+
+
+def test_tensor_batch_empty(test_tensor):
+    tensors = Tensor.batch(
+        [
+            ([0], test_tensor["type"], b""),
+            (test_tensor["dims"], test_tensor["type"], test_tensor["data_np"]),
+        ]
+    )
+    assert tensors[0].dims == [0]
+    assert tensors[0]._c_ptr.size == 0
+    assert tensors[0].to_bytes() == b""
+    assert tensors[1].to_bytes() == test_tensor["data_bytes"]
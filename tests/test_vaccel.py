@@ -1,7 +1,33 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import gc
+
+import numpy as np
+
 import vaccel
-from vaccel import Config
+from vaccel import Arg, Config, Session
+from vaccel._c_types import OwnedCType
+from vaccel._c_types.utils import owned_buffer
+from vaccel._libvaccel import ffi
+
+deleted = []
+
+
+class OwnedBytes(OwnedCType):
+    def _init_c_obj(self):
+        self._c_obj = ffi.new("char[]", b"data")
+        self._c_size = ffi.sizeof(self._c_obj)
+
+    @staticmethod
+    def _del_c_obj(c_obj) -> None:
+        deleted.append(ffi.buffer(c_obj)[:])
+
+    def _release_data(self):
+        deleted.append(None)
+
+    @property
+    def value(self):
+        return owned_buffer(self._c_ptr_or_raise, self._c_size, self)
 
 
 def test_bootstrap_default():
@@ -26,3 +52,35 @@ def test_bootstrap_with_config_and_cleanup():
     config = Config()
     vaccel.bootstrap(config)
     vaccel.cleanup()
+
+
+def test_release():
+    session = Session()
+    args = [Arg(b"data"), Arg(b"more data")]
+    vaccel.release(session, *args)
+    assert session.closed
+    assert all(arg.closed for arg in args)
+    vaccel.release(session, *args)
+
+
+def test_release_with_views():
+    deleted.clear()
+    obj = OwnedBytes()
+    view = memoryview(obj.value)
+    array = np.frombuffer(obj.value, dtype=np.uint8)
+    vaccel.release(obj)
+    assert obj.closed
+    assert not deleted
+
+    del view
+    gc.collect()
+    assert not deleted
+    assert array.tobytes() == b"data\0"
+
+    del array
+    gc.collect()
+    assert deleted == [b"data\0", None]
+
+    with OwnedBytes() as obj:
+        pass
+    assert deleted == [b"data\0", None] * 2
@@ -8,8 +8,8 @@ from .config import Config
 from .op import OpType
 from .plugin import PluginType
 from .resource import Resource, ResourceType
-from .session import Session
-from .vaccel import bootstrap, cleanup
+from .session import Session, local_session
+from .vaccel import bootstrap, cleanup, release
 
 __all__ = [
     "Arg",
@@ -23,4 +23,6 @@ __all__ = [
     "__version__",
     "bootstrap",
     "cleanup",
+    "local_session",
+    "release",
 ]
@@ -2,7 +2,7 @@
 
 """Common interfaces for C types and Python type wrappers."""
 
-from .types import CAny, CType
+from .types import CAny, CType, OwnedCType
 from .wrappers.cbytes import CBytes
 from .wrappers.cfloat import CFloat
 from .wrappers.cint import CInt
@@ -19,4 +19,5 @@ __all__ = [
     "CNumpyArray",
     "CStr",
     "CType",
+    "OwnedCType",
 ]
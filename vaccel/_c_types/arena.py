@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-thread recycling of temporary C allocations."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Final
+
+from vaccel._libvaccel import ffi
+
+DEFAULT_MAX_CACHED_BYTES: Final[int] = 1024 * 1024
+DEFAULT_MAX_PER_TYPE: Final[int] = 16
+
+_ZEROS: Final[bytes] = bytes(4096)
+
+
+class ScratchArena:
+    """Bounded free-list of zero-initialized C arrays, keyed by array type.
+
+    Op wrappers borrow their temporary C allocations (output handles, status
+    codes, string buffers, output pointer arrays) from the arena of the calling
+    thread instead of allocating new ones on every call. Borrowed arrays must
+    not be referenced after they are returned.
+
+    Arenas are not thread-safe; use `scratch_arena()` to get the arena of the
+    current thread.
+
+    Attributes:
+        max_cached_bytes (int): The maximum number of bytes kept in the
+            free-list.
+        max_per_type (int): The maximum number of arrays of the same type kept
+            in the free-list.
+        hits (int): The number of allocations served from the free-list.
+        misses (int): The number of allocations that required a new array.
+    """
+
+    def __init__(
+        self,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES,
+        max_per_type: int = DEFAULT_MAX_PER_TYPE,
+    ):
+        """Initializes a new `ScratchArena` object.
+
+        Args:
+            max_cached_bytes: The maximum number of bytes to keep cached for
+                reuse.
+            max_per_type: The maximum number of arrays of the same type to keep
+                cached for reuse.
+        """
+        self.max_cached_bytes = max_cached_bytes
+        self.max_per_type = max_per_type
+        self.hits = 0
+        self.misses = 0
+        self._types = {}
+        self._free = {}
+        self._cached_bytes = 0
+
+    def acquire(self, c_type: str, length: int = 1) -> ffi.CData:
+        """Borrows a zero-initialized C array.
+
+        Args:
+            c_type: The C type of the array items (e.g. "char",
+                "struct vaccel_tf_tensor *").
+            length: The number of items of the array. Defaults to 1.
+
+        Returns:
+            A `c_type[length]` C array, which is also usable as a `c_type *`.
+        """
+        key = (c_type, length)
+        ctype = self._types.get(key)
+        if ctype is None:
+            ctype = self._types[key] = ffi.typeof(f"{c_type}[{length}]")
+
+        bucket = self._free.get(ctype)
+        if not bucket:
+            self.misses += 1
+            return ffi.new(ctype)
+
+        c_obj = bucket.pop()
+        size = ffi.sizeof(c_obj)
+        self._cached_bytes -= size
+        self.hits += 1
+        ffi.memmove(c_obj, _ZEROS if size <= len(_ZEROS) else bytes(size), size)
+        return c_obj
+
+    def release(self, c_obj: ffi.CData) -> None:
+        """Returns a borrowed C array to the arena.
+
+        The array is dropped if the arena is full.
+
+        Args:
+            c_obj: A C array returned by `acquire()`.
+        """
+        size = ffi.sizeof(c_obj)
+        if self._cached_bytes + size > self.max_cached_bytes:
+            return
+        bucket = self._free.setdefault(ffi.typeof(c_obj), [])
+        if len(bucket) >= self.max_per_type:
+            return
+        bucket.append(c_obj)
+        self._cached_bytes += size
+
+    @contextmanager
+    def borrow(self, c_type: str, length: int = 1) -> Iterator[ffi.CData]:
+        """Borrows a zero-initialized C array for the duration of a block.
+
+        Args:
+            c_type: The C type of the array items.
+            length: The number of items of the array. Defaults to 1.
+
+        Yields:
+            A `c_type[length]` C array.
+        """
+        c_obj = self.acquire(c_type, length)
+        try:
+            yield c_obj
+        finally:
+            self.release(c_obj)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the arena allocation and cache statistics.
+
+        Returns:
+            A dict with the number of `hits`, `misses` and the currently
+            `cached_bytes`.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_bytes": self._cached_bytes,
+        }
+
+    def clear(self) -> None:
+        """Drops all cached arrays."""
+        self._free.clear()
+        self._cached_bytes = 0
+
+
+class _ThreadArena(threading.local):
+    def __init__(self):
+        self.arena = ScratchArena()
+
+
+_thread_arena = _ThreadArena()
+
+
+def scratch_arena() -> ScratchArena:
+    """Returns the scratch arena of the current thread.
+
+    Returns:
+        The `ScratchArena` object of the calling thread. It is created on first
+        use and released when the thread exits.
+    """
+    return _thread_arena.arena
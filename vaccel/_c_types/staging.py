@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Aligned staging buffers for data that must be copied before use."""
+
+import logging
+import threading
+import weakref
+from typing import Final
+
+from vaccel._lazy import LazyModule, is_available
+
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALIGNMENT: Final[int] = 64
+DEFAULT_MAX_CACHED_BYTES: Final[int] = 64 * 1024 * 1024
+
+
+def aligned_empty(
+    nbytes: int, alignment: int = DEFAULT_ALIGNMENT
+) -> "np.ndarray":
+    """Allocates an uninitialized byte array with an aligned data pointer.
+
+    Args:
+        nbytes: The size of the array in bytes.
+        alignment: The required alignment of the data pointer in bytes. Must be
+            a power of two.
+
+    Returns:
+        A `uint8` NumPy array of `nbytes` elements.
+
+    Raises:
+        NotImplementedError: If NumPy is not installed.
+        ValueError: If `alignment` is not a power of two.
+    """
+    if not HAS_NUMPY:
+        msg = "NumPy is not available"
+        raise NotImplementedError(msg)
+
+    if alignment <= 0 or alignment & (alignment - 1):
+        msg = f"Alignment must be a power of two, got {alignment}"
+        raise ValueError(msg)
+
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset : offset + nbytes]
+
+
+class _Lease:
+    """Owner of a buffer checked out from a `StagingPool`.
+
+    Arrays created from a lease keep it alive through their `base`, so the
+    buffer is only handed back to the pool once no view of it remains.
+
+    Attributes:
+        buffer (np.ndarray): The leased buffer.
+    """
+
+    __slots__ = ("__weakref__", "buffer")
+
+    def __init__(self, buffer: "np.ndarray"):
+        self.buffer = buffer
+
+    @property
+    def __array_interface__(self) -> dict:
+        return self.buffer.__array_interface__
+
+
+class StagingPool:
+    """Bounded free-list of aligned staging buffers.
+
+    Buffers are bucketed by power-of-two capacity and recycled once every array
+    created from them has been garbage collected.
+
+    Attributes:
+        alignment (int): The alignment of the handed out buffers in bytes.
+        max_cached_bytes (int): The maximum number of bytes kept in the
+            free-list.
+        copies (int): The number of copies performed through the pool.
+        copied_bytes (int): The number of bytes copied through the pool.
+    """
+
+    def __init__(
+        self,
+        alignment: int = DEFAULT_ALIGNMENT,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES,
+    ):
+        """Initializes a new `StagingPool` object.
+
+        Args:
+            alignment: The alignment of the handed out buffers in bytes.
+            max_cached_bytes: The maximum number of bytes to keep cached for
+                reuse.
+        """
+        self.alignment = alignment
+        self.max_cached_bytes = max_cached_bytes
+        self.copies = 0
+        self.copied_bytes = 0
+        self._free = {}
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def _capacity(self, nbytes: int) -> int:
+        return max(self.alignment, 1 << max(nbytes - 1, 0).bit_length())
+
+    def _acquire(self, capacity: int) -> "np.ndarray":
+        with self._lock:
+            bucket = self._free.get(capacity)
+            if bucket:
+                self._cached_bytes -= capacity
+                return bucket.pop()
+        return aligned_empty(capacity, self.alignment)
+
+    def _release(self, buffer: "np.ndarray") -> None:
+        capacity = buffer.nbytes
+        with self._lock:
+            if self._cached_bytes + capacity > self.max_cached_bytes:
+                return
+            self._free.setdefault(capacity, []).append(buffer)
+            self._cached_bytes += capacity
+
+    def stage(self, data: "np.ndarray") -> "np.ndarray":
+        """Copies an array into a C-contiguous, aligned staging buffer.
+
+        Args:
+            data: The array to copy.
+
+        Returns:
+            A C-contiguous array with the same shape, dtype and contents as
+            `data`.
+        """
+        nbytes = data.nbytes
+        lease = _Lease(self._acquire(self._capacity(nbytes)))
+        weakref.finalize(lease, self._release, lease.buffer)
+
+        staged = np.asarray(lease)[:nbytes].view(data.dtype).reshape(data.shape)
+        np.copyto(staged, data, casting="no")
+
+        with self._lock:
+            self.copies += 1
+            self.copied_bytes += nbytes
+        logger.debug(
+            "Staged copy of %d bytes for %s array with strides %s",
+            nbytes,
+            data.dtype,
+            data.strides,
+        )
+        return staged
+
+    def stats(self) -> dict[str, int]:
+        """Returns the pool copy and cache statistics.
+
+        Returns:
+            A dict with the number of `copies`, the `copied_bytes` and the
+            currently `cached_bytes`.
+        """
+        with self._lock:
+            return {
+                "copies": self.copies,
+                "copied_bytes": self.copied_bytes,
+                "cached_bytes": self._cached_bytes,
+            }
+
+    def reset_stats(self) -> None:
+        """Resets the copy statistics."""
+        with self._lock:
+            self.copies = 0
+            self.copied_bytes = 0
+
+    def clear(self) -> None:
+        """Drops all cached buffers."""
+        with self._lock:
+            self._free.clear()
+            self._cached_bytes = 0
+
+
+staging_pool = StagingPool()
@@ -2,34 +2,93 @@
 
 """Common interfaces for C types."""
 
+import logging
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from contextlib import ExitStack
 from functools import singledispatch
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from vaccel._libvaccel import ffi
-from vaccel.error import NullPointerError, ptr_or_raise
+from vaccel.error import FFIError, NullPointerError, ptr_or_raise
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+# Striped locks that serialize the creation of deferred C objects, so an object
+# shared between threads is materialized exactly once without a global lock
+_MATERIALIZE_STRIPES = 64
+_materialize_locks = tuple(
+    threading.RLock() for _ in range(_MATERIALIZE_STRIPES)
+)
+
+
+def _materialize_lock(obj: object) -> threading.RLock:
+    return _materialize_locks[(id(obj) >> 4) % _MATERIALIZE_STRIPES]
 
 
 class CType(ABC):
     """Abstract base class for defining C data types.
 
+    Subclasses that set `_defer_c_obj` do not initialize the C object on
+    construction; it is created the first time the C pointer is accessed, or
+    together with other deferred objects by `materialize()`. Deferred objects
+    are materialized exactly once, even if shared between threads.
+
     Attributes:
         _c_obj (ffi.CData): A pointer to the underlying C object.
         _c_size (int): The size of the underlying C object.
+        _c_obj_pending (bool): True if the C object is deferred and has not
+            been created yet.
     """
 
+    _defer_c_obj: bool = False
+    _c_obj_pending: bool = False
+
     def __init__(self):
         self._c_obj = ffi.NULL
         self._c_size = None
-        self._init_c_obj()
+        if self._defer_c_obj:
+            self._c_obj_pending = True
+        else:
+            self._init_c_obj()
 
     @abstractmethod
     def _init_c_obj(self):
         """Initializes the C object."""
 
+    def _materialize(self) -> None:
+        """Creates the deferred C object."""
+        self._init_c_obj()
+        self._c_obj_pending = False
+
+    def _materialize_once(self) -> None:
+        """Creates the deferred C object unless another thread already did."""
+        with _materialize_lock(self):
+            if self._c_obj_pending:
+                self._materialize()
+
+    @classmethod
+    def _materialize_many(cls, objs: list["CType"]) -> None:
+        """Creates the deferred C objects of multiple objects of this type.
+
+        Subclasses can override this to create all C objects in one pass.
+
+        Args:
+            objs: The objects with pending C objects; all of type `cls`.
+        """
+        for obj in objs:
+            obj._materialize()
+
     @property
     def _c_ptr(self):
         """Returns the C pointer representation of the object."""
+        if self._c_obj_pending:
+            self._materialize_once()
         return self._c_obj
 
     @property
@@ -39,11 +98,13 @@ class CType(ABC):
         Raises:
             NullPointerError: If the pointer is NULL.
         """
-        return ptr_or_raise(self._c_obj, f"{self.__class__.__name__}._c_obj")
+        return ptr_or_raise(self._c_ptr, f"{self.__class__.__name__}._c_obj")
 
     @property
     def c_size(self) -> int:
         """Returns the size of the object in bytes."""
+        if self._c_obj_pending:
+            self._materialize_once()
         return self._c_size
 
     @property
@@ -65,6 +126,180 @@ class CType(ABC):
         return f"<{self.__class__.__name__} at {c_ptr}>"
 
 
+def materialize(objs: Iterable[CType]) -> None:
+    """Creates the deferred C objects of multiple objects in one pass.
+
+    Objects with pending C objects are grouped by type and each group is
+    created by the `_materialize_many()` hook of its type, e.g. with a single C
+    call for args and tensors. Other objects are left untouched.
+
+    Args:
+        objs: The objects to materialize.
+    """
+    objs = [obj for obj in objs if obj._c_obj_pending]
+    if not objs:
+        return
+
+    # Lock stripes are always acquired in index order to avoid deadlocks
+    stripes = sorted({(id(obj) >> 4) % _MATERIALIZE_STRIPES for obj in objs})
+    with ExitStack() as stack:
+        for stripe in stripes:
+            stack.enter_context(_materialize_locks[stripe])
+        pending = {}
+        for obj in objs:
+            if obj._c_obj_pending:
+                pending.setdefault(type(obj), {})[id(obj)] = obj
+        for cls, group in pending.items():
+            cls._materialize_many(list(group.values()))
+
+
+def _release_c_obj(
+    del_c_obj: Callable[[ffi.CData], None], c_obj: ffi.CData, name: str
+) -> None:
+    try:
+        del_c_obj(c_obj)
+    except FFIError:
+        logger.exception("Failed to clean up %s", name)
+
+
+class OwnedCType(CType):
+    """Abstract base class for C types that own their underlying C object.
+
+    The C object is released deterministically by `close()` or when leaving a
+    `with` block. If the object is never closed, a `weakref.finalize` callback
+    releases the C object once the Python object is garbage collected or, at
+    the latest, at interpreter exit.
+
+    Zero-copy views of data owned by the C object (see `owned_buffer()`) are
+    counted as exports. Closing an object with exports closes the Python object
+    immediately, but the C object is only released when the last export is.
+
+    Inherits:
+        CType: Abstract base class for defining C data types.
+
+    Attributes:
+        _finalizer (weakref.finalize | None): The finalizer that releases the
+            owned C object; None if no C object is owned.
+        _exports (int): The number of live zero-copy views of the C object's
+            data.
+        _deferred (weakref.finalize | None): The finalizer of a closed object
+            with exports, called when the last export is released.
+    """
+
+    _finalizer: weakref.finalize | None = None
+    _exports: int = 0
+    _deferred: weakref.finalize | None = None
+
+    def __init__(self):
+        super().__init__()
+        self._own_c_obj()
+
+    def _materialize(self) -> None:
+        super()._materialize()
+        self._own_c_obj()
+
+    @staticmethod
+    @abstractmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
+        """Deletes a C object of this type.
+
+        Must not reference the Python object, so it can be safely called by
+        the finalizer.
+
+        Args:
+            c_obj: A pointer to the C object to delete.
+
+        Raises:
+            FFIError: If the C object deletion fails.
+        """
+
+    def _own_c_obj(self) -> None:
+        """Takes ownership of the current C object.
+
+        Registers a finalizer that releases the C object if `close()` is not
+        called explicitly.
+        """
+        if self._c_obj == ffi.NULL or self._finalizer is not None:
+            return
+        self._finalizer = weakref.finalize(
+            self,
+            _release_c_obj,
+            self._del_c_obj,
+            self._c_obj,
+            self.__class__.__name__,
+        )
+
+    @property
+    def closed(self) -> bool:
+        """True if the object does not own a live or deferred C object."""
+        if self._c_obj_pending:
+            return False
+        return self._finalizer is None or not self._finalizer.alive
+
+    def _add_export(self) -> None:
+        """Registers a zero-copy view of data owned by the C object."""
+        with _materialize_lock(self):
+            self._exports += 1
+
+    def _release_export(self) -> None:
+        """Unregisters a zero-copy view of data owned by the C object.
+
+        Releases the C object if it was closed while the view was alive and no
+        other view remains.
+        """
+        with _materialize_lock(self):
+            self._exports -= 1
+            finalizer = self._deferred if not self._exports else None
+            if finalizer is not None:
+                self._deferred = None
+        if finalizer is not None:
+            finalizer()
+            self._release_data()
+
+    def _release_data(self) -> None:
+        """Drops the Python objects that own the data of the C object.
+
+        Called once the C object has been released, so data buffers (e.g.
+        buffers taken from a `BufferPool`) outlive any view of the C object's
+        data. Subclasses that keep such buffers override this.
+        """
+
+    def close(self) -> None:
+        """Releases the underlying C object.
+
+        Calling `close()` on an already closed object has no effect. If views
+        of data owned by the C object are alive, the C object and its data are
+        released once the last view is released.
+
+        Raises:
+            FFIError: If the C object deletion fails.
+        """
+        self._c_obj_pending = False
+        with _materialize_lock(self):
+            finalizer = self._finalizer
+            self._finalizer = None
+            deferred = self._deferred is not None
+            c_obj = ffi.NULL
+            if finalizer is not None and finalizer.alive:
+                c_obj = self._c_obj
+                self._c_obj = ffi.NULL
+                if self._exports:
+                    self._deferred = finalizer
+                    return
+                finalizer.detach()
+        if c_obj != ffi.NULL:
+            self._del_c_obj(c_obj)
+        elif deferred:
+            return
+        self._release_data()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 class CAny(CType):
     """Generic adapter for wrapping C objects.
 
@@ -115,9 +350,41 @@ class CAny(CType):
         return f"<{self.__class__.__name__} wrapping {wrapped!r}>"
 
 
+_lazy_wrappers: dict[tuple[str, str], Callable] = {}
+_lazy_lock = threading.Lock()
+
+
+def register_lazy(module: str, qualname: str) -> Callable:
+    """Registers a `to_ctype` wrapper for a type of an optional dependency.
+
+    The wrapper is keyed by the module and qualified name of the type, so the
+    dependency does not need to be imported at registration time. It is
+    registered with `to_ctype` for the concrete type the first time a matching
+    value is converted.
+
+    Args:
+        module: The module that defines the type, as in `type.__module__`.
+        qualname: The qualified name of the type.
+
+    Returns:
+        A decorator that registers the wrapper function.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        _lazy_wrappers[module, qualname] = func
+        return func
+
+    return decorator
+
+
 @singledispatch
 def to_ctype(value: Any, *, precision: str | None = None):
-    _ = precision
+    for cls in type(value).__mro__:
+        func = _lazy_wrappers.get((cls.__module__, cls.__qualname__))
+        if func is not None:
+            with _lazy_lock:
+                to_ctype.register(cls, func)
+            return func(value, precision=precision)
     msg = f"No CType wrapper registered for {type(value)}"
     raise TypeError(msg)
 
@@ -2,8 +2,201 @@
 
 """Utilities for C type conversions."""
 
+import sys
+import threading
 from enum import IntEnum, IntFlag
-from typing import Any
+from functools import partial
+from typing import Any, Final
+
+from vaccel._c_types.types import OwnedCType
+from vaccel._lazy import LazyModule, is_imported
+from vaccel._libvaccel import ffi
+
+try:
+    from vaccel._enums import ENUM_CONSTANTS
+except ImportError:
+    ENUM_CONSTANTS = {}
+
+np = LazyModule("numpy")
+
+# DLPack `(device_type, device_id)` of host memory (`kDLCPU`)
+DLPACK_CPU_DEVICE: Final[tuple[int, int]] = (1, 0)
+
+# `PyBUF_WRITABLE` buffer request flag
+PYBUF_WRITABLE: Final[int] = 0x0001
+
+_C_TYPE_TO_FORMAT: Final[dict[str, str]] = {
+    "bool": "?",
+    "int": "i",
+    "int8_t": "b",
+    "uint8_t": "B",
+    "int16_t": "h",
+    "uint16_t": "H",
+    "int32_t": "i",
+    "uint32_t": "I",
+    "int64_t": "q",
+    "uint64_t": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+
+def c_type_to_format(c_type: str) -> str:
+    """Converts a C type string to a `struct`/`memoryview` format character.
+
+    Args:
+        c_type: The C type (e.g. "float", "int64_t").
+
+    Returns:
+        The corresponding format character.
+
+    Raises:
+        ValueError: If the `c_type` value is not supported.
+    """
+    if c_type not in _C_TYPE_TO_FORMAT:
+        supported = ", ".join(_C_TYPE_TO_FORMAT)
+        msg = f"Unsupported C type: {c_type}. Supported: {supported}"
+        raise ValueError(msg)
+    return _C_TYPE_TO_FORMAT[c_type]
+
+
+def c_type_to_typestr(c_type: str) -> str:
+    """Converts a C type string to a NumPy array interface type string.
+
+    Args:
+        c_type: The C type (e.g. "float", "int64_t").
+
+    Returns:
+        The corresponding type string (e.g. "<f4", "|u1").
+
+    Raises:
+        ValueError: If the `c_type` value is not supported.
+    """
+    fmt = c_type_to_format(c_type)
+    if fmt == "?":
+        kind = "b"
+    elif fmt in "fd":
+        kind = "f"
+    elif fmt.isupper():
+        kind = "u"
+    else:
+        kind = "i"
+    size = ffi.sizeof(c_type)
+    native = "<" if sys.byteorder == "little" else ">"
+    byteorder = "|" if size == 1 else native
+    return f"{byteorder}{kind}{size}"
+
+
+def array_interface(
+    c_obj: ffi.CData,
+    shape: tuple[int, ...],
+    typestr: str,
+    *,
+    readonly: bool = False,
+) -> dict[str, Any]:
+    """Builds a NumPy array interface for C-contiguous C memory.
+
+    Args:
+        c_obj: A pointer to the C memory.
+        shape: The shape of the data.
+        typestr: The array interface type string of the data elements.
+        readonly: Whether the memory must not be written to.
+
+    Returns:
+        A version 3 `__array_interface__` dict.
+    """
+    return {
+        "version": 3,
+        "shape": tuple(shape),
+        "typestr": typestr,
+        "data": (int(ffi.cast("uintptr_t", c_obj)), readonly),
+        "strides": None,
+    }
+
+
+def typed_c_array(
+    data: Any, c_type: str, min_len: int = 0, *, writable: bool = False
+) -> ffi.CData:
+    """Creates a zero-copy C array of buffer data.
+
+    NumPy arrays, lists and tuples are converted to C-contiguous arrays of
+    `c_type` if needed, which copies only if their data type or layout differ.
+    Other buffers (e.g. `memoryview`, `array.array`) and writable data are used
+    as is.
+
+    Args:
+        data: The buffer data.
+        c_type: The C type of the array elements (e.g. "float").
+        min_len: The minimum number of elements of the array.
+        writable: Whether the C array will be written to.
+
+    Returns:
+        A `c_type[]` C array of the data that keeps the data alive.
+
+    Raises:
+        TypeError: If the data is not a C-contiguous buffer of `c_type`
+            elements, or it is read-only and `writable` is True.
+        ValueError: If the data has fewer than `min_len` elements.
+    """
+    if not writable and (
+        isinstance(data, (list, tuple))
+        or (is_imported("numpy") and isinstance(data, np.ndarray))
+    ):
+        data = np.ascontiguousarray(data, dtype=c_type_to_typestr(c_type))
+
+    view = memoryview(data)
+    if view.format.lstrip("@") != c_type_to_format(c_type) or (
+        not view.c_contiguous
+    ):
+        msg = (
+            f"Expected a C-contiguous buffer of {c_type}, got format "
+            f"'{view.format}'"
+        )
+        raise TypeError(msg)
+    if writable and view.readonly:
+        msg = "Expected a writable buffer"
+        raise TypeError(msg)
+    if view.nbytes < min_len * view.itemsize:
+        msg = (
+            f"Expected at least {min_len} elements, got "
+            f"{view.nbytes // view.itemsize}"
+        )
+        raise ValueError(msg)
+    return ffi.from_buffer(f"{c_type}[]", data, require_writable=writable)
+
+
+def _keep_owner(owner: Any, c_obj: ffi.CData) -> None:
+    """Destructor that holds a reference to `owner` until it is called.
+
+    Releases the export of an `OwnedCType` owner.
+    """
+    _ = c_obj
+    if isinstance(owner, OwnedCType):
+        owner._release_export()
+
+
+def owned_buffer(c_obj: ffi.CData, c_size: int, owner: Any) -> ffi.buffer:
+    """Returns a buffer of C memory that keeps the memory owner alive.
+
+    The returned buffer holds a reference to `owner` for as long as the buffer,
+    or any object created from it (e.g. a NumPy array or a PyTorch tensor), is
+    referenced. This allows zero-copy views of C memory that is released when
+    `owner` is garbage collected. If `owner` is an `OwnedCType`, the buffer is
+    counted as an export, so closing `owner` defers the release of its C
+    object until the buffer is released.
+
+    Args:
+        c_obj: A pointer to the C memory.
+        c_size: The size of the C memory in bytes.
+        owner: The object responsible for releasing the C memory.
+
+    Returns:
+        A CFFI buffer object of `c_size` bytes.
+    """
+    if isinstance(owner, OwnedCType):
+        owner._add_export()
+    keepalive = ffi.gc(ffi.cast("char *", c_obj), partial(_keep_owner, owner))
+    return ffi.buffer(keepalive, c_size)
 
 
 class CEnumBuilder:
@@ -12,19 +205,35 @@ class CEnumBuilder:
     Utility class for creating Python IntEnum types from C enum constants
     exposed through a CFFI-loaded shared library.
 
+    Constants are looked up in the tables generated by `build_ffi.py` at build
+    time. Scanning the library namespace is only used as a fallback for
+    prefixes without a precomputed table.
+
+    Builders are thread-safe: concurrent calls for the same enum return the
+    same type.
+
     Attributes:
         lib (Any): The CFFI-loaded shared library with the C enum constants.
+        constants (dict[str, dict[str, int]]): Precomputed constant tables
+            keyed by prefix.
         _cache (dict): A cache for the generated `IntEnum` types.
+        _lock (threading.Lock): Serializes the creation of new enum types.
     """
 
-    def __init__(self, lib: Any):
+    def __init__(
+        self, lib: Any, constants: dict[str, dict[str, int]] | None = None
+    ):
         """Initializes a new `CEnumBuilder` object.
 
         Args:
             lib: A CFFI-loaded shared library.
+            constants: Precomputed constant tables keyed by prefix. Defaults to
+                the tables generated at build time.
         """
         self.lib = lib
+        self.constants = ENUM_CONSTANTS if constants is None else constants
         self._cache = {}
+        self._lock = threading.Lock()
 
     def from_prefix(
         self,
@@ -46,14 +255,32 @@ class CEnumBuilder:
             A Python IntEnum with values mapped from the C library.
         """
         cache_key = (enum_name, enum_type)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        enum_cls = self._cache.get(cache_key)
+        if enum_cls is not None:
+            return enum_cls
+
+        with self._lock:
+            enum_cls = self._cache.get(cache_key)
+            if enum_cls is None:
+                enum_cls = self._build(enum_name, prefix, enum_type)
+                self._cache[cache_key] = enum_cls
+        return enum_cls
 
-        members = {
-            attr[len(prefix) :]: getattr(self.lib, attr)
-            for attr in dir(self.lib)
-            if attr.startswith(prefix)
-        }
+    def _build(
+        self,
+        enum_name: str,
+        prefix: str,
+        enum_type: type[IntEnum] | type[IntFlag],
+    ) -> IntEnum | IntFlag:
+        """Creates a new Python enum from the C constants with a prefix."""
+        if prefix in self.constants:
+            members = dict(self.constants[prefix])
+        else:
+            members = {
+                attr[len(prefix) :]: getattr(self.lib, attr)
+                for attr in dir(self.lib)
+                if attr.startswith(prefix)
+            }
 
         if not members:
             msg = f"No constants found with prefix '{prefix}'"
@@ -64,8 +291,6 @@ class CEnumBuilder:
 
         enum_cls = enum_type(enum_name, members)
         enum_cls.__doc__ = docstring
-
-        self._cache[cache_key] = enum_cls
         return enum_cls
 
     def _build_enum_docstring(
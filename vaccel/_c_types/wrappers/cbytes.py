@@ -2,7 +2,10 @@
 
 """C type interface for byte-like objects."""
 
+from typing import Any
+
 from vaccel._c_types.types import CType, to_ctype
+from vaccel._c_types.utils import owned_buffer
 from vaccel._libvaccel import ffi
 from vaccel.error import NullPointerError
 
@@ -43,12 +46,16 @@ class CBytes(CType):
         return self._data
 
     @classmethod
-    def from_c_obj(cls, c_obj: ffi.CData, c_size: int) -> "CBytes":
+    def from_c_obj(
+        cls, c_obj: ffi.CData, c_size: int, owner: Any = None
+    ) -> "CBytes":
         """Initializes a new `CBytes` object from a C string pointer.
 
         Args:
             c_obj: A pointer to a C object or array.
             c_size: The size of the C object or array.
+            owner: An object that owns the C memory. If provided, the object is
+                kept alive for as long as the returned data is referenced.
 
         Returns:
             A new `CBytes` object
@@ -64,7 +71,11 @@ class CBytes(CType):
         inst = cls.__new__(cls)
         inst._c_obj = c_obj
         inst._c_size = c_size
-        inst._data = memoryview(ffi.buffer(inst._c_obj, c_size))
+        if owner is not None:
+            buf = owned_buffer(inst._c_obj, c_size, owner)
+        else:
+            buf = ffi.buffer(inst._c_obj, c_size)
+        inst._data = memoryview(buf)
         return inst
 
     def _as_c_array(self, c_type: str = "char") -> ffi.CData:
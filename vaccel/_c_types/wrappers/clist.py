@@ -2,10 +2,11 @@
 
 """C type interface for `list` objects."""
 
+import threading
 from collections.abc import Iterator, Sequence
 from typing import Any
 
-from vaccel._c_types.types import CType, to_ctype
+from vaccel._c_types.types import CType, materialize, to_ctype
 from vaccel._libvaccel import ffi
 from vaccel.error import NullPointerError
 
@@ -18,6 +19,9 @@ class CList(CType):
     Provides an interface to interact with the C representation of `list`
     objects.
 
+    Mutators are serialized by a per-list lock, but a `CList` must not be
+    mutated while its C array is in use by a C call in another thread.
+
     Inherits:
         CType: Abstract base class for defining C data types.
 
@@ -25,6 +29,8 @@ class CList(CType):
         _items (Sequence[Any])): An input sequence of items.
         _item_type (type): The type of the input items.
         _ctype_str (str): The type string of the C representation of the items.
+        _lock (threading.Lock): Serializes mutations, so concurrent updates
+            cannot leave the C array out of sync with the items.
     """
 
     def __init__(self, items: Sequence[Any]):
@@ -48,8 +54,12 @@ class CList(CType):
             msg = "All elements must be of the same type"
             raise TypeError(msg)
 
+        # Create deferred C objects of items (e.g. args, tensors) in one pass
+        materialize(self._items)
+
         # Infer C type string (e.g., "int", "double") based on first element
         self._ctype_str = self._infer_ctype_str(self._items[0])
+        self._lock = threading.Lock()
         super().__init__()
 
     def _infer_ctype_str(self, item: CType) -> str:
@@ -108,6 +118,7 @@ class CList(CType):
             raise TypeError(msg)
 
         # Build array of pointers
+        materialize(inst._items)
         c_ptrs = [item._c_ptr for item in items]
         ptr_type = ffi.typeof(c_ptrs[0])
         inst._c_obj = ffi.new(
@@ -115,6 +126,7 @@ class CList(CType):
         )
         inst._c_size = ffi.sizeof(inst._c_obj)
         inst._is_ptr_array = True
+        inst._lock = threading.Lock()
         return inst
 
     # Mutators
@@ -125,8 +137,9 @@ class CList(CType):
         if not isinstance(c_value, self._item_type):
             msg = f"Expected {self._item_type}, got {type(c_value)}"
             raise TypeError(msg)
-        self._items.append(c_value)
-        self._init_c_obj()
+        with self._lock:
+            self._items.append(c_value)
+            self._init_c_obj()
 
     def extend(self, values: Sequence[Any]):
         """Extends `CList` with the values and updates the C representation."""
@@ -139,16 +152,19 @@ class CList(CType):
                     f"got {type(item)}"
                 )
                 raise TypeError(msg)
-        self._items.extend(new_items)
-        self._init_c_obj()
+        materialize(new_items)
+        with self._lock:
+            self._items.extend(new_items)
+            self._init_c_obj()
 
     def __setitem__(self, idx: int, value: Any):
         c_value = to_ctype(value)
         if not isinstance(c_value, self._item_type):
             msg = f"Expected {self._item_type}, got {type(c_value)}"
             raise TypeError(msg)
-        self._items[idx] = c_value
-        self._c_ptr_or_raise[idx] = c_value.value
+        with self._lock:
+            self._items[idx] = c_value
+            self._c_ptr_or_raise[idx] = c_value.value
 
     def __getitem__(self, idx: int):
         return self._items[idx]
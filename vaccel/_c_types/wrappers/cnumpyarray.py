@@ -2,15 +2,16 @@
 
 """C type interface for NumPy array objects."""
 
-from vaccel._c_types.types import CType, to_ctype
-from vaccel._libvaccel import ffi
+from typing import Any
 
-try:
-    import numpy as np
+from vaccel._c_types.staging import staging_pool
+from vaccel._c_types.types import CType, register_lazy
+from vaccel._c_types.utils import owned_buffer
+from vaccel._lazy import LazyModule, is_available
+from vaccel._libvaccel import ffi
 
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
 
 
 class CNumpyArray(CType):
@@ -19,27 +20,50 @@ class CNumpyArray(CType):
     Provides an interface to interact with the C representation of NumPy array
     objects.
 
+    C-contiguous arrays, including contiguous slices of larger arrays, are
+    wrapped without copying. Any other layout is copied into an aligned buffer
+    from the shared staging pool, which is recycled once the wrapped array is
+    no longer referenced. The number of copied bytes is accounted for in
+    `staging_pool.stats()`.
+
     Inherits:
         CType: Abstract base class for defining C data types.
 
     Attributes:
-        _data (np.array): The input NumPy array.
+        _data (np.array): The C-contiguous NumPy array passed to C.
+        _copied_nbytes (int): The number of bytes copied to make the input
+            C-contiguous.
     """
 
-    def __init__(self, data: "np.ndarray"):
+    def __init__(self, data: "np.ndarray", *, allow_copy: bool = True):
         """Initializes a new `CNumpyArray` object.
 
         Args:
             data: The NumPy array to be wrapped.
+            allow_copy: Whether a non C-contiguous array may be copied into a
+                staging buffer. Defaults to True.
 
         Raises:
             NotImplementedError: If NumPy is not installed.
+            ValueError: If `data` must be copied and `allow_copy` is False.
         """
         if not HAS_NUMPY:
             msg = "NumPy is not available"
             raise NotImplementedError(msg)
 
-        self._data = np.ascontiguousarray(data)
+        data = np.asarray(data)
+        if data.flags["C_CONTIGUOUS"]:
+            self._data = data
+            self._copied_nbytes = 0
+        elif allow_copy:
+            self._data = staging_pool.stage(data)
+            self._copied_nbytes = data.nbytes
+        else:
+            msg = (
+                f"Array with strides {data.strides} is not C-contiguous "
+                "and copying is not allowed"
+            )
+            raise ValueError(msg)
         super().__init__()
 
     def _init_c_obj(self):
@@ -58,6 +82,7 @@ class CNumpyArray(CType):
         c_size: int,
         shape: tuple[int, ...],
         dtype: "np.dtype",
+        owner: Any = None,
     ) -> "CNumpyArray":
         """Initializes a new `CNumpyArray` object from a C pointer.
 
@@ -66,6 +91,8 @@ class CNumpyArray(CType):
             c_size: The size of the C object or array.
             shape: The shape of the resulting NumPy array.
             dtype: The NumPy data type.
+            owner: An object that owns the C memory. If provided, the object is
+                kept alive through the `base` of the resulting NumPy array.
 
         Returns:
             A new `CNumpyArray` object
@@ -92,8 +119,12 @@ class CNumpyArray(CType):
         inst = cls.__new__(cls)
         inst._c_obj = c_obj
         inst._c_size = c_size
+        inst._copied_nbytes = 0
 
-        buf = ffi.buffer(inst._c_obj, inst._c_size)
+        if owner is not None:
+            buf = owned_buffer(inst._c_obj, inst._c_size, owner)
+        else:
+            buf = ffi.buffer(inst._c_obj, inst._c_size)
         inst._data = np.frombuffer(buf, dtype=dtype).reshape(shape)
 
         return inst
@@ -143,15 +174,42 @@ class CNumpyArray(CType):
         """Returns the total number of elements in the array."""
         return self._data.size
 
+    @property
+    def strides(self) -> tuple[int, ...]:
+        """Returns the strides in bytes of the array dimensions."""
+        return self._data.strides
+
+    @property
+    def order(self) -> str | None:
+        """Returns the memory order of the array.
+
+        Returns:
+            "C" if the array is C-contiguous, "F" if it is only
+            Fortran-contiguous or None if it is not contiguous.
+        """
+        if self._data.flags["C_CONTIGUOUS"]:
+            return "C"
+        if self._data.flags["F_CONTIGUOUS"]:
+            return "F"
+        return None
+
     @property
     def is_contiguous(self) -> bool:
         """Returns True if the array is C-contiguous in memory."""
         return self._data.flags["C_CONTIGUOUS"]
 
+    @property
+    def copied_nbytes(self) -> int:
+        """Returns the number of bytes copied when wrapping the input array."""
+        return self._copied_nbytes
+
+    @property
+    def is_copy(self) -> bool:
+        """Returns True if the input array was copied when wrapped."""
+        return self._copied_nbytes > 0
 
-if HAS_NUMPY:
 
-    @to_ctype.register
-    def _(value: np.ndarray, *, precision: str | None = None):
-        _ = precision
-        return CNumpyArray(value)
+@register_lazy("numpy", "ndarray")
+def _(value: "np.ndarray", *, precision: str | None = None):
+    _ = precision
+    return CNumpyArray(value)
@@ -2,6 +2,7 @@
 
 """C type interface for `str` objects."""
 
+import threading
 from pathlib import Path
 
 from vaccel._c_types.types import CType, to_ctype
@@ -15,11 +16,16 @@ class CStr(CType):
     Provides an interface to interact with the C representation of `str`
     objects.
 
+    Updates are serialized by a per-string lock, but a `CStr` must not be
+    updated while its C string is in use by a C call in another thread.
+
     Inherits:
         CType: Abstract base class for defining C data types.
 
     Attributes:
         _value (str): The input str.
+        _lock (threading.Lock): Serializes updates, so concurrent updates
+            cannot leave the C string out of sync with the value.
     """
 
     def __init__(self, value: str):
@@ -29,6 +35,7 @@ class CStr(CType):
             value: The str to be wrapped.
         """
         self._value = str(value)
+        self._lock = threading.Lock()
         super().__init__()
 
     def _init_c_obj(self):
@@ -58,6 +65,7 @@ class CStr(CType):
         inst = cls.__new__(cls)
         inst._c_obj = c_obj
         inst._c_size = ffi.sizeof(inst._c_obj)
+        inst._lock = threading.Lock()
         return inst
 
     def as_bytes(self) -> bytes:
@@ -76,9 +84,10 @@ class CStr(CType):
             msg = "CStr update only accepts str or bytes objects"
             raise TypeError(msg)
 
-        if new_str != self._value:
-            self._value = new_str
-            self._init_c_obj()
+        with self._lock:
+            if new_str != self._value:
+                self._value = new_str
+                self._init_c_obj()
 
     def __len__(self):
         return len(self._value)
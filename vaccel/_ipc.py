@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Transport of tensor and resource data between processes."""
+
+import math
+import sys
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import LazyModule, is_available
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+pickle = LazyModule("pickle")
+shared_memory = LazyModule("multiprocessing.shared_memory")
+resource_tracker = LazyModule("multiprocessing.resource_tracker")
+
+
+def pickle_buffer(data: Any, protocol: int) -> Any:
+    """Prepares buffer data for pickling.
+
+    Args:
+        data: A C-contiguous byte-like object.
+        protocol: The pickle protocol in use.
+
+    Returns:
+        A `pickle.PickleBuffer` for protocol 5 and above, so the data can be
+        transferred out-of-band without copying, or a copy of the data as
+        bytes for older protocols.
+    """
+    if protocol >= 5:  # noqa: PLR2004
+        return pickle.PickleBuffer(data)
+    return memoryview(data).tobytes()
+
+
+def unpickle_buffer(data: Any) -> memoryview:
+    """Returns a byte-formatted view of unpickled buffer data.
+
+    Args:
+        data: The unpickled data, e.g. bytes for in-band data or the object
+            passed to `pickle.loads()` for out-of-band data.
+
+    Returns:
+        A zero-copy `memoryview` of the data.
+    """
+    return memoryview(data).cast("B")
+
+
+def _attach(name: str) -> "SharedMemory":
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the block with the resource tracker, which would
+    # unlink it when this process exits, while the creator still uses it
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class _SharedMemoryLease:
+    """Owner of an attached shared memory block.
+
+    Arrays created from a lease keep it alive through their `base`, so the
+    block is only detached once no view of it remains.
+
+    Attributes:
+        interface (dict): The NumPy array interface of the block data.
+    """
+
+    __slots__ = ("__weakref__", "interface")
+
+    def __init__(self, interface: dict):
+        self.interface = interface
+
+    @property
+    def __array_interface__(self) -> dict:
+        return self.interface
+
+
+def attach_shared_memory(
+    name: str, shape: Sequence[int], dtype: Any
+) -> "np.ndarray":
+    """Creates a NumPy array backed by an existing shared memory block.
+
+    Args:
+        name: The name of the shared memory block.
+        shape: The shape of the array.
+        dtype: The data type of the array.
+
+    Returns:
+        A zero-copy NumPy array of the block data. The block is detached once
+        the array and all its views have been released.
+
+    Raises:
+        NotImplementedError: If NumPy is not installed.
+        FileNotFoundError: If no shared memory block named `name` exists.
+        ValueError: If the block is smaller than the array.
+    """
+    if not HAS_NUMPY:
+        msg = "NumPy is not available"
+        raise NotImplementedError(msg)
+
+    shape = tuple(shape)
+    dtype = np.dtype(dtype)
+    nbytes = math.prod(shape) * dtype.itemsize
+
+    shm = _attach(name)
+    if nbytes > shm.size:
+        shm.close()
+        msg = (
+            f"Shared memory block '{name}' of {shm.size} bytes is too small "
+            f"for an array of {nbytes} bytes"
+        )
+        raise ValueError(msg)
+
+    # Only the address is kept, so the block can be closed without
+    # outstanding exports of its buffer
+    interface = np.frombuffer(shm.buf, np.uint8, nbytes).__array_interface__
+    lease = _SharedMemoryLease(interface)
+    weakref.finalize(lease, shm.close)
+    return np.asarray(lease).view(dtype).reshape(shape)
+
+
+def copy_to_shared_memory(data: Any, name: str | None = None) -> "SharedMemory":
+    """Copies buffer data into a new shared memory block.
+
+    Args:
+        data: A C-contiguous byte-like object.
+        name: The name of the new block. Defaults to a unique name.
+
+    Returns:
+        A new `SharedMemory` object. The caller is responsible for closing and
+        unlinking it.
+
+    Raises:
+        FileExistsError: If a block named `name` already exists.
+    """
+    view = memoryview(data).cast("B")
+    shm = shared_memory.SharedMemory(
+        name=name, create=True, size=max(view.nbytes, 1)
+    )
+    shm.buf[: view.nbytes] = view
+    return shm
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Deferred imports of optional dependencies."""
+
+import importlib
+import importlib.util
+import sys
+from functools import cache
+from types import ModuleType
+from typing import Any
+
+
+@cache
+def is_available(name: str) -> bool:
+    """Checks if a module can be imported, without importing it.
+
+    Args:
+        name: The absolute name of the module.
+
+    Returns:
+        True if the module is installed.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def is_imported(name: str) -> bool:
+    """Checks if a module has already been imported.
+
+    Objects of a module's types can only exist if the module is imported, so
+    this allows `isinstance()` checks against optional types without forcing
+    the import.
+
+    Args:
+        name: The absolute name of the module.
+
+    Returns:
+        True if the module is present in `sys.modules`.
+    """
+    return name in sys.modules
+
+
+class LazyModule:
+    """Proxy that imports a module on first attribute access.
+
+    Attributes:
+        _name (str): The absolute name of the proxied module.
+        _module (ModuleType | None): The imported module; None until first use.
+    """
+
+    def __init__(self, name: str):
+        """Initializes a new `LazyModule` object.
+
+        Args:
+            name: The absolute name of the module to proxy.
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        value = getattr(self._load(), attr)
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<{self.__class__.__name__} {self._name!r} ({state})>"
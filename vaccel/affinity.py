@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""CPU affinity and NUMA-aware placement of session workers."""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Final
+
+from .plugin import PluginType
+from .resource import Resource
+from .session import local_session
+
+NODE_SYSFS_PATH: Final[Path] = Path("/sys/devices/system/node")
+
+PLACEMENTS: Final[tuple[str, ...]] = ("node", "cpu")
+
+
+def parse_cpulist(cpulist: str) -> set[int]:
+    """Parses a Linux CPU list string.
+
+    Args:
+        cpulist: A CPU list (e.g. "0-3,8,10-11").
+
+    Returns:
+        The CPU numbers in the list.
+
+    Raises:
+        ValueError: If the CPU list is malformed.
+    """
+    cpus = set()
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        if sep:
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(first))
+    return cpus
+
+
+def allowed_cpus() -> set[int]:
+    """Returns the CPUs the current process is allowed to run on.
+
+    Returns:
+        The CPU numbers of the affinity mask of the process, or all CPUs if
+        the platform does not support CPU affinity.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return set(os.sched_getaffinity(0))
+    return set(range(os.cpu_count() or 1))
+
+
+def numa_nodes(sysfs_path: Path = NODE_SYSFS_PATH) -> dict[int, set[int]]:
+    """Returns the NUMA nodes of the system and their CPUs.
+
+    Only CPUs the current process is allowed to run on are included; nodes
+    without any such CPU (e.g. memory-only nodes) are omitted.
+
+    Args:
+        sysfs_path: The sysfs directory describing the NUMA nodes.
+
+    Returns:
+        The CPUs of each NUMA node, keyed by node number. If the NUMA topology
+        is not available, all allowed CPUs are reported as node 0.
+    """
+    cpus = allowed_cpus()
+    nodes = {}
+    for node_path in sorted(sysfs_path.glob("node[0-9]*")):
+        try:
+            node_cpus = parse_cpulist((node_path / "cpulist").read_text())
+        except (OSError, ValueError):
+            continue
+        node_cpus &= cpus
+        if node_cpus:
+            nodes[int(node_path.name[len("node") :])] = node_cpus
+    return nodes or {0: cpus}
+
+
+def worker_cpusets(
+    nr_workers: int,
+    placement: str = "node",
+    nodes: dict[int, set[int]] | None = None,
+) -> list[set[int]]:
+    """Assigns CPU sets to workers, spreading them across NUMA nodes.
+
+    Workers are distributed round-robin over the NUMA nodes, so concurrent
+    workers use the memory bandwidth of all nodes.
+
+    Args:
+        nr_workers: The number of workers.
+        placement: "node" to allow each worker on all CPUs of its node, or
+            "cpu" to pin each worker to a single CPU of its node.
+        nodes: The NUMA nodes and their CPUs. Defaults to `numa_nodes()`.
+
+    Returns:
+        The CPU set of each worker.
+
+    Raises:
+        ValueError: If `placement` is not supported.
+    """
+    if placement not in PLACEMENTS:
+        supported = ", ".join(PLACEMENTS)
+        msg = f"Unsupported placement: {placement}. Supported: {supported}"
+        raise ValueError(msg)
+
+    if nodes is None:
+        nodes = numa_nodes()
+    node_cpus = [sorted(nodes[node]) for node in sorted(nodes)]
+
+    cpusets = []
+    for worker in range(nr_workers):
+        cpus = node_cpus[worker % len(node_cpus)]
+        if placement == "node":
+            cpusets.append(set(cpus))
+        else:
+            cpusets.append({cpus[(worker // len(node_cpus)) % len(cpus)]})
+    return cpusets
+
+
+def pin_thread(cpus: Iterable[int]) -> None:
+    """Restricts the calling thread to a set of CPUs.
+
+    Memory the thread touches first afterwards (e.g. session and tensor
+    buffers) is allocated on the NUMA node of these CPUs by the kernel.
+
+    Args:
+        cpus: The CPU numbers to allow.
+
+    Raises:
+        NotImplementedError: If the platform does not support CPU affinity.
+        OSError: If the affinity cannot be set.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        msg = "CPU affinity is not supported on this platform"
+        raise NotImplementedError(msg)
+    # On Linux, pid 0 refers to the calling thread
+    os.sched_setaffinity(0, set(cpus))
+
+
+class WorkerInitializer:
+    """Pins each new pool worker to its CPU set and creates its session.
+
+    Usable as the `initializer` of a `ThreadPoolExecutor` or, with the "fork"
+    start method, of a `ProcessPoolExecutor`. Each worker is pinned to the
+    next CPU set before it creates its thread-local session (see
+    `local_session()`), so the session buffers are allocated on the local NUMA
+    node of the worker. Pinning is skipped on platforms without CPU affinity
+    support.
+
+    Attributes:
+        cpusets (list[set[int]]): The CPU sets assigned to workers in order.
+        flags (PluginType | int | None): The flags of the worker sessions;
+            None to not create sessions.
+        resources (list[Resource]): The resources to register with the
+            worker sessions.
+    """
+
+    def __init__(
+        self,
+        cpusets: list[set[int]],
+        flags: PluginType | int | None = 0,
+        resources: Iterable[Resource] = (),
+    ):
+        """Initializes a new `WorkerInitializer` object.
+
+        Args:
+            cpusets: The CPU sets to assign to workers, e.g. as returned by
+                `worker_cpusets()`.
+            flags: The flags of the worker sessions; None to only pin the
+                workers.
+            resources: The resources to register with the worker sessions.
+        """
+        self.cpusets = cpusets
+        self.flags = flags
+        self.resources = list(resources)
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def _next_index(self) -> int:
+        # Pool processes are numbered by `multiprocessing`; threads are not
+        identity = multiprocessing.current_process()._identity
+        if identity:
+            return identity[-1] - 1
+        with self._lock:
+            return next(self._counter)
+
+    def __call__(self) -> None:
+        """Pins the calling worker and creates its thread-local session.
+
+        Raises:
+            OSError: If the affinity of the worker cannot be set.
+            FFIError: If session creation or resource registration fails.
+        """
+        if self.cpusets and hasattr(os, "sched_setaffinity"):
+            pin_thread(self.cpusets[self._next_index() % len(self.cpusets)])
+        if self.flags is not None:
+            local_session(self.flags, self.resources)
+
+
+def pinned_thread_pool(
+    max_workers: int | None = None,
+    placement: str = "node",
+    flags: PluginType | int | None = 0,
+    resources: Iterable[Resource] = (),
+    initializer: Callable[[], None] | None = None,
+) -> ThreadPoolExecutor:
+    """Creates a thread pool with NUMA-aware, pinned session workers.
+
+    Each worker is pinned to a CPU set (see `worker_cpusets()`) and creates its
+    thread-local session on start. Tasks get the session of the worker that
+    runs them with `local_session(flags)`.
+
+    Args:
+        max_workers: The number of workers. Defaults to the number of allowed
+            CPUs.
+        placement: The worker placement, "node" or "cpu".
+        flags: The flags of the worker sessions; None to only pin the workers.
+        resources: The resources to register with the worker sessions.
+        initializer: An additional callable to run in each worker after it has
+            been pinned.
+
+    Returns:
+        A new `ThreadPoolExecutor` object.
+
+    Raises:
+        ValueError: If `placement` is not supported.
+    """
+    if max_workers is None:
+        max_workers = len(allowed_cpus())
+    init = WorkerInitializer(
+        worker_cpusets(max_workers, placement), flags, resources
+    )
+
+    def worker_init():
+        init()
+        if initializer is not None:
+            initializer()
+
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="vaccel-worker",
+        initializer=worker_init,
+    )
@@ -2,16 +2,14 @@
 
 """Interface to the `struct vaccel_arg` C object."""
 
-import logging
+from collections.abc import Sequence
 from typing import Any, Final
 
-from ._c_types import CAny, CType
+from ._c_types import CAny, OwnedCType
 from ._c_types.utils import CEnumBuilder
 from ._libvaccel import ffi, lib
 from .error import FFIError, NullPointerError, ptr_or_raise
 
-logger = logging.getLogger(__name__)
-
 enum_builder = CEnumBuilder(lib)
 ArgType = enum_builder.from_prefix("ArgType", "VACCEL_ARG_")
 
@@ -104,14 +102,16 @@ class ArgTypeMapper:
         return cls._ARG_TYPE_TO_C[arg_type]
 
 
-class Arg(CType):
+class Arg(OwnedCType):
     """Wrapper for the `vaccel_arg` C struct.
 
     Manages the creation and initialization of a C `struct vaccel_arg` object
-    and provides access to it through Python properties.
+    and provides access to it through Python properties. The C object is
+    created on first use, so the args of an operation are created together.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _c_data (CAny): The encapsulated C data that is passed to the C struct.
@@ -122,6 +122,8 @@ class Arg(CType):
             is `ArgType.CUSTOM`.
     """
 
+    _defer_c_obj = True
+
     def __init__(
         self, data: Any, type_: ArgType = ArgType.RAW, custom_type_id: int = 0
     ):
@@ -133,6 +135,13 @@ class Arg(CType):
             custom_type_id: The user-specified type ID of the arg if the type is
                 `ArgType.CUSTOM`.
         """
+        self._set_data(data, type_, custom_type_id)
+        super().__init__()
+
+    def _set_data(
+        self, data: Any, type_: ArgType = ArgType.RAW, custom_type_id: int = 0
+    ):
+        """Wraps the input data as a C type and stores the arg properties."""
         if ArgType != ArgType.RAW and ArgTypeMapper.is_numeric(type_):
             precision = ArgTypeMapper.type_to_c_type(type_)
             self._c_data = CAny(data, precision=precision)
@@ -141,7 +150,6 @@ class Arg(CType):
         self._c_obj_ptr = ffi.NULL
         self._type = type_
         self._custom_type_id = custom_type_id
-        super().__init__()
 
     def _init_c_obj(self):
         """Initializes the underlying `struct vaccel_arg` C object."""
@@ -159,6 +167,59 @@ class Arg(CType):
         self._c_obj = self._c_obj_ptr[0]
         self._c_size = ffi.sizeof("struct vaccel_arg")
 
+    @classmethod
+    def batch(cls, args: Sequence[tuple[Any, ...]]) -> list["Arg"]:
+        """Initializes multiple `Arg` objects with a single C call.
+
+        Args:
+            args: The arguments of `Arg()` for each arg, i.e. the data and,
+                optionally, the type and the custom type ID.
+
+        Returns:
+            The new `Arg` objects, in the order of `args`.
+
+        Raises:
+            FFIError: If arg initialization fails.
+        """
+        insts = [cls(*arg) for arg in args]
+        cls._materialize_many(insts)
+        return insts
+
+    @classmethod
+    def _materialize_many(cls, objs: list["Arg"]) -> None:
+        """Creates the C objects of multiple deferred args with one C call.
+
+        Args:
+            objs: The args with pending C objects.
+
+        Raises:
+            FFIError: If arg initialization fails.
+        """
+        nr_args = len(objs)
+        if nr_args <= 1:
+            # Not worth the array marshalling for a single arg
+            super()._materialize_many(objs)
+            return
+
+        c_args = ffi.new(f"struct vaccel_arg *[{nr_args}]")
+        ret = lib.vaccel_py_args_from_bufs(
+            c_args,
+            nr_args,
+            ffi.new("void *[]", [inst._c_data._c_ptr for inst in objs]),
+            ffi.new("size_t[]", [inst._c_data.c_size for inst in objs]),
+            ffi.new("uint32_t[]", [inst._type for inst in objs]),
+            ffi.new("uint32_t[]", [inst._custom_type_id for inst in objs]),
+        )
+        if ret != 0:
+            raise FFIError(ret, "Could not initialize args")
+
+        c_size = ffi.sizeof("struct vaccel_arg")
+        for inst, c_obj in zip(objs, c_args, strict=True):
+            inst._c_obj = c_obj
+            inst._c_size = c_size
+            inst._c_obj_pending = False
+            inst._own_c_obj()
+
     @property
     def value(self) -> ffi.CData:
         """Returns the value of the underlying C struct.
@@ -168,24 +229,20 @@ class Arg(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_arg` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If arg deletion fails.
         """
-        ret = lib.vaccel_arg_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_arg_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete arg")
 
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Arg")
-
     @property
     def buf(self) -> Any:
         """Returns the buffer value from the underlying C struct.
@@ -2,23 +2,20 @@
 
 """Interface to the `struct vaccel_config` C object."""
 
-import logging
-
-from ._c_types import CStr, CType
+from ._c_types import CStr, OwnedCType
 from ._libvaccel import ffi, lib
 from .error import FFIError, NullPointerError
 
-logger = logging.getLogger(__name__)
-
 
-class Config(CType):
+class Config(OwnedCType):
     """Wrapper for the `struct vaccel_config` C object.
 
     Manages the creation and initialization of a C `struct vaccel_config` and
     provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _plugins (str): Colon-separated list of plugin names to load.
@@ -89,24 +86,19 @@ class Config(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_config` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If resource deletion fails.
         """
-        ret = lib.vaccel_config_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_config_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete resource")
-        self._c_obj = ffi.NULL
-
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Config")
 
     @property
     def plugins(self) -> str:
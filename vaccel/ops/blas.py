@@ -2,10 +2,32 @@
 
 """Blas operations."""
 
+import itertools
+import os
+import queue
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final
+
 from vaccel._c_types import CList
+from vaccel._c_types.utils import typed_c_array
+from vaccel._lazy import LazyModule, is_available
 from vaccel._libvaccel import lib
 from vaccel.error import FFIError
 
+if TYPE_CHECKING:
+    from vaccel.session import BaseSession
+
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+DEFAULT_TILE_SIZE: Final[int] = 2048
+
+
+def _matrix_len(rows: int, cols: int, ld: int) -> int:
+    # Elements spanned by a row-major matrix with leading dimension `ld`
+    return (rows - 1) * ld + cols if rows > 0 and cols > 0 else 0
+
 
 class BlasMixin:
     """Mixin providing Blas operations for a `Session`.
@@ -24,17 +46,24 @@ class BlasMixin:
         n: int,
         k: int,
         alpha: float,
-        a: list[float],
+        a: Any,
         lda: int,
-        b: list[float],
+        b: Any,
         ldb: int,
         beta: float,
         ldc: int,
-    ) -> list[float]:
+        *,
+        out: Any = None,
+    ) -> Any:
         """Performs the SGEMM operation.
 
         Wraps the `vaccel_sgemm()` C operation.
 
+        Float32 NumPy arrays and buffers (e.g. `memoryview`, `array.array`) are
+        passed to C without copying; NumPy arrays of other types are converted.
+        If both `a` and `b` are lists and no `out` is given, the matrices are
+        marshalled element by element and the result is returned as a list.
+
         Args:
             m: The number of rows in matrix A and matrix C.
             n: The number of columns in matrix B and matrix C.
@@ -46,16 +75,40 @@ class BlasMixin:
             ldb: The leading dimension of matrix B (usually k).
             beta: Scalar multiplier for matrix C.
             ldc: The leading dimension of matrix C (usually m).
+            out: A writable float32 buffer of matrix C, with leading dimension
+                `ldc`, to write the result to. Its contents are scaled by
+                `beta` and added to the result.
 
         Returns:
-            The resulting matrix C in row-major order with shape (m, n).
+            The resulting matrix C in row-major order with shape (m, n); `out`
+            if given, a list for list input or a C-contiguous NumPy array
+            otherwise. If `ldc` is larger than `n`, the array is a copy of the
+            first `n` columns of the matrix written by C.
 
         Raises:
+            TypeError: If a matrix is not a C-contiguous float32 buffer, or
+                `out` is read-only.
+            ValueError: If a matrix is smaller than its dimensions require.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_a = CList(a)
-        c_b = CList(b)
-        c_c = CList([float(0)] * m * n)
+        if out is None and isinstance(a, list) and isinstance(b, list):
+            # Slow path: marshal the matrices element by element
+            c = CList([float(0)] * m * n)
+            c_a, c_b, c_c = CList(a)._c_ptr, CList(b)._c_ptr, c._c_ptr
+        else:
+            c_a = typed_c_array(a, "float", _matrix_len(m, k, lda))
+            c_b = typed_c_array(b, "float", _matrix_len(k, n, ldb))
+            if out is not None:
+                c = out
+            elif HAS_NUMPY:
+                c = np.zeros((m, ldc), dtype=np.float32)
+            else:
+                msg = "NumPy is not available"
+                raise NotImplementedError(msg)
+            c_c = typed_c_array(
+                c, "float", _matrix_len(m, n, ldc), writable=True
+            )
 
         ret = lib.vaccel_sgemm(
             self._c_ptr_or_raise,
@@ -63,15 +116,278 @@ class BlasMixin:
             n,
             k,
             alpha,
-            c_a._c_ptr,
+            c_a,
             lda,
-            c_b._c_ptr,
+            c_b,
             ldb,
             beta,
-            c_c._c_ptr,
+            c_c,
             ldc,
         )
         if ret != 0:
             raise FFIError(ret, "SGEMM failed")
 
-        return c_c.value
+        if isinstance(c, CList):
+            return c.value
+        if out is not None or ldc == n:
+            return c
+        return np.ascontiguousarray(c[:, :n])
+
+    def sgemm_batched(
+        self,
+        a: Any,
+        b: Any,
+        out: Any = None,
+        alpha: float = 1.0,
+        beta: float = 0.0,
+    ) -> "np.ndarray":
+        """Performs a batch of same-shaped SGEMM operations.
+
+        Computes `out[i] = alpha * a[i] @ b[i] + beta * out[i]` for each matrix
+        of the batch. The batches are passed to C as contiguous buffers and
+        `vaccel_sgemm()` is called for each matrix from C, so the whole batch
+        costs a single FFI call.
+
+        Args:
+            a: The matrices A, with shape (batch, m, k).
+            b: The matrices B, with shape (batch, k, n), or a single matrix B
+                with shape (k, n) to multiply every matrix A with.
+            out: A writable, C-contiguous float32 array with shape
+                (batch, m, n) to write the result to. Its contents are scaled
+                by `beta` and added to the result.
+            alpha: Scalar multiplier for the matrix products. Defaults to 1.0.
+            beta: Scalar multiplier for `out`. Defaults to 0.0.
+
+        Returns:
+            The resulting matrices C with shape (batch, m, n); `out` if given.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            ValueError: If the shapes of the matrices do not match.
+            TypeError: If `out` is not a writable, C-contiguous float32 array.
+            FFIError: If the C operation fails.
+        """
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        a = np.ascontiguousarray(a, dtype=np.float32)
+        b = np.ascontiguousarray(b, dtype=np.float32)
+        if a.ndim != 3 or b.ndim not in {2, 3}:  # noqa: PLR2004
+            msg = (
+                f"Expected A with 3 and B with 2 or 3 dimensions, got "
+                f"{a.ndim} and {b.ndim}"
+            )
+            raise ValueError(msg)
+
+        batch, m, k = a.shape
+        n = b.shape[-1]
+        batched_b = b.ndim == a.ndim
+        if b.shape[-2] != k or (batched_b and b.shape[0] != batch):
+            msg = f"Shapes {a.shape} and {b.shape} do not match"
+            raise ValueError(msg)
+
+        if out is None:
+            out = np.zeros((batch, m, n), dtype=np.float32)
+        elif np.shape(out) != (batch, m, n):
+            msg = (
+                f"Expected out with shape {(batch, m, n)}, got {np.shape(out)}"
+            )
+            raise ValueError(msg)
+
+        c_a = typed_c_array(a, "float")
+        c_b = typed_c_array(b, "float")
+        c_out = typed_c_array(out, "float", writable=True)
+
+        ret = lib.vaccel_py_sgemm_batched(
+            self._c_ptr_or_raise,
+            batch,
+            m,
+            n,
+            k,
+            alpha,
+            c_a,
+            m * k,
+            k,
+            c_b,
+            k * n if batched_b else 0,
+            n,
+            beta,
+            c_out,
+            m * n,
+            n,
+        )
+        if ret != 0:
+            raise FFIError(ret, "Batched SGEMM failed")
+
+        return out
+
+
+def _open_matrix(matrix: Any, name: str) -> "np.ndarray":
+    if isinstance(matrix, (str, os.PathLike)):
+        matrix = np.load(matrix, mmap_mode="r")
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:  # noqa: PLR2004
+        msg = f"Expected a 2-D matrix {name}, got {matrix.ndim} dimensions"
+        raise ValueError(msg)
+    return matrix
+
+
+def _open_output(out: Any, shape: tuple[int, int]) -> "np.ndarray":
+    if out is None:
+        return np.zeros(shape, dtype=np.float32)
+    if isinstance(out, (str, os.PathLike)):
+        return np.lib.format.open_memmap(
+            out, mode="w+", dtype=np.float32, shape=shape
+        )
+    if np.shape(out) != shape:
+        msg = f"Expected out with shape {shape}, got {np.shape(out)}"
+        raise ValueError(msg)
+    return out
+
+
+class _TiledSgemm:
+    """Tiled SGEMM of matrices that are read block by block."""
+
+    def __init__(
+        self,
+        a: "np.ndarray",
+        b: "np.ndarray",
+        out: "np.ndarray",
+        *,
+        alpha: float,
+        beta: float,
+        tile_size: tuple[int, int, int],
+    ):
+        self.a = a
+        self.b = b
+        self.out = out
+        self.alpha = alpha
+        self.beta = beta
+        self.tile_size = tile_size
+        self._idle = queue.SimpleQueue()
+
+    def _run_tile(self, i0: int, j0: int) -> None:
+        tile_m, tile_n, tile_k = self.tile_size
+        (m, k), n = self.a.shape, self.b.shape[1]
+        rows = slice(i0, min(i0 + tile_m, m))
+        cols = slice(j0, min(j0 + tile_n, n))
+        if self.beta:
+            c = np.multiply(self.out[rows, cols], self.beta, dtype=np.float32)
+        else:
+            c = np.zeros((rows.stop - i0, cols.stop - j0), dtype=np.float32)
+
+        for k0 in range(0, k, tile_k):
+            inner = slice(k0, min(k0 + tile_k, k))
+            a_tile = np.ascontiguousarray(self.a[rows, inner], np.float32)
+            b_tile = np.ascontiguousarray(self.b[inner, cols], np.float32)
+            # Sessions are only held for the operation itself, so other
+            # workers read their next blocks meanwhile
+            session = self._idle.get()
+            try:
+                session.sgemm(
+                    c.shape[0], c.shape[1], a_tile.shape[1], self.alpha,
+                    a_tile, a_tile.shape[1], b_tile, c.shape[1], 1.0,
+                    c.shape[1], out=c,
+                )  # fmt: skip
+            finally:
+                self._idle.put(session)
+
+        self.out[rows, cols] = c
+
+    def run(self, sessions: "Sequence[BaseSession]", max_workers: int) -> None:
+        for session in sessions:
+            self._idle.put(session)
+
+        tile_m, tile_n, _ = self.tile_size
+        m, n = self.out.shape
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="vaccel-sgemm"
+        ) as executor:
+            futures = [
+                executor.submit(self._run_tile, i0, j0)
+                for i0, j0 in itertools.product(
+                    range(0, m, tile_m), range(0, n, tile_n)
+                )
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+def sgemm_tiled(
+    sessions: "BaseSession | Sequence[BaseSession]",
+    a: Any,
+    b: Any,
+    out: Any = None,
+    *,
+    alpha: float = 1.0,
+    beta: float = 0.0,
+    tile_size: int | tuple[int, int, int] = DEFAULT_TILE_SIZE,
+    max_workers: int | None = None,
+) -> "np.ndarray":
+    """Performs an out-of-core SGEMM operation in tiles across sessions.
+
+    Computes `out = alpha * a @ b + beta * out` by splitting the output into
+    tiles. Each tile is accumulated over blocks of the inner dimension with
+    `Session.sgemm()`, reading the input blocks from the (possibly
+    memory-mapped) matrices on demand, so only the tiles in flight are held
+    in memory. Tiles are processed concurrently; each session runs one
+    operation at a time, while the other workers read their next blocks.
+
+    Args:
+        sessions: The session, or sessions, to run the tile operations on.
+        a: The matrix A with shape (m, k); an array (e.g. a `numpy.memmap`) or
+            the path of a `.npy` file to memory-map.
+        b: The matrix B with shape (k, n); an array or the path of a `.npy`
+            file to memory-map.
+        out: The matrix C with shape (m, n) to write the result to; a
+            writable array or the path of a `.npy` file to create. Defaults to
+            a new float32 array.
+        alpha: Scalar multiplier for the matrix product. Defaults to 1.0.
+        beta: Scalar multiplier for `out`. Defaults to 0.0.
+        tile_size: The tile size of the m, n and k dimensions, or a single
+            size for all. Defaults to `DEFAULT_TILE_SIZE`.
+        max_workers: The number of concurrent tiles. Defaults to twice the
+            number of sessions.
+
+    Returns:
+        The resulting matrix C; `out`, or the memory-mapped file, if given.
+
+    Raises:
+        NotImplementedError: If NumPy is not installed.
+        ValueError: If no sessions are given or the shapes of the matrices do
+            not match.
+        FFIError: If a tile operation fails.
+    """
+    if not HAS_NUMPY:
+        msg = "NumPy is not available"
+        raise NotImplementedError(msg)
+
+    if not isinstance(sessions, Sequence):
+        sessions = [sessions]
+    if not sessions:
+        msg = "At least one session is required"
+        raise ValueError(msg)
+
+    a = _open_matrix(a, "A")
+    b = _open_matrix(b, "B")
+    if b.shape[0] != a.shape[1]:
+        msg = f"Shapes {a.shape} and {b.shape} do not match"
+        raise ValueError(msg)
+    out = _open_output(out, (a.shape[0], b.shape[1]))
+
+    if isinstance(tile_size, int):
+        tile_size = (tile_size, tile_size, tile_size)
+    if max_workers is None:
+        max_workers = 2 * len(sessions)
+    tiled = _TiledSgemm(a, b, out, alpha=alpha, beta=beta, tile_size=tile_size)
+    tiled.run(sessions, max_workers)
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
@@ -12,6 +12,15 @@ from vaccel.error import FFIError
 from vaccel.resource import Resource
 
 
+def _to_args(items: list[Any]) -> list[Arg]:
+    """Wraps the non-`Arg` items as `Arg` objects.
+
+    The C objects of the args are deferred, so they are all created in one
+    pass when the args are wrapped in a `CList`.
+    """
+    return [i if isinstance(i, Arg) else Arg(i) for i in items]
+
+
 class ExecMixin:
     """Mixin providing the Exec operations for a `Session`.
 
@@ -51,9 +60,7 @@ class ExecMixin:
             FFIError: If the C operation fails.
         """
         if arg_read is not None:
-            c_arg_read = CList(
-                [arg if isinstance(arg, Arg) else Arg(arg) for arg in arg_read]
-            )
+            c_arg_read = CList(_to_args(arg_read))
             c_arg_read_ptr = c_arg_read._c_ptr
             c_arg_read_len = len(c_arg_read)
         else:
@@ -62,9 +69,7 @@ class ExecMixin:
             c_arg_read_len = 0
 
         if arg_write is not None:
-            c_arg_write = CList(
-                [arg if isinstance(arg, Arg) else Arg(arg) for arg in arg_write]
-            )
+            c_arg_write = CList(_to_args(arg_write))
             c_arg_write_ptr = c_arg_write._c_ptr
             c_arg_write_len = len(c_arg_write)
         else:
@@ -116,9 +121,7 @@ class ExecMixin:
             FFIError: If the C operation fails.
         """
         if arg_read is not None:
-            c_arg_read = CList(
-                [arg if isinstance(arg, Arg) else Arg(arg) for arg in arg_read]
-            )
+            c_arg_read = CList(_to_args(arg_read))
             c_arg_read_ptr = c_arg_read._c_ptr
             c_arg_read_len = len(c_arg_read)
         else:
@@ -127,9 +130,7 @@ class ExecMixin:
             c_arg_read_len = 0
 
         if arg_write is not None:
-            c_arg_write = CList(
-                [arg if isinstance(arg, Arg) else Arg(arg) for arg in arg_write]
-            )
+            c_arg_write = CList(_to_args(arg_write))
             c_arg_write_ptr = c_arg_write._c_ptr
             c_arg_write_len = len(c_arg_write)
         else:
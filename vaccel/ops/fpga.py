@@ -2,10 +2,136 @@
 
 """FPGA operations."""
 
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final
+
 from vaccel._c_types import CList
-from vaccel._libvaccel import lib
+from vaccel._c_types.utils import c_type_to_typestr, typed_c_array
+from vaccel._lazy import LazyModule, is_available
+from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError
 
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+DEFAULT_CHUNK_SIZE: Final[int] = 1 << 20
+
+
+def _out_array(out: Any, c_type: str, length: int) -> (Any, ffi.CData):
+    """Returns an output array and its C array, allocating it if needed."""
+    if out is None:
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+        out = np.empty(length, dtype=c_type_to_typestr(c_type))
+    return out, typed_c_array(out, c_type, length, writable=True)
+
+
+def _iter_chunks(source: Any, chunk_size: int) -> Iterator[Any]:
+    """Yields the chunks of an array, or the items of an iterable of chunks."""
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).endswith(".npy"):
+            source = np.load(source, mmap_mode="r")
+        else:
+            source = np.memmap(source, dtype=np.float32, mode="r")
+    if not isinstance(source, np.ndarray):
+        try:
+            source = np.asarray(memoryview(source))
+        except TypeError:
+            yield from source
+            return
+    source = source.reshape(-1)
+    for start in range(0, len(source), chunk_size):
+        yield source[start : start + chunk_size]
+
+
+def _stream_chunks(
+    op: Callable[..., Any],
+    inputs: tuple[Any, ...],
+    outputs: tuple[Any, ...],
+    chunk_size: int,
+) -> Iterator[tuple[Any, ...]]:
+    """Runs `op` over the chunks of `inputs`, yielding its outputs per chunk.
+
+    Chunks are marshalled into two rotating sets of float32 staging buffers by
+    a helper thread, so chunk i+1 is copied while chunk i executes. Results are
+    written to slices of `outputs`, or to two rotating sets of result buffers
+    if the outputs are `None`.
+    """
+    chunks = zip(
+        *(_iter_chunks(source, chunk_size) for source in inputs), strict=True
+    )
+    staging = [
+        [np.empty(chunk_size, dtype=np.float32) for _ in inputs]
+        for _ in range(2)
+    ]
+    results = None
+    if outputs[0] is None:
+        results = [
+            [np.empty(chunk_size, dtype=np.float32) for _ in outputs]
+            for _ in range(2)
+        ]
+
+    def marshal(slot: int) -> int | None:
+        parts = next(chunks, None)
+        if parts is None:
+            return None
+        parts = [np.ravel(part) for part in parts]
+        length = len(parts[0])
+        if any(len(part) != length for part in parts):
+            msg = "Expected input chunks of equal length"
+            raise ValueError(msg)
+        if length > chunk_size:
+            msg = f"Expected chunks of at most {chunk_size} elements"
+            raise ValueError(msg)
+        for buf, part in zip(staging[slot], parts, strict=True):
+            np.copyto(buf[:length], part, casting="same_kind")
+        return length
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="vaccel-fpga-stream"
+    ) as executor:
+        pending = executor.submit(marshal, 0)
+        slot, offset = 0, 0
+        while (length := pending.result()) is not None:
+            pending = executor.submit(marshal, 1 - slot)
+            if results is None:
+                outs = [out[offset : offset + length] for out in outputs]
+            else:
+                outs = [buf[:length] for buf in results[slot]]
+            op(*(buf[:length] for buf in staging[slot]), *outs)
+            yield tuple(outs)
+            slot, offset = 1 - slot, offset + length
+
+
+def _stream(
+    op: Callable[..., Any],
+    inputs: tuple[Any, ...],
+    outputs: tuple[Any, ...],
+    chunk_size: int,
+) -> Iterator[tuple[Any, ...]] | tuple[Any, ...]:
+    """Streams `inputs` through `op`.
+
+    Returns a generator of the outputs per chunk if no `outputs` are given, or
+    the `outputs` after writing the results to them.
+    """
+    if not HAS_NUMPY:
+        msg = "NumPy is not available"
+        raise NotImplementedError(msg)
+    if chunk_size < 1:
+        msg = f"Expected a positive chunk size, got {chunk_size}"
+        raise ValueError(msg)
+    if all(out is None for out in outputs):
+        return _stream_chunks(op, inputs, outputs, chunk_size)
+    if any(out is None for out in outputs):
+        msg = "Expected either all or none of the outputs"
+        raise ValueError(msg)
+    for _ in _stream_chunks(op, inputs, outputs, chunk_size):
+        pass
+    return outputs
+
 
 class FpgaMixin:
     """Mixin providing the FPGA operations for a `Session`.
@@ -13,73 +139,112 @@ class FpgaMixin:
     This mixin is intended to be used in combination with `BaseSession` and
     should not be instantiated on its own.
 
+    Matrices can be given as lists, or as NumPy arrays or buffers (e.g.
+    `memoryview`, `array.array`) of the C element type, which are passed to C
+    without copying. List input is marshalled element by element and returns
+    lists; any other input returns NumPy arrays, or the given `out` buffers.
+
     Intended usage:
         class Session(BaseSession, FPGAMixin):
             ...
     """
 
-    def fpga_arraycopy(self, a: list[int]) -> list[int]:
+    def fpga_arraycopy(self, a: Any, *, out: Any = None) -> Any:
         """Performs the matrix copying operation.
 
         Wraps the `vaccel_fpga_arraycopy()` C operation.
 
         Args:
-            a: The matrix A to be copied.
+            a: The matrix A to be copied; a list or an int32 array.
+            out: A writable int32 buffer to copy the matrix to.
 
         Returns:
             A copy of the matrix A.
 
         Raises:
+            TypeError: If a matrix is not a C-contiguous int32 buffer, or `out`
+                is read-only.
+            ValueError: If `out` is smaller than the matrix A.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_a = CList(a)
-        c_out_a = CList([0] * len(a))
+        if isinstance(a, list) and out is None:
+            c_a = CList(a)
+            c_out_a = CList([0] * len(a))
+            c_a_ptr, c_out_ptr = c_a._c_ptr, c_out_a._c_ptr
+        else:
+            c_a_ptr = typed_c_array(a, "int")
+            out, c_out_ptr = _out_array(out, "int", len(c_a_ptr))
 
         ret = lib.vaccel_fpga_arraycopy(
-            self._c_ptr_or_raise, c_a._c_ptr, c_out_a._c_ptr, len(c_a)
+            self._c_ptr_or_raise, c_a_ptr, c_out_ptr, len(c_a_ptr)
         )
         if ret != 0:
             raise FFIError(ret, "FPGA array copy failed")
 
-        return [int(item) for item in c_out_a.value]
+        if out is None:
+            return [int(item) for item in c_out_a.value]
+        return out
 
-    def fpga_mmult(self, a: list[float], b: list[float]) -> list[float]:
+    def fpga_mmult(self, a: Any, b: Any, *, out: Any = None) -> Any:
         """Performs the matrix multiplication operation.
 
         Wraps the `vaccel_fpga_mmult()` C operation.
 
         Args:
-            a: A matrix A.
-            b: A matrix B.
+            a: A matrix A; a list or a float32 array.
+            b: A matrix B; a list or a float32 array.
+            out: A writable float32 buffer to write the result to.
 
         Returns:
             The multiplication result of matrices A and B.
 
         Raises:
+            TypeError: If a matrix is not a C-contiguous float32 buffer, or
+                `out` is read-only.
+            ValueError: If B or `out` is smaller than the matrix A.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_a = CList(a)
-        c_b = CList(b)
-        c_c = CList([float(0)] * len(a))
+        if isinstance(a, list) and isinstance(b, list) and out is None:
+            c_a = CList(a)
+            c_b = CList(b)
+            c_c = CList([float(0)] * len(a))
+            c_a_ptr, c_b_ptr, c_c_ptr = c_a._c_ptr, c_b._c_ptr, c_c._c_ptr
+        else:
+            c_a_ptr = typed_c_array(a, "float")
+            c_b_ptr = typed_c_array(b, "float", len(c_a_ptr))
+            out, c_c_ptr = _out_array(out, "float", len(c_a_ptr))
 
         ret = lib.vaccel_fpga_mmult(
-            self._c_ptr_or_raise, c_a._c_ptr, c_b._c_ptr, c_c._c_ptr, len(c_a)
+            self._c_ptr_or_raise, c_a_ptr, c_b_ptr, c_c_ptr, len(c_a_ptr)
         )
         if ret != 0:
             raise FFIError(ret, "FPGA matrix multiplication failed")
 
-        return [float(item) for item in c_c.value]
+        if out is None:
+            return [float(item) for item in c_c.value]
+        return out
 
     def fpga_parallel(
-        self, a: list[float], b: list[float]
-    ) -> (list[float], list[float]):
+        self,
+        a: Any,
+        b: Any,
+        *,
+        out_add: Any = None,
+        out_mult: Any = None,
+    ) -> (Any, Any):
         """Performs the parallel matrix addition and multiplication operation.
 
         Wraps the `vaccel_fpga_parallel()` C operation.
 
         Args:
-            a: A matrix A.
-            b: A matrix B.
+            a: A matrix A; a list or a float32 array.
+            b: A matrix B; a list or a float32 array.
+            out_add: A writable float32 buffer to write the addition result
+                to.
+            out_mult: A writable float32 buffer to write the multiplication
+                result to.
 
         Returns:
             A tuple containing:
@@ -87,59 +252,145 @@ class FpgaMixin:
                 - The result of the multiplication of matrices A and B.
 
         Raises:
+            TypeError: If a matrix is not a C-contiguous float32 buffer, or an
+                output is read-only.
+            ValueError: If B or an output is smaller than the matrix A.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_a = CList(a)
-        c_b = CList(b)
-        c_add_output = CList([float(0)] * len(a))
-        c_mult_output = CList([float(0)] * len(a))
+        if (
+            isinstance(a, list)
+            and isinstance(b, list)
+            and out_add is None
+            and out_mult is None
+        ):
+            c_a = CList(a)
+            c_b = CList(b)
+            c_add_output = CList([float(0)] * len(a))
+            c_mult_output = CList([float(0)] * len(a))
+            c_a_ptr, c_b_ptr = c_a._c_ptr, c_b._c_ptr
+            c_add_ptr, c_mult_ptr = c_add_output._c_ptr, c_mult_output._c_ptr
+            is_list = True
+        else:
+            c_a_ptr = typed_c_array(a, "float")
+            c_b_ptr = typed_c_array(b, "float", len(c_a_ptr))
+            out_add, c_add_ptr = _out_array(out_add, "float", len(c_a_ptr))
+            out_mult, c_mult_ptr = _out_array(out_mult, "float", len(c_a_ptr))
+            is_list = False
 
         ret = lib.vaccel_fpga_parallel(
             self._c_ptr_or_raise,
-            c_a._c_ptr,
-            c_b._c_ptr,
-            c_add_output._c_ptr,
-            c_mult_output._c_ptr,
-            len(c_a),
+            c_a_ptr,
+            c_b_ptr,
+            c_add_ptr,
+            c_mult_ptr,
+            len(c_a_ptr),
         )
         if ret != 0:
             raise FFIError(
                 ret, "FPGA parallel matrix addition and multiplication failed"
             )
 
-        return (
-            [float(item) for item in c_add_output.value],
-            [float(item) for item in c_mult_output.value],
-        )
+        if is_list:
+            return (
+                [float(item) for item in c_add_output.value],
+                [float(item) for item in c_mult_output.value],
+            )
+        return (out_add, out_mult)
 
-    def fpga_vadd(self, a: list[float], b: list[float]) -> list[float]:
+    def fpga_vadd(self, a: Any, b: Any, *, out: Any = None) -> Any:
         """Performs the matrix addition operation.
 
         Wraps the `vaccel_fpga_vadd()` C operation.
 
         Args:
-            a: A matrix A.
-            b: A matrix B.
+            a: A matrix A; a list or a float32 array.
+            b: A matrix B; a list or a float32 array.
+            out: A writable float32 buffer to write the result to.
 
         Returns:
             The addition result of matrices A and B.
 
         Raises:
+            TypeError: If a matrix is not a C-contiguous float32 buffer, or
+                `out` is read-only.
+            ValueError: If `out` is smaller than the matrix A.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_a = CList(a)
-        c_b = CList(b)
-        c_c = CList([float(0)] * len(a))
+        if isinstance(a, list) and isinstance(b, list) and out is None:
+            c_a = CList(a)
+            c_b = CList(b)
+            c_c = CList([float(0)] * len(a))
+            c_a_ptr, c_b_ptr, c_c_ptr = c_a._c_ptr, c_b._c_ptr, c_c._c_ptr
+            len_a, len_b = len(c_a), len(c_b)
+        else:
+            c_a_ptr = typed_c_array(a, "float")
+            c_b_ptr = typed_c_array(b, "float")
+            out, c_c_ptr = _out_array(out, "float", len(c_a_ptr))
+            len_a, len_b = len(c_a_ptr), len(c_b_ptr)
 
         ret = lib.vaccel_fpga_vadd(
             self._c_ptr_or_raise,
-            c_a._c_ptr,
-            c_b._c_ptr,
-            c_c._c_ptr,
-            len(c_a),
-            len(c_b),
+            c_a_ptr,
+            c_b_ptr,
+            c_c_ptr,
+            len_a,
+            len_b,
         )
         if ret != 0:
             raise FFIError(ret, "FPGA vector addition failed")
 
-        return [float(item) for item in c_c.value]
+        if out is None:
+            return [float(item) for item in c_c.value]
+        return out
+
+    def fpga_vadd_stream(
+        self,
+        a: Any,
+        b: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        out: Any = None,
+    ) -> Any:
+        """Performs the matrix addition operation over large data in chunks.
+
+        Streams the matrices through `fpga_vadd()` in chunks of `chunk_size`
+        elements. While a chunk executes, the next one is converted to float32
+        and copied to a second set of staging buffers by a helper thread, so
+        memory use is bounded by the chunk size.
+
+        Only the element-wise addition is streamed; a matrix multiplication
+        cannot be computed from independent chunks of its inputs.
+
+        Args:
+            a: The matrix A; a float32-compatible array (e.g. a `numpy.memmap`),
+                the path of a `.npy` or raw float32 file to memory-map, or an
+                iterable of chunks.
+            b: The matrix B; same as `a`. Iterables of chunks must yield
+                chunks of the same lengths as `a`.
+            chunk_size: The maximum number of elements per chunk. Defaults to
+                `DEFAULT_CHUNK_SIZE`.
+            out: A writable float32 array with the length of the matrices (e.g.
+                a writable `numpy.memmap`) to write the result to.
+
+        Returns:
+            `out` if given. Otherwise, a generator of the result chunks; each
+            chunk is a view of a reused buffer that is only valid until the
+            next chunk is requested.
+
+        Raises:
+            ValueError: If the chunks of the matrices differ in length or
+                exceed `chunk_size`, or `out` is smaller than the matrices.
+            NotImplementedError: If NumPy is not installed.
+            FFIError: If the C operation fails.
+        """
+        result = _stream(
+            lambda a, b, c: self.fpga_vadd(a, b, out=c),
+            (a, b),
+            (out,),
+            chunk_size,
+        )
+        if out is None:
+            return (c for (c,) in result)
+        return out
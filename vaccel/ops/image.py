@@ -2,34 +2,238 @@
 
 """Image-related operations."""
 
+import mmap
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from functools import partial
+from pathlib import Path
+from typing import Any
+
 from vaccel._c_types import CBytes
-from vaccel._libvaccel import lib
+from vaccel._c_types.arena import scratch_arena
+from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError
 
 
+def _image_buffer(
+    image: Any, *, prefetch: bool = False
+) -> bytes | bytearray | memoryview:
+    """Returns the image data as a bytes-like object, without copying it.
+
+    Files are memory-mapped; the mapping is released once the returned buffer
+    is no longer referenced. With `prefetch`, the kernel is advised to start
+    reading the file in the background.
+    """
+    if isinstance(image, (bytes, bytearray)):
+        return image
+    if isinstance(image, (str, os.PathLike)):
+        with Path(image).open("rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return b""
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if prefetch and hasattr(mmap, "MADV_WILLNEED"):
+            mapping.madvise(mmap.MADV_WILLNEED)
+        return memoryview(mapping)
+    try:
+        view = memoryview(image)
+    except TypeError:
+        msg = (
+            "Expected image data as bytes, a buffer or a path, got "
+            f"'{type(image).__name__}'"
+        )
+        raise TypeError(msg) from None
+    if view.itemsize != 1 or not view.c_contiguous:
+        msg = (
+            "Expected a C-contiguous buffer of bytes, got format "
+            f"'{view.format}'"
+        )
+        raise TypeError(msg)
+    return view.cast("B")
+
+
+def _classify(session: Any, img: CBytes, outs: list[ffi.CData]) -> (str, str):
+    """Runs the image classification operation with the given output buffers."""
+    out_text, out_imgname = outs
+    ret = lib.vaccel_image_classification(
+        session._c_ptr_or_raise,
+        img._c_ptr,
+        out_text,
+        out_imgname,
+        len(img),
+        len(out_text),
+        len(out_imgname),
+    )
+    if ret:
+        raise FFIError(ret, "Image classification failed")
+
+    return (
+        ffi.string(out_text).decode(),
+        ffi.string(out_imgname).decode(),
+    )
+
+
+def _imgname_op(
+    c_func: Callable[..., int],
+    error: str,
+    session: Any,
+    img: CBytes,
+    outs: list[ffi.CData],
+) -> str:
+    """Runs an image operation that outputs an image filename."""
+    (out_imgname,) = outs
+    ret = c_func(
+        session._c_ptr_or_raise,
+        img._c_ptr,
+        out_imgname,
+        len(img),
+        len(out_imgname),
+    )
+    if ret:
+        raise FFIError(ret, error)
+
+    return ffi.string(out_imgname).decode()
+
+
+_detect = partial(
+    _imgname_op, lib.vaccel_image_detection, "Image detection failed"
+)
+_segment = partial(
+    _imgname_op, lib.vaccel_image_segmentation, "Image segmentation failed"
+)
+_pose = partial(
+    _imgname_op, lib.vaccel_image_pose, "Image pose estimation failed"
+)
+_depth = partial(
+    _imgname_op, lib.vaccel_image_depth, "Image depth estimation failed"
+)
+
+
+def _borrow_outputs(
+    stack: ExitStack, count: int, length: int
+) -> list[ffi.CData]:
+    """Borrows `count` output buffers from the arena of the calling thread."""
+    arena = scratch_arena()
+    return [
+        stack.enter_context(arena.borrow("char", length)) for _ in range(count)
+    ]
+
+
+def _run(session: Any, op: Callable[..., Any], image: Any, count: int) -> Any:
+    """Runs an image operation on a single image."""
+    img = CBytes(_image_buffer(image))
+    with ExitStack() as stack:
+        return op(session, img, _borrow_outputs(stack, count, session._out_len))
+
+
+def _batch_workers(workers: int | None, count: int) -> int:
+    """Returns the number of workers to run a batch of `count` images with."""
+    if workers is None:
+        return max(1, min(count, os.cpu_count() or 1))
+    if workers < 1:
+        msg = f"Expected a positive number of workers, got {workers}"
+        raise ValueError(msg)
+    return min(workers, max(count, 1))
+
+
+def _run_batch(
+    session: Any,
+    op: Callable[..., Any],
+    images: Sequence[Any],
+    count: int,
+    workers: int | None,
+) -> list[Any]:
+    """Runs an image operation on a batch of images with a pool of workers.
+
+    Each worker borrows its output buffers once and reuses them for all the
+    images it processes; images are handed out to workers one at a time. With
+    more than one worker, each worker runs on a clone of `session` (see
+    `BaseSession.clone()`).
+    """
+    images = list(images)
+    workers = _batch_workers(workers, len(images))
+    if not images:
+        return []
+
+    results = [None] * len(images)
+    indices = iter(range(len(images)))
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def work() -> None:
+        with ExitStack() as stack:
+            worker_session = stack.enter_context(
+                nullcontext(session) if workers == 1 else session.clone()
+            )
+            outs = _borrow_outputs(stack, count, session._out_len)
+            while not failed.is_set():
+                with lock:
+                    index = next(indices, None)
+                if index is None:
+                    return
+                for out in outs:
+                    out[0] = b"\0"
+                try:
+                    results[index] = op(
+                        worker_session,
+                        CBytes(_image_buffer(images[index])),
+                        outs,
+                    )
+                except BaseException:
+                    failed.set()
+                    raise
+
+    if workers == 1:
+        work()
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="vaccel-image"
+    ) as executor:
+        futures = [executor.submit(work) for _ in range(workers)]
+    for future in futures:
+        future.result()
+    return results
+
+
 class ImageMixin:
     """Mixin providing image operations for a `Session`.
 
     This mixin is intended to be used in combination with `BaseSession` and
     should not be instantiated on its own.
 
+    The `*_batch()` operations run a list of images concurrently on a bounded
+    number of worker threads. With more than one worker, each worker runs its
+    images on its own session, created with the flags and registered resources
+    of this session (see `BaseSession.clone()`) and reused by later batches.
+    Each worker reuses its output buffers for all of its images.
+
+    Images can be given as bytes-like objects, uint8 NumPy arrays or other
+    byte buffers, or paths of image files, which are memory-mapped. The image
+    data is passed to C without copying.
+
     Intended usage:
         class Session(BaseSession, ImageMixin):
             ...
 
     Attributes:
-        _out_len (int): The maximum length of the output buffers
+        _out_len (int): The maximum length of the output buffers. Read-only;
+            the buffers themselves are per-thread, so sessions can run image
+            operations concurrently.
     """
 
     _out_len = 512
 
-    def classify(self, image: bytes) -> (str, str):
+    def classify(self, image: Any) -> (str, str):
         """Performs the image classification operation.
 
         Wraps the `vaccel_image_classification()` C operation.
 
         Args:
-            image: The image data as a `bytes` object.
+            image: The image data; a bytes-like object, a uint8 array or
+                buffer, or the path of an image file.
 
         Returns:
             A tuple containing:
@@ -37,138 +241,194 @@ class ImageMixin:
                 - The resulting image filename.
 
         Raises:
+            TypeError: If the image is not a C-contiguous byte buffer or a
+                path.
             FFIError: If the C operation fails.
         """
-        img = CBytes(image)
-        out_text = CBytes(bytearray(self._out_len))
-        out_imgname = CBytes(bytearray(self._out_len))
-
-        ret = lib.vaccel_image_classification(
-            self._c_ptr_or_raise,
-            img._c_ptr,
-            out_text._c_ptr,
-            out_imgname._c_ptr,
-            len(img),
-            len(out_text),
-            len(out_imgname),
-        )
-        if ret:
-            raise FFIError(ret, "Image classification failed")
+        return _run(self, _classify, image, 2)
+
+    def classify_batch(
+        self, images: Sequence[Any], *, workers: int | None = None
+    ) -> list[tuple[str, str]]:
+        """Performs the image classification operation on a batch of images.
+
+        Args:
+            images: The image data of each image (see the single image
+                operation).
+            workers: The maximum number of worker threads, bounded by the
+                number of images. Defaults to the number of CPUs.
 
-        return out_text.to_str(), out_imgname.to_str()
+        Returns:
+            A list with the result of `classify()` for each image, in order.
 
-    def detect(self, image: bytes) -> str:
+        Raises:
+            TypeError: If an image is not a C-contiguous byte buffer or a
+                path.
+            ValueError: If `workers` is not positive.
+            FFIError: If the C operation fails.
+        """
+        return _run_batch(self, _classify, images, 2, workers)
+
+    def detect(self, image: Any) -> str:
         """Performs the image detection operation.
 
         Wraps the `vaccel_image_detection()` C operation.
 
         Args:
-            image: The image data as a `bytes` object.
+            image: The image data; a bytes-like object, a uint8 array or
+                buffer, or the path of an image file.
 
         Returns:
             The resulting image filename.
 
         Raises:
+            TypeError: If the image is not a C-contiguous byte buffer or a
+                path.
             FFIError: If the C operation fails.
         """
-        img = CBytes(image)
-        out_imgname = CBytes(bytearray(self._out_len))
-
-        ret = lib.vaccel_image_detection(
-            self._c_ptr_or_raise,
-            img._c_ptr,
-            out_imgname._c_ptr,
-            len(img),
-            len(out_imgname),
-        )
-        if ret:
-            raise FFIError(ret, "Image detection failed")
+        return _run(self, _detect, image, 1)
+
+    def detect_batch(
+        self, images: Sequence[Any], *, workers: int | None = None
+    ) -> list[str]:
+        """Performs the image detection operation on a batch of images.
 
-        return out_imgname.to_str()
+        Args:
+            images: The image data of each image (see the single image
+                operation).
+            workers: The maximum number of worker threads, bounded by the
+                number of images. Defaults to the number of CPUs.
+
+        Returns:
+            A list with the result of `detect()` for each image, in order.
+
+        Raises:
+            TypeError: If an image is not a C-contiguous byte buffer or a
+                path.
+            ValueError: If `workers` is not positive.
+            FFIError: If the C operation fails.
+        """
+        return _run_batch(self, _detect, images, 1, workers)
 
-    def segment(self, image: bytes) -> str:
+    def segment(self, image: Any) -> str:
         """Performs the image segmentation operations.
 
         Wraps the `vaccel_image_segmentation()` C operation.
 
         Args:
-            image: The image data as a `bytes` object.
+            image: The image data; a bytes-like object, a uint8 array or
+                buffer, or the path of an image file.
 
         Returns:
             The resulting image filename.
 
         Raises:
+            TypeError: If the image is not a C-contiguous byte buffer or a
+                path.
             FFIError: If the C operation fails.
         """
-        img = CBytes(image)
-        out_imgname = CBytes(bytearray(self._out_len))
-
-        ret = lib.vaccel_image_segmentation(
-            self._c_ptr_or_raise,
-            img._c_ptr,
-            out_imgname._c_ptr,
-            len(img),
-            len(out_imgname),
-        )
-        if ret:
-            raise FFIError(ret, "Image segmentation failed")
+        return _run(self, _segment, image, 1)
+
+    def segment_batch(
+        self, images: Sequence[Any], *, workers: int | None = None
+    ) -> list[str]:
+        """Performs the image segmentation operation on a batch of images.
+
+        Args:
+            images: The image data of each image (see the single image
+                operation).
+            workers: The maximum number of worker threads, bounded by the
+                number of images. Defaults to the number of CPUs.
 
-        return out_imgname.to_str()
+        Returns:
+            A list with the result of `segment()` for each image, in order.
+
+        Raises:
+            TypeError: If an image is not a C-contiguous byte buffer or a
+                path.
+            ValueError: If `workers` is not positive.
+            FFIError: If the C operation fails.
+        """
+        return _run_batch(self, _segment, images, 1, workers)
 
-    def pose(self, image: bytes) -> str:
+    def pose(self, image: Any) -> str:
         """Performs the image pose estimation operation.
 
         Wraps the `vaccel_image_pose()` C operation.
 
         Args:
-            image: The image data as a `bytes` object.
+            image: The image data; a bytes-like object, a uint8 array or
+                buffer, or the path of an image file.
 
         Returns:
             The resulting image filename.
 
         Raises:
+            TypeError: If the image is not a C-contiguous byte buffer or a
+                path.
             FFIError: If the C operation fails.
         """
-        img = CBytes(image)
-        out_imgname = CBytes(bytearray(self._out_len))
-
-        ret = lib.vaccel_image_pose(
-            self._c_ptr_or_raise,
-            img._c_ptr,
-            out_imgname._c_ptr,
-            len(img),
-            len(out_imgname),
-        )
-        if ret:
-            raise FFIError(ret, "Image pose estimation failed")
+        return _run(self, _pose, image, 1)
+
+    def pose_batch(
+        self, images: Sequence[Any], *, workers: int | None = None
+    ) -> list[str]:
+        """Performs the image pose estimation operation on a batch of images.
 
-        return out_imgname.to_str()
+        Args:
+            images: The image data of each image (see the single image
+                operation).
+            workers: The maximum number of worker threads, bounded by the
+                number of images. Defaults to the number of CPUs.
+
+        Returns:
+            A list with the result of `pose()` for each image, in order.
 
-    def depth(self, image: bytes) -> str:
+        Raises:
+            TypeError: If an image is not a C-contiguous byte buffer or a
+                path.
+            ValueError: If `workers` is not positive.
+            FFIError: If the C operation fails.
+        """
+        return _run_batch(self, _pose, images, 1, workers)
+
+    def depth(self, image: Any) -> str:
         """Performs the image depth estimation operation.
 
         Wraps the `vaccel_image_depth()` C operation.
 
         Args:
-            image: The image data as a `bytes` object.
+            image: The image data; a bytes-like object, a uint8 array or
+                buffer, or the path of an image file.
 
         Returns:
             The resulting image filename.
 
         Raises:
+            TypeError: If the image is not a C-contiguous byte buffer or a
+                path.
             FFIError: If the C operation fails.
         """
-        img = CBytes(image)
-        out_imgname = CBytes(bytearray(self._out_len))
-
-        ret = lib.vaccel_image_depth(
-            self._c_ptr_or_raise,
-            img._c_ptr,
-            out_imgname._c_ptr,
-            len(img),
-            len(out_imgname),
-        )
-        if ret:
-            raise FFIError(ret, "Image depth estimation failed")
+        return _run(self, _depth, image, 1)
+
+    def depth_batch(
+        self, images: Sequence[Any], *, workers: int | None = None
+    ) -> list[str]:
+        """Performs the image depth estimation operation on a batch of images.
 
-        return out_imgname.to_str()
+        Args:
+            images: The image data of each image (see the single image
+                operation).
+            workers: The maximum number of worker threads, bounded by the
+                number of images. Defaults to the number of CPUs.
+
+        Returns:
+            A list with the result of `depth()` for each image, in order.
+
+        Raises:
+            TypeError: If an image is not a C-contiguous byte buffer or a
+                path.
+            ValueError: If `workers` is not positive.
+            FFIError: If the C operation fails.
+        """
+        return _run_batch(self, _depth, images, 1, workers)
@@ -2,10 +2,40 @@
 
 """Minmax operation."""
 
-from vaccel._c_types import CBytes, CFloat
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Final
+
+from vaccel._c_types import CBytes
+from vaccel._c_types.arena import scratch_arena
+from vaccel._c_types.utils import typed_c_array
+from vaccel._lazy import LazyModule, is_available
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError
 
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+DEFAULT_CHUNK_SIZE: Final[int] = 1 << 20
+
+
+def _open_source(source: Any) -> "np.ndarray":
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).endswith(".npy"):
+            source = np.load(source, mmap_mode="r")
+        else:
+            source = np.memmap(source, dtype=np.float64, mode="r")
+    source = np.asarray(source)
+    if source.ndim != 1 or source.dtype != np.float64:
+        msg = (
+            f"Expected a 1-D float64 array, got {source.ndim} dimensions of "
+            f"{source.dtype}"
+        )
+        raise ValueError(msg)
+    return source
+
 
 class MinmaxMixin:
     """Mixin providing the Minmax operation for a `Session`.
@@ -19,43 +49,178 @@ class MinmaxMixin:
     """
 
     def minmax(
-        self, indata: bytes, ndata: int, low_threshold: int, high_threshold: int
-    ) -> (bytes, float, float):
+        self,
+        indata: Any,
+        ndata: int,
+        low_threshold: int,
+        high_threshold: int,
+        *,
+        out: Any = None,
+    ) -> (Any, float, float):
         """Performs the minmax operation.
 
         Wraps the `vaccel_minmax()` C operation.
 
+        Float64 NumPy arrays (including memory-mapped arrays) and buffers
+        (e.g. `memoryview`) are passed to C without copying. For `bytes` or
+        `bytearray` input, the data is interpreted as raw doubles.
+
         Args:
-            indata: The input data as a `bytes` object.
+            indata: The input data; a `bytes` object or a float64 array or
+                buffer.
             ndata: The number of data to be read provided data object.
             low_threshold: The threshold for the min value.
             high_threshold: The threshold for the max value.
+            out: A writable float64 buffer of at least `ndata` elements to
+                write the output data to.
 
         Returns:
             A tuple containing:
-                - The resulting output data.
+                - The resulting output data; `out` if given, a `bytearray` for
+                  `bytes` input or a NumPy array otherwise.
                 - The detected min value of the data.
                 - The detected max value of the data.
 
         Raises:
+            TypeError: If the data is not a C-contiguous float64 buffer, or
+                `out` is read-only.
+            ValueError: If the data has fewer than `ndata` elements.
+            NotImplementedError: If NumPy is needed but not installed.
             FFIError: If the C operation fails.
         """
-        c_indata = CBytes(indata)
-        c_outdata = CBytes(bytearray(ndata * ffi.sizeof("double")))
-        c_min = CFloat(float(0), "double")
-        c_max = CFloat(float(0), "double")
-
-        ret = lib.vaccel_minmax(
-            self._c_ptr_or_raise,
-            c_indata._as_c_array("double"),
-            ndata,
-            low_threshold,
-            high_threshold,
-            c_outdata._as_c_array("double"),
-            c_min._c_ptr,
-            c_max._c_ptr,
-        )
-        if ret != 0:
-            raise FFIError(ret, "Minmax operation failed")
+        if isinstance(indata, (bytes, bytearray)):
+            c_in = CBytes(indata)
+            c_indata = c_in._as_c_array("double")
+        else:
+            c_indata = typed_c_array(indata, "double", ndata)
+
+        if out is not None:
+            c_outdata = typed_c_array(out, "double", ndata, writable=True)
+        elif isinstance(indata, (bytes, bytearray)):
+            out = bytearray(ndata * ffi.sizeof("double"))
+            c_out = CBytes(out)
+            c_outdata = c_out._as_c_array("double")
+        elif HAS_NUMPY:
+            out = np.empty(ndata, dtype=np.float64)
+            c_outdata = typed_c_array(out, "double", writable=True)
+        else:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        with scratch_arena().borrow("double", 2) as c_min_max:
+            ret = lib.vaccel_minmax(
+                self._c_ptr_or_raise,
+                c_indata,
+                ndata,
+                low_threshold,
+                high_threshold,
+                c_outdata,
+                c_min_max,
+                c_min_max + 1,
+            )
+            if ret != 0:
+                raise FFIError(ret, "Minmax operation failed")
+
+            return (out, c_min_max[0], c_min_max[1])
+
+    def minmax_chunked(
+        self,
+        source: Any,
+        low_threshold: int,
+        high_threshold: int,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = 1,
+        out: Any = None,
+    ) -> (Any, float, float):
+        """Performs the minmax operation over large data in chunks.
+
+        The data is split in chunks of `chunk_size` elements that are
+        processed concurrently by `workers` threads, and the min/max values of
+        the chunks are reduced. Memory-mapped data is read chunk by chunk, so
+        data larger than memory can be processed. With more than one worker,
+        each worker thread runs its chunks on its own session, created with
+        the flags and registered resources of this session (see
+        `BaseSession.clone()`) and reused by later operations.
+
+        Args:
+            source: The input data; a 1-D float64 array (e.g. a
+                `numpy.memmap`), or the path of a `.npy` file or raw float64
+                file to memory-map.
+            low_threshold: The threshold for the min value.
+            high_threshold: The threshold for the max value.
+            chunk_size: The number of elements per chunk. Defaults to
+                `DEFAULT_CHUNK_SIZE`.
+            workers: The number of worker threads. Defaults to 1.
+            out: A writable float64 array with the length of the data (e.g. a
+                writable `numpy.memmap`) to write the output data to. If not
+                given, the output data is discarded.
+
+        Returns:
+            A tuple containing:
+                - `out`.
+                - The detected min value of the data.
+                - The detected max value of the data.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            ValueError: If the data is not a 1-D float64 array or is empty, or
+                `out` is smaller than the data.
+            FFIError: If the C operation fails.
+        """
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        source = _open_source(source)
+        if not len(source):
+            msg = "Cannot compute the min/max of empty data"
+            raise ValueError(msg)
+        if out is not None and len(out) < len(source):
+            msg = f"Expected out of at least {len(source)} elements"
+            raise ValueError(msg)
+
+        starts = iter(range(0, len(source), chunk_size))
+        lock = threading.Lock()
+        results = []
+
+        def work() -> None:
+            with nullcontext(self) if workers == 1 else self.clone() as session:
+                scratch = (
+                    np.empty(min(chunk_size, len(source)), dtype=np.float64)
+                    if out is None
+                    else None
+                )
+                while True:
+                    with lock:
+                        start = next(starts, None)
+                    if start is None:
+                        return
+                    chunk = source[start : start + chunk_size]
+                    chunk_out = (
+                        scratch
+                        if out is None
+                        else out[start : start + len(chunk)]
+                    )
+                    _, min_val, max_val = session.minmax(
+                        chunk,
+                        len(chunk),
+                        low_threshold,
+                        high_threshold,
+                        out=chunk_out,
+                    )
+                    with lock:
+                        results.append((min_val, max_val))
+
+        if workers == 1:
+            work()
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="vaccel-minmax"
+            ) as executor:
+                futures = [executor.submit(work) for _ in range(workers)]
+            for future in futures:
+                future.result()
 
-        return (c_outdata.value, c_min.value, c_max.value)
+        mins, maxs = zip(*results, strict=True)
+        return (out, min(mins), max(maxs))
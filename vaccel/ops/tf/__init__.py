@@ -5,7 +5,16 @@
 from .buffer import Buffer
 from .mixin import TFMixin
 from .node import Node
+from .runner import TFModelRunner
 from .status import Status
 from .tensor import Tensor, TensorType
 
-__all__ = ["Buffer", "Node", "Status", "TFMixin", "Tensor", "TensorType"]
+__all__ = [
+    "Buffer",
+    "Node",
+    "Status",
+    "TFMixin",
+    "TFModelRunner",
+    "Tensor",
+    "TensorType",
+]
@@ -2,7 +2,8 @@
 
 """Tensorflow Lite operations."""
 
-from vaccel._c_types import CInt, CList
+from vaccel._c_types import CList
+from vaccel._c_types.arena import scratch_arena
 from vaccel._libvaccel import lib
 from vaccel.error import FFIError
 from vaccel.resource import Resource
@@ -82,20 +83,25 @@ class TFLiteMixin:
             FFIError: If the C operation fails.
         """
         c_in_tensors = CList.from_ptrs(in_tensors)
-        c_out_tensors = CList.from_ptrs([Tensor.empty()] * nr_out_tensors)
-        status = CInt(0, "uint8_t")
-
-        ret = lib.vaccel_tflite_model_run(
-            self._c_ptr_or_raise,
-            resource._c_ptr,
-            c_in_tensors._c_ptr,
-            len(c_in_tensors),
-            c_out_tensors._c_ptr,
-            len(c_out_tensors),
-            status._c_ptr,
-        )
-        if ret != 0:
-            raise FFIError(ret, "Tensorflow Lite model run failed")
-
-        out_tensors = [Tensor.from_c_obj(t) for t in c_out_tensors.value]
-        return (out_tensors, status.value)
+        arena = scratch_arena()
+
+        with (
+            arena.borrow(
+                "struct vaccel_tflite_tensor *", nr_out_tensors
+            ) as c_out_tensors,
+            arena.borrow("uint8_t") as status,
+        ):
+            ret = lib.vaccel_tflite_model_run(
+                self._c_ptr_or_raise,
+                resource._c_ptr,
+                c_in_tensors._c_ptr,
+                len(c_in_tensors),
+                c_out_tensors,
+                nr_out_tensors,
+                status,
+            )
+            if ret != 0:
+                raise FFIError(ret, "Tensorflow Lite model run failed")
+
+            out_tensors = [Tensor.from_c_obj(t) for t in c_out_tensors]
+            return (out_tensors, status[0])
@@ -2,22 +2,34 @@
 
 """Interface to the `struct vaccel_tflite_tensor` C object."""
 
-import logging
-from typing import Any, Final
-
-from vaccel._c_types import CBytes, CNumpyArray, CType
-from vaccel._c_types.utils import CEnumBuilder
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+from vaccel._c_types import CBytes, CNumpyArray, OwnedCType
+from vaccel._c_types.utils import (
+    DLPACK_CPU_DEVICE,
+    PYBUF_WRITABLE,
+    CEnumBuilder,
+    array_interface,
+    c_type_to_format,
+    c_type_to_typestr,
+)
+from vaccel._ipc import (
+    attach_shared_memory,
+    copy_to_shared_memory,
+    pickle_buffer,
+    unpickle_buffer,
+)
+from vaccel._lazy import LazyModule, is_available
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError, NullPointerError
+from vaccel.pool import BufferPool
 
-try:
-    import numpy as np
-
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
 
-logger = logging.getLogger(__name__)
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
 
 enum_builder = CEnumBuilder(lib)
 TensorType = enum_builder.from_prefix("TensorType", "VACCEL_TFLITE_")
@@ -82,21 +94,23 @@ class TensorTypeMapper:
             raise ValueError(msg)
         return cls._TENSOR_TYPE_TO_C[tensor_type][1]
 
-    if HAS_NUMPY:
-        _NUMPY_TO_TENSOR_TYPE = {
-            np.dtype("float32"): TensorType.FLOAT32,
-            np.dtype("int32"): TensorType.INT32,
-            np.dtype("uint8"): TensorType.UINT8,
-            np.dtype("int64"): TensorType.INT64,
-            np.dtype("bool"): TensorType.BOOL,
-            np.dtype("int16"): TensorType.INT16,
-            np.dtype("int8"): TensorType.INT8,
-            np.dtype("float64"): TensorType.FLOAT64,
-            np.dtype("uint64"): TensorType.UINT64,
-            np.dtype("uint32"): TensorType.UINT32,
-            np.dtype("uint16"): TensorType.UINT16,
-        }
-        _TENSOR_TYPE_TO_NUMPY = {v: k for k, v in _NUMPY_TO_TENSOR_TYPE.items()}
+    # Keyed by dtype name so that NumPy is only imported on use
+    _NUMPY_TO_TENSOR_TYPE: Final[dict[str, TensorType]] = {
+        "float32": TensorType.FLOAT32,
+        "int32": TensorType.INT32,
+        "uint8": TensorType.UINT8,
+        "int64": TensorType.INT64,
+        "bool": TensorType.BOOL,
+        "int16": TensorType.INT16,
+        "int8": TensorType.INT8,
+        "float64": TensorType.FLOAT64,
+        "uint64": TensorType.UINT64,
+        "uint32": TensorType.UINT32,
+        "uint16": TensorType.UINT16,
+    }
+    _TENSOR_TYPE_TO_NUMPY: Final[dict[TensorType, str]] = {
+        v: k for k, v in _NUMPY_TO_TENSOR_TYPE.items()
+    }
 
     @classmethod
     def type_from_numpy(cls, dtype: "np.dtype") -> TensorType:
@@ -118,12 +132,12 @@ class TensorTypeMapper:
             raise NotImplementedError(msg)
 
         dtype = np.dtype(dtype)
-        if dtype not in cls._NUMPY_TO_TENSOR_TYPE:
+        if str(dtype) not in cls._NUMPY_TO_TENSOR_TYPE:
             supported = ", ".join(str(d) for d in cls._NUMPY_TO_TENSOR_TYPE)
             msg = f"Unsupported NumPy dtype: {dtype}. Supported: {supported}"
             raise ValueError(msg)
 
-        return cls._NUMPY_TO_TENSOR_TYPE[dtype]
+        return cls._NUMPY_TO_TENSOR_TYPE[str(dtype)]
 
     @classmethod
     def type_to_numpy(cls, ttype: TensorType) -> "np.dtype":
@@ -148,17 +162,20 @@ class TensorTypeMapper:
             msg = f"Unsupported TensorType: {ttype}. Supported: {supported}"
             raise ValueError(msg)
 
-        return cls._TENSOR_TYPE_TO_NUMPY[ttype]
+        return np.dtype(cls._TENSOR_TYPE_TO_NUMPY[ttype])
 
 
-class Tensor(CType):
+class Tensor(OwnedCType):
     """Wrapper for the `struct vaccel_tflite_tensor` C object.
 
     Manages the creation and initialization of a C `struct vaccel_tflite_tensor`
-    and provides access to it through Python properties.
+    and provides access to it through Python properties. The C object is
+    created on first use, so the input tensors of a model run are created
+    together.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _dims (list[int] | None): The dims of the tensor; None if empty.
@@ -173,6 +190,8 @@ class Tensor(CType):
             `struct vaccel_torch_tensor` C object.
     """
 
+    _defer_c_obj = True
+
     def __init__(self, dims: list[int], data_type: TensorType, data: list[Any]):
         """Initializes a new `Tensor` object.
 
@@ -203,14 +222,16 @@ class Tensor(CType):
             self._c_obj_ptr, nr_dims, c_dims, self._data_type
         )
         if ret != 0:
-            FFIError(ret, "Could not initialize tensor")
+            raise FFIError(ret, "Could not initialize tensor")
 
         self._c_obj = self._c_obj_ptr[0]
         self._c_size = ffi.sizeof("struct vaccel_tflite_tensor")
 
         if self._c_obj_data != ffi.NULL:
             data_size = (
-                self._c_data.c_size if self._c_data else len(self._c_obj_data)
+                self._c_data.c_size
+                if self._c_data is not None
+                else len(self._c_obj_data)
             )
         else:
             c_type_str = TensorTypeMapper.type_to_c_type(self._data_type)
@@ -235,24 +256,20 @@ class Tensor(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_tflite_tensor` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If tensor deletion fails.
         """
-        ret = lib.vaccel_tflite_tensor_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_tflite_tensor_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete tensor")
 
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Tensor")
-
     @property
     def dims(self) -> list[int]:
         """The tensor dims.
@@ -284,7 +301,7 @@ class Tensor(CType):
             The data of the tensor.
         """
         c_type_str = TensorTypeMapper.type_to_c_type(self.data_type)
-        if self._c_data:
+        if self._c_data is not None:
             typed_c_data = self._c_data._as_c_array(c_type_str)
         else:
             typed_c_data = ffi.cast(
@@ -298,6 +315,9 @@ class Tensor(CType):
     def as_bytelike(self) -> bytes | bytearray | memoryview:
         """Returns the tensor data buffer as a byte-like object.
 
+        If the data is owned by the C struct, the returned object is a zero-copy
+        view that keeps the tensor alive while it is referenced.
+
         Returns:
             The data of the tensor as a byte-like object.
         """
@@ -306,7 +326,7 @@ class Tensor(CType):
                 return self._c_data.value
             return self._c_data.as_memoryview()
         return CBytes.from_c_obj(
-            self._c_ptr_or_raise.data, self._c_ptr_or_raise.size
+            self._c_ptr_or_raise.data, self._c_ptr_or_raise.size, owner=self
         ).value
 
     def as_memoryview(self) -> memoryview:
@@ -327,6 +347,52 @@ class Tensor(CType):
         data = self.as_bytelike()
         return data if isinstance(data, bytes) else bytes(data)
 
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """Returns the NumPy array interface of the tensor data.
+
+        Allows `np.asarray(tensor)` to create a zero-copy view of the tensor
+        data that keeps the tensor alive.
+
+        Returns:
+            A version 3 `__array_interface__` dict.
+        """
+        c_type_str = TensorTypeMapper.type_to_c_type(self.data_type)
+        return array_interface(
+            self._c_ptr_or_raise.data,
+            tuple(self.dims),
+            c_type_to_typestr(c_type_str),
+            readonly=isinstance(self._data, bytes),
+        )
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exports the tensor data through the buffer protocol (PEP 688).
+
+        Available to `memoryview()` and other buffer consumers on Python 3.12
+        or newer. The returned view is typed and shaped as the tensor, does not
+        copy the data and keeps the tensor alive.
+
+        Args:
+            flags: The buffer request flags.
+
+        Returns:
+            A memoryview of the tensor data.
+
+        Raises:
+            BufferError: If a writable buffer is requested for read-only data.
+        """
+        if flags & PYBUF_WRITABLE and isinstance(self._data, bytes):
+            msg = "Tensor data is read-only"
+            raise BufferError(msg)
+
+        c_type_str = TensorTypeMapper.type_to_c_type(self.data_type)
+        view = CBytes.from_c_obj(
+            self._c_ptr_or_raise.data, self._c_ptr_or_raise.size, owner=self
+        ).value
+        dims = self.dims
+        fmt = c_type_to_format(c_type_str)
+        return view.cast(fmt, dims) if dims else view.cast(fmt)
+
     @property
     def data_type(self) -> TensorType:
         """The tensor data type.
@@ -340,6 +406,8 @@ class Tensor(CType):
     def from_c_obj(cls, c_obj: ffi.CData) -> "Tensor":
         """Initializes a new `Tensor` object from an existing C struct.
 
+        The new object takes ownership of the C struct.
+
         Args:
             c_obj: A pointer to a `struct vaccel_tflite_tensor` C object.
 
@@ -360,6 +428,7 @@ class Tensor(CType):
         inst._c_obj_data = ffi.NULL
         inst._c_obj = c_obj
         inst._c_size = ffi.sizeof(inst._c_obj)
+        inst._own_c_obj()
         return inst
 
     @classmethod
@@ -368,6 +437,8 @@ class Tensor(CType):
         dims: list[int],
         data_type: TensorType,
         data: bytes | bytearray | memoryview,
+        *,
+        pool: BufferPool | None = None,
     ) -> "Tensor":
         """Initializes a new `Tensor` object from byte-like data.
 
@@ -375,10 +446,19 @@ class Tensor(CType):
             dims: The dims to be passed to the C struct.
             data_type: The data_type to be passed to the C struct.
             data: The data to be passed to the C struct.
+            pool: A pool to copy `data` into if it is not aligned to the pool
+                alignment. The pooled buffer is returned to the pool when the
+                tensor is released.
 
         Returns:
             A new `Tensor` object
+
+        Raises:
+            NotImplementedError: If `pool` is given and NumPy is not installed.
         """
+        if pool is not None:
+            data = pool.aligned(data)
+
         inst = cls.__new__(cls)
         inst._dims = dims
         inst._data = data
@@ -409,6 +489,98 @@ class Tensor(CType):
         inst._c_size = ffi.sizeof("struct vaccel_tflite_tensor *")
         return inst
 
+    @classmethod
+    def batch(
+        cls, tensors: Sequence[tuple[list[int], TensorType, Any]]
+    ) -> list["Tensor"]:
+        """Initializes multiple `Tensor` objects with a single C call.
+
+        Each item holds the arguments of `Tensor()`. The data of an item may
+        also be byte-like, as in `from_buffer()`, or a NumPy array, as in
+        `from_numpy()`.
+
+        Args:
+            tensors: The dims, data type and data of each tensor.
+
+        Returns:
+            The new `Tensor` objects, in the order of `tensors`.
+
+        Raises:
+            FFIError: If tensor initialization fails.
+        """
+        insts = []
+        for dims, data_type, data in tensors:
+            inst = cls.__new__(cls)
+            inst._dims = dims
+            inst._data = data
+            inst._data_type = data_type
+            inst._c_obj_ptr = ffi.NULL
+            if isinstance(data, list):
+                inst._c_data = None
+                inst._c_obj_data = ffi.NULL
+            else:
+                inst._c_data = (
+                    CBytes(data)
+                    if isinstance(data, (bytes, bytearray, memoryview))
+                    else CNumpyArray(data)
+                )
+                inst._c_obj_data = inst._c_data._c_ptr
+            super().__init__(inst)
+            insts.append(inst)
+
+        cls._materialize_many(insts)
+        return insts
+
+    @classmethod
+    def _materialize_many(cls, objs: list["Tensor"]) -> None:
+        """Creates the C objects of multiple deferred tensors with one C call.
+
+        Args:
+            objs: The tensors with pending C objects.
+
+        Raises:
+            FFIError: If tensor initialization fails.
+        """
+        nr_tensors = len(objs)
+        if nr_tensors <= 1:
+            super()._materialize_many(objs)
+            return
+
+        for inst in objs:
+            if inst._c_obj_data == ffi.NULL:
+                c_type_str = TensorTypeMapper.type_to_c_type(inst._data_type)
+                inst._c_obj_data = ffi.new(
+                    f"{c_type_str}[{len(inst._data)}]", inst._data
+                )
+
+        c_tensors = ffi.new(f"struct vaccel_tflite_tensor *[{nr_tensors}]")
+        ret = lib.vaccel_py_tflite_tensors_new(
+            c_tensors,
+            nr_tensors,
+            ffi.new("size_t[]", [len(inst._dims) for inst in objs]),
+            ffi.new("int32_t[]", [d for inst in objs for d in inst._dims]),
+            ffi.new("int[]", [inst._data_type for inst in objs]),
+            ffi.new("void *[]", [inst._c_obj_data for inst in objs]),
+            ffi.new(
+                "size_t[]",
+                [
+                    inst._c_data.c_size
+                    if inst._c_data is not None
+                    else ffi.sizeof(inst._c_obj_data)
+                    for inst in objs
+                ],
+            ),
+        )
+        if ret != 0:
+            raise FFIError(ret, "Could not initialize tensors")
+
+        c_size = ffi.sizeof("struct vaccel_tflite_tensor")
+        for inst, c_obj in zip(objs, c_tensors, strict=True):
+            inst._c_obj = c_obj
+            inst._c_size = c_size
+            inst._c_obj_pending = False
+            inst._own_c_obj()
+
     def __repr__(self):
         try:
             c_ptr = (
@@ -427,35 +599,135 @@ class Tensor(CType):
         )
 
     @classmethod
-    def from_numpy(cls, data: "np.ndarray") -> "Tensor":
+    def from_numpy(
+        cls,
+        data: "np.ndarray",
+        *,
+        allow_copy: bool = True,
+        pool: BufferPool | None = None,
+    ) -> "Tensor":
         """Initializes a new `Tensor` object from a NumPy array.
 
+        C-contiguous arrays are passed to the C struct without copying; other
+        layouts are copied into a reusable aligned staging buffer.
+
         Args:
             data: The NumPy array containing the tensor data.
+            allow_copy: Whether a non C-contiguous array may be copied.
+                Defaults to True.
+            pool: A pool to copy `data` into if it is not C-contiguous and
+                aligned to the pool alignment. The pooled buffer is returned to
+                the pool when the tensor is released.
 
         Returns:
             A new `Tensor` object
 
         Raises:
             NotImplementedError: If NumPy is not installed.
+            ValueError: If `data` must be copied and `allow_copy` is False.
         """
         if not HAS_NUMPY:
             msg = "NumPy is not available"
             raise NotImplementedError(msg)
 
+        if pool is not None:
+            data = pool.aligned(data, allow_copy=allow_copy)
+
         inst = cls.__new__(cls)
         inst._dims = list(data.shape)
         inst._data = data
         inst._data_type = TensorTypeMapper.type_from_numpy(inst._data.dtype)
-        inst._c_data = CNumpyArray(inst._data)
+        inst._c_data = CNumpyArray(inst._data, allow_copy=allow_copy)
         inst._c_obj_ptr = ffi.NULL
         inst._c_obj_data = inst._c_data._c_ptr
         super().__init__(inst)
         return inst
 
+    @classmethod
+    def from_shared_memory(
+        cls, name: str, shape: Sequence[int], dtype: Any
+    ) -> "Tensor":
+        """Initializes a new `Tensor` object backed by a shared memory block.
+
+        The tensor data is not copied; the block stays attached while the
+        tensor or any view of its data is alive.
+
+        Args:
+            name: The name of the shared memory block (e.g. as created by
+                `Tensor.to_shared_memory()`).
+            shape: The shape of the tensor.
+            dtype: The NumPy data type or `TensorType` of the tensor.
+
+        Returns:
+            A new `Tensor` object
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            FileNotFoundError: If no shared memory block named `name` exists.
+            ValueError: If the block is smaller than the tensor.
+        """
+        if isinstance(dtype, TensorType):
+            dtype = TensorTypeMapper.type_to_numpy(dtype)
+        return cls.from_numpy(attach_shared_memory(name, shape, dtype))
+
+    def to_shared_memory(self, name: str | None = None) -> "SharedMemory":
+        """Copies the tensor data into a new shared memory block.
+
+        Args:
+            name: The name of the new block. Defaults to a unique name.
+
+        Returns:
+            A new `SharedMemory` object. The caller is responsible for closing
+            and unlinking it.
+
+        Raises:
+            FileExistsError: If a block named `name` already exists.
+        """
+        return copy_to_shared_memory(self.as_memoryview(), name)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling of the tensor.
+
+        With pickle protocol 5, the tensor data is exported as an out-of-band
+        `pickle.PickleBuffer`, so it can be transferred without copying (e.g.
+        with a `buffer_callback`). The unpickled tensor is a view of the
+        transferred data.
+
+        Args:
+            protocol: The pickle protocol in use.
+
+        Returns:
+            The reconstruction callable and its arguments.
+        """
+        data = pickle_buffer(self.as_memoryview(), protocol)
+        return (self._from_pickle, (self.dims, int(self.data_type), data))
+
+    @classmethod
+    def _from_pickle(
+        cls, dims: list[int], data_type: int, data: Any
+    ) -> "Tensor":
+        return cls.from_buffer(
+            dims, TensorType(data_type), unpickle_buffer(data)
+        )
+
+    def _release_data(self) -> None:
+        """Drops the tensor data once the C object has been released.
+
+        Data buffers taken from a `BufferPool` are returned to the pool once
+        no other reference to them remains.
+        """
+        self._data = None
+        self._c_data = None
+        self._c_obj_data = ffi.NULL
+
     def as_numpy(self) -> "np.ndarray":
         """Returns the tensor data buffer as a NumPy array.
 
+        If the data is owned by the C struct (e.g. for output tensors of a model
+        run), the returned array is a zero-copy view whose `base` keeps the
+        tensor alive, so it remains valid after the `Tensor` is dropped or
+        closed.
+
         Returns:
             The data of the tensor as a NumPy array.
         """
@@ -472,4 +744,59 @@ class Tensor(CType):
             self._c_ptr_or_raise.size,
             self.shape,
             dtype,
+            owner=self,
         ).value
+
+    def __dlpack__(self, *, stream: Any = None, **kwargs: Any) -> Any:
+        """Exports the tensor data as a DLPack capsule.
+
+        The capsule is created from a zero-copy NumPy view of the tensor data
+        and keeps the tensor alive until the consumer releases it.
+
+        Args:
+            stream: The consumer stream. Must be None for host memory.
+            **kwargs: Additional DLPack protocol arguments (e.g. `max_version`)
+                forwarded to NumPy.
+
+        Returns:
+            A DLPack `PyCapsule` of the tensor data.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            BufferError: If the tensor data cannot be exported.
+        """
+        return self.as_numpy().__dlpack__(stream=stream, **kwargs)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        """Returns the DLPack device of the tensor data.
+
+        Returns:
+            The `(device_type, device_id)` tuple of host (CPU) memory.
+        """
+        return DLPACK_CPU_DEVICE
+
+    @classmethod
+    def from_dlpack(cls, data: Any, *, allow_copy: bool = True) -> "Tensor":
+        """Initializes a new `Tensor` object from a DLPack-compatible array.
+
+        Any host-memory array implementing `__dlpack__` (e.g. NumPy, PyTorch,
+        JAX, CuPy host arrays) is imported without copying, unless it is not
+        C-contiguous.
+
+        Args:
+            data: The array containing the tensor data.
+            allow_copy: Whether a non C-contiguous array may be copied.
+                Defaults to True.
+
+        Returns:
+            A new `Tensor` object
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            ValueError: If `data` must be copied and `allow_copy` is False.
+        """
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        return cls.from_numpy(np.from_dlpack(data), allow_copy=allow_copy)
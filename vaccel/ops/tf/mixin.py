@@ -3,6 +3,7 @@
 """Tensorflow operations."""
 
 from vaccel._c_types import CList
+from vaccel._c_types.arena import scratch_arena
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError
 from vaccel.resource import Resource
@@ -78,7 +79,8 @@ class TFMixin:
     ) -> (list[Tensor], Status):
         """Performs the Tensorflow model run operation.
 
-        Wraps the `vaccel_tf_model_run()` C operation.
+        Wraps the `vaccel_tf_model_run()` C operation. To run a model
+        repeatedly with the same nodes, use a `TFModelRunner` instead.
 
         Args:
             resource: A resource with the model to run.
@@ -101,23 +103,26 @@ class TFMixin:
         c_in_nodes = CList(in_nodes)
         c_in_tensors = CList.from_ptrs(in_tensors)
         c_out_nodes = CList(out_nodes)
-        c_out_tensors = CList.from_ptrs([Tensor.empty()] * len(c_out_nodes))
+        nr_out_tensors = len(c_out_nodes)
         status = Status()
 
-        ret = lib.vaccel_tf_model_run(
-            self._c_ptr_or_raise,
-            resource._c_ptr,
-            run_options_ptr,
-            c_in_nodes._c_ptr,
-            c_in_tensors._c_ptr,
-            len(c_in_nodes),
-            c_out_nodes._c_ptr,
-            c_out_tensors._c_ptr,
-            len(c_out_nodes),
-            status._c_ptr,
-        )
-        if ret != 0:
-            raise FFIError(ret, "Tensorflow model run failed")
-
-        out_tensors = [Tensor.from_c_obj(t) for t in c_out_tensors.value]
+        with scratch_arena().borrow(
+            "struct vaccel_tf_tensor *", nr_out_tensors
+        ) as c_out_tensors:
+            ret = lib.vaccel_tf_model_run(
+                self._c_ptr_or_raise,
+                resource._c_ptr,
+                run_options_ptr,
+                c_in_nodes._c_ptr,
+                c_in_tensors._c_ptr,
+                len(c_in_nodes),
+                c_out_nodes._c_ptr,
+                c_out_tensors,
+                nr_out_tensors,
+                status._c_ptr,
+            )
+            if ret != 0:
+                raise FFIError(ret, "Tensorflow model run failed")
+
+            out_tensors = [Tensor.from_c_obj(t) for t in c_out_tensors]
         return (out_tensors, status)
@@ -2,23 +2,20 @@
 
 """Interface to the `struct vaccel_tf_node` C object."""
 
-import logging
-
-from vaccel._c_types import CStr, CType
+from vaccel._c_types import CStr, OwnedCType
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError, NullPointerError
 
-logger = logging.getLogger(__name__)
-
 
-class Node(CType):
+class Node(OwnedCType):
     """Wrapper for the `struct vaccel_tf_node` C object.
 
     Manages the creation and initialization of a C `struct vaccel_tf_node` and
     provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _name (str): The name of the node.
@@ -65,24 +62,20 @@ class Node(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_tf_node` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If node deletion fails.
         """
-        ret = lib.vaccel_tf_node_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_tf_node_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete node")
 
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Node")
-
     @property
     def name(self) -> str:
         """The node name.
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Repeated Tensorflow model runs with cached C objects."""
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from vaccel._c_types import CList
+from vaccel._libvaccel import ffi, lib
+from vaccel.error import FFIError
+from vaccel.resource import Resource
+
+from .buffer import Buffer
+from .node import Node
+from .status import Status
+from .tensor import Tensor, TensorTypeMapper
+
+if TYPE_CHECKING:
+    from vaccel.session import BaseSession
+
+
+def _to_node(node: str | tuple[str, int] | Node) -> Node:
+    """Returns a `Node` for a node name, a `(name, id)` tuple or a `Node`."""
+    if isinstance(node, Node):
+        return node
+    if isinstance(node, str):
+        return Node(node, 0)
+    name, id_ = node
+    return Node(name, id_)
+
+
+class TFModelRunner:
+    """Runs a loaded Tensorflow model repeatedly with the same nodes.
+
+    `TFMixin.tf_model_run()` creates the C nodes, status and tensor pointer
+    arrays of every run. A runner creates them once, so each run only converts
+    the fed arrays to tensors (with a single C call) and sets the input tensor
+    pointers.
+
+    Runners are not thread-safe; create a runner per thread to run a model
+    concurrently.
+
+    Usage:
+        session.tf_model_load(model)
+        runner = TFModelRunner(session, model, ["input_1"], ["output_1"])
+        (out_tensors, status) = runner({"input_1": array})
+
+    Attributes:
+        session (BaseSession): The session to run the model with.
+        resource (Resource): The resource with the loaded model.
+        input_names (list[str]): The names of the input nodes, i.e. the keys
+            of the feeds.
+        in_nodes (list[Node]): The input nodes.
+        out_nodes (list[Node]): The output nodes.
+        run_options (Buffer | None): The inference options.
+        status (Status): The status of the last run. Overwritten by each run.
+    """
+
+    def __init__(
+        self,
+        session: "BaseSession",
+        resource: Resource,
+        inputs: Sequence[str | tuple[str, int] | Node],
+        outputs: Sequence[str | tuple[str, int] | Node],
+        run_options: Buffer | None = None,
+    ):
+        """Initializes a new `TFModelRunner` object.
+
+        Args:
+            session: The session to run the model with.
+            resource: A resource with a model loaded with `tf_model_load()`.
+            inputs: The input nodes; node names (with ID 0), `(name, id)`
+                tuples or `Node` objects.
+            outputs: The output nodes, as `inputs`.
+            run_options: The inference options.
+
+        Raises:
+            ValueError: If there are no inputs or outputs, or input node names
+                are not unique.
+            FFIError: If node or status initialization fails.
+        """
+        self.session = session
+        self.resource = resource
+        self.in_nodes = [_to_node(node) for node in inputs]
+        self.out_nodes = [_to_node(node) for node in outputs]
+        if not self.in_nodes or not self.out_nodes:
+            msg = "Expected at least one input and one output node"
+            raise ValueError(msg)
+        self.input_names = [node.name for node in self.in_nodes]
+        if len(set(self.input_names)) != len(self.input_names):
+            msg = "Expected unique input node names"
+            raise ValueError(msg)
+
+        self.run_options = run_options
+        self.status = Status()
+        self._c_in_nodes = CList(self.in_nodes)
+        self._c_out_nodes = CList(self.out_nodes)
+        self._c_in_tensors = ffi.new(
+            f"struct vaccel_tf_tensor *[{len(self.in_nodes)}]"
+        )
+        self._c_out_tensors = ffi.new(
+            f"struct vaccel_tf_tensor *[{len(self.out_nodes)}]"
+        )
+        self._c_run_options = (
+            ffi.NULL if run_options is None else run_options._c_ptr
+        )
+
+    def _in_tensors(self, feeds: Mapping[str, Any]) -> list[Tensor]:
+        """Returns the input tensors for `feeds`, in the order of the inputs."""
+        unknown = feeds.keys() - set(self.input_names)
+        if unknown:
+            msg = f"Unknown input nodes: {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+        missing = [name for name in self.input_names if name not in feeds]
+        if missing:
+            msg = f"Missing feeds for input nodes: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        values = [feeds[name] for name in self.input_names]
+        arrays = [value for value in values if not isinstance(value, Tensor)]
+        created = iter(
+            Tensor.batch(
+                [
+                    (
+                        list(array.shape),
+                        TensorTypeMapper.type_from_numpy(array.dtype),
+                        array,
+                    )
+                    for array in arrays
+                ]
+            )
+            if arrays
+            else ()
+        )
+        return [
+            value if isinstance(value, Tensor) else next(created)
+            for value in values
+        ]
+
+    def __call__(self, feeds: Mapping[str, Any]) -> (list[Tensor], Status):
+        """Runs the model.
+
+        Wraps the `vaccel_tf_model_run()` C operation.
+
+        Args:
+            feeds: The input data, keyed by input node name; NumPy arrays or
+                `Tensor` objects.
+
+        Returns:
+            A tuple containing:
+                - The output tensors, in the order of the output nodes.
+                - The status of the operation execution; a copy of `status`
+                    that later runs do not overwrite.
+
+        Raises:
+            ValueError: If the feeds do not match the input nodes.
+            FFIError: If tensor initialization or the C operation fails.
+        """
+        in_tensors = self._in_tensors(feeds)
+        for i, tensor in enumerate(in_tensors):
+            self._c_in_tensors[i] = tensor._c_ptr
+        for i in range(len(self.out_nodes)):
+            self._c_out_tensors[i] = ffi.NULL
+
+        ret = lib.vaccel_tf_model_run(
+            self.session._c_ptr_or_raise,
+            self.resource._c_ptr,
+            self._c_run_options,
+            self._c_in_nodes._c_ptr,
+            self._c_in_tensors,
+            len(self.in_nodes),
+            self._c_out_nodes._c_ptr,
+            self._c_out_tensors,
+            len(self.out_nodes),
+            self.status._c_ptr,
+        )
+        if ret != 0:
+            raise FFIError(ret, "Tensorflow model run failed")
+
+        out_tensors = [Tensor.from_c_obj(t) for t in self._c_out_tensors]
+        return (out_tensors, Status(self.status.code, self.status.message))
@@ -2,29 +2,25 @@
 
 """Interface to the `struct vaccel_tf_status` C object."""
 
-import logging
-
-from vaccel._c_types import CStr, CType
+from vaccel._c_types import CStr, OwnedCType
+from vaccel._c_types.arena import scratch_arena
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError, NullPointerError
 
-logger = logging.getLogger(__name__)
-
 
-class Status(CType):
+class Status(OwnedCType):
     """Wrapper for the `struct vaccel_tf_status` C object.
 
     Manages the creation and initialization of a C `struct vaccel_tf_status` and
     provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _error_code (int): The status's error code.
         _message (str): The status' message.
-        _c_obj_ptr (ffi.CData): A double pointer to the underlying
-            `struct vaccel_tf_status` C object.
     """
 
     def __init__(self, error_code: int = 0, message: str = ""):
@@ -37,7 +33,6 @@ class Status(CType):
         """
         self._error_code = error_code
         self._message = message
-        self._c_obj_ptr = ffi.NULL
         super().__init__()
 
     def _init_c_obj(self):
@@ -46,14 +41,14 @@ class Status(CType):
         Raises:
             FFIError: If status initialization fails.
         """
-        self._c_obj_ptr = ffi.new("struct vaccel_tf_status **")
-        ret = lib.vaccel_tf_status_new(
-            self._c_obj_ptr, self._error_code, self._message.encode()
-        )
-        if ret != 0:
-            raise FFIError(ret, "Could not initialize status")
+        with scratch_arena().borrow("struct vaccel_tf_status *") as c_obj_ptr:
+            ret = lib.vaccel_tf_status_new(
+                c_obj_ptr, self._error_code, self._message.encode()
+            )
+            if ret != 0:
+                raise FFIError(ret, "Could not initialize status")
 
-        self._c_obj = self._c_obj_ptr[0]
+            self._c_obj = c_obj_ptr[0]
         self._c_size = ffi.sizeof("struct vaccel_tf_status")
 
     @property
@@ -65,24 +60,20 @@ class Status(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_tf_status` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If status deletion fails.
         """
-        ret = lib.vaccel_tf_status_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_tf_status_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete status")
 
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Status")
-
     @property
     def code(self) -> int:
         """The status error code.
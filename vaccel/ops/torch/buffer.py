@@ -2,23 +2,23 @@
 
 """Interface to the `struct vaccel_torch_buffer` C object."""
 
-import logging
+from typing import Any
 
-from vaccel._c_types import CBytes, CType
+from vaccel._c_types import CBytes, OwnedCType
+from vaccel._c_types.utils import PYBUF_WRITABLE, array_interface
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError, NullPointerError
 
-logger = logging.getLogger(__name__)
 
-
-class Buffer(CType):
+class Buffer(OwnedCType):
     """Wrapper for the `struct vaccel_torch_buffer` C object.
 
     Manages the creation and initialization of a C `struct vaccel_torch_buffer`
     and provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _data (bytes | bytearray): The data of the buffer.
@@ -65,32 +65,26 @@ class Buffer(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_torch_buffer` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If buffer deletion fails.
         """
         c_data = ffi.new("void **")
         c_size = ffi.new("size_t *")
-        ret = lib.vaccel_torch_buffer_take_data(
-            self._c_ptr_or_raise, c_data, c_size
-        )
+        ret = lib.vaccel_torch_buffer_take_data(c_obj, c_data, c_size)
         if ret != 0:
             raise FFIError(ret, "Failed to take ownership of buffer data")
 
-        ret = lib.vaccel_torch_buffer_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_torch_buffer_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete buffer")
 
-    def __del__(self):
-        try:
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Buffer")
-
     @property
     def size(self) -> int:
         """The buffer size.
@@ -107,10 +101,51 @@ class Buffer(CType):
         Returns:
             The data of the buffer.
         """
-        if not self._obj.data or self.size == 0:
+        if self._c_ptr_or_raise.data == ffi.NULL or self.size == 0:
             return b""
         return ffi.buffer(self._c_ptr_or_raise.data, self.size)[:]
 
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """Returns the NumPy array interface of the buffer data.
+
+        Allows `np.asarray(buffer)` to create a zero-copy `uint8` view of the
+        buffer data that keeps the buffer alive.
+
+        Returns:
+            A version 3 `__array_interface__` dict.
+        """
+        return array_interface(
+            self._c_ptr_or_raise.data,
+            (self.size,),
+            "|u1",
+            readonly=isinstance(self._data, bytes),
+        )
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exports the buffer data through the buffer protocol (PEP 688).
+
+        Available to `memoryview()` and other buffer consumers on Python 3.12
+        or newer. The returned view does not copy the data and keeps the
+        buffer alive.
+
+        Args:
+            flags: The buffer request flags.
+
+        Returns:
+            A memoryview of the buffer data.
+
+        Raises:
+            BufferError: If a writable buffer is requested for read-only data.
+        """
+        if flags & PYBUF_WRITABLE and isinstance(self._data, bytes):
+            msg = "Buffer data is read-only"
+            raise BufferError(msg)
+
+        return CBytes.from_c_obj(
+            self._c_ptr_or_raise.data, self.size, owner=self
+        ).value
+
     def __repr__(self):
         try:
             c_ptr = (
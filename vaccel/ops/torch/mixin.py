@@ -3,6 +3,7 @@
 """Torch operations."""
 
 from vaccel._c_types import CList
+from vaccel._c_types.arena import scratch_arena
 from vaccel._libvaccel import ffi, lib
 from vaccel.error import FFIError
 from vaccel.resource import Resource
@@ -64,18 +65,20 @@ class TorchMixin:
             ffi.NULL if run_options is None else run_options._c_ptr
         )
         c_in_tensors = CList.from_ptrs(in_tensors)
-        c_out_tensors = CList.from_ptrs([Tensor.empty()] * nr_out_tensors)
-
-        ret = lib.vaccel_torch_model_run(
-            self._c_ptr_or_raise,
-            resource._c_ptr,
-            run_options_ptr,
-            c_in_tensors._c_ptr,
-            len(c_in_tensors),
-            c_out_tensors._c_ptr,
-            len(c_out_tensors),
-        )
-        if ret != 0:
-            raise FFIError(ret, "Torch jitload forward operation failed")
 
-        return [Tensor.from_c_obj(t) for t in c_out_tensors.value]
+        with scratch_arena().borrow(
+            "struct vaccel_torch_tensor *", nr_out_tensors
+        ) as c_out_tensors:
+            ret = lib.vaccel_torch_model_run(
+                self._c_ptr_or_raise,
+                resource._c_ptr,
+                run_options_ptr,
+                c_in_tensors._c_ptr,
+                len(c_in_tensors),
+                c_out_tensors,
+                nr_out_tensors,
+            )
+            if ret != 0:
+                raise FFIError(ret, "Torch jitload forward operation failed")
+
+            return [Tensor.from_c_obj(t) for t in c_out_tensors]
@@ -0,0 +1,271 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Streaming image inference pipelines."""
+
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Final, TextIO
+
+from .ops.image import _image_buffer
+from .plugin import PluginType
+from .resource import Resource
+from .session import local_session
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS: Final[tuple[str, ...]] = (
+    "classify",
+    "detect",
+    "segment",
+    "pose",
+    "depth",
+)
+
+DEFAULT_READERS: Final[int] = 2
+DEFAULT_QUEUE_SIZE: Final[int] = 64
+
+
+class ImagePipeline:
+    """Runs an image operation over a stream of images.
+
+    Images are memory-mapped and prefetched by a pool of reader threads and
+    processed by a pool of worker threads, each running the operation on its
+    thread-local session (see `local_session()`). At most `queue_size` images
+    are in flight at any time, so memory use is bounded regardless of the
+    number of images. Results are produced in input order.
+
+    Iterating over a pipeline yields `(source, result)` tuples, where `source`
+    is the path of an image file or the index of an in-memory frame and
+    `result` is the result of the operation (e.g. of `Session.classify()`).
+
+    Usage:
+        pipeline = ImagePipeline("images/*.jpg", "classify", workers=8)
+        for path, (tag, _) in pipeline:
+            print(path, tag)
+        print(pipeline.stats())
+
+    Attributes:
+        source (str | os.PathLike | Iterable[Any]): The images.
+        op (str): The name of the image operation.
+        workers (int): The number of worker threads.
+        readers (int): The number of reader threads.
+        queue_size (int): The maximum number of images in flight.
+        flags (PluginType | int): The flags of the worker sessions.
+        resources (list[Resource]): The resources to register with the worker
+            sessions.
+        report_interval (float | None): The interval in seconds between
+            throughput log messages; None to not log throughput.
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike | Iterable[Any],
+        op: str = "classify",
+        *,
+        workers: int | None = None,
+        readers: int = DEFAULT_READERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        flags: PluginType | int = 0,
+        resources: Iterable[Resource] = (),
+        report_interval: float | None = None,
+    ):
+        """Initializes a new `ImagePipeline` object.
+
+        Args:
+            source: A directory, a glob pattern of image files (e.g.
+                "images/**/*.jpg"), or an iterable of image file paths and/or
+                in-memory frames (bytes-like objects or uint8 arrays).
+            op: The image operation to run; one of `OPERATIONS`. Defaults to
+                "classify".
+            workers: The number of worker threads. Defaults to the number of
+                CPUs.
+            readers: The number of reader threads. Defaults to
+                `DEFAULT_READERS`.
+            queue_size: The maximum number of images read ahead or waiting
+                to be consumed. Defaults to `DEFAULT_QUEUE_SIZE`.
+            flags: The flags of the worker sessions. Defaults to 0.
+            resources: The resources (e.g. models) to register with the worker
+                sessions.
+            report_interval: The interval in seconds between throughput log
+                messages. Defaults to None.
+
+        Raises:
+            ValueError: If `op` is not supported, or `workers`, `readers` or
+                `queue_size` is not positive.
+        """
+        if op not in OPERATIONS:
+            supported = ", ".join(OPERATIONS)
+            msg = f"Unsupported operation: {op}. Supported: {supported}"
+            raise ValueError(msg)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        for name, value in (
+            ("workers", workers),
+            ("readers", readers),
+            ("queue_size", queue_size),
+        ):
+            if value < 1:
+                msg = f"Expected a positive {name}, got {value}"
+                raise ValueError(msg)
+
+        self.source = source
+        self.op = op
+        self.workers = workers
+        self.readers = readers
+        self.queue_size = queue_size
+        self.flags = flags
+        self.resources = list(resources)
+        self.report_interval = report_interval
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self._images = 0
+        self._bytes = 0
+        self._start = time.perf_counter()
+        self._elapsed = 0.0
+        self._last_report = self._start
+
+    def _items(self) -> Iterator[tuple[Any, Any]]:
+        """Yields the source key and the image of each input."""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            if Path(source).is_dir():
+                paths = sorted(p for p in Path(source).iterdir() if p.is_file())
+            else:
+                # `Path.glob()` does not support absolute patterns
+                pattern = os.fspath(source)
+                paths = sorted(
+                    Path(path)
+                    for path in glob.glob(pattern, recursive=True)  # noqa: PTH207
+                )
+            for path in paths:
+                yield path, path
+            return
+        for index, image in enumerate(source):
+            if isinstance(image, (str, os.PathLike)):
+                yield image, image
+            else:
+                yield index, image
+
+    def _process(self, read: Future) -> (Any, int):
+        """Runs the operation on an image, once it has been read."""
+        data = read.result()
+        session = local_session(self.flags, self.resources)
+        return getattr(session, self.op)(data), len(data)
+
+    def _complete(self, key: Any, work: Future) -> (Any, Any):
+        """Waits for the result of an image and updates the statistics."""
+        result, nbytes = work.result()
+        now = time.perf_counter()
+        with self._lock:
+            self._images += 1
+            self._bytes += nbytes
+            self._elapsed = now - self._start
+            report = (
+                self.report_interval is not None
+                and now - self._last_report >= self.report_interval
+            )
+            if report:
+                self._last_report = now
+        if report:
+            stats = self.stats()
+            logger.info(
+                "Processed %d images in %.1f s (%.1f images/s)",
+                stats["images"],
+                stats["seconds"],
+                stats["images_per_second"],
+            )
+        return key, result
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        """Runs the pipeline, yielding the result of each image in order.
+
+        Yields:
+            A `(source, result)` tuple for each image.
+
+        Raises:
+            TypeError: If an image is not a byte buffer or a path.
+            OSError: If an image file cannot be read.
+            FFIError: If the operation fails.
+        """
+        self._reset_stats()
+        pending = deque()
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.readers, thread_name_prefix="vaccel-reader"
+            ) as readers,
+            ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="vaccel-pipeline"
+            ) as workers,
+        ):
+            try:
+                for key, image in self._items():
+                    read = readers.submit(_image_buffer, image, prefetch=True)
+                    work = workers.submit(self._process, read)
+                    pending.append((key, read, work))
+                    if len(pending) >= self.queue_size:
+                        done_key, _, done = pending.popleft()
+                        yield self._complete(done_key, done)
+                while pending:
+                    done_key, _, done = pending.popleft()
+                    yield self._complete(done_key, done)
+            finally:
+                for _, read, work in pending:
+                    work.cancel()
+                    read.cancel()
+
+    def run(self, out: str | os.PathLike | TextIO | None = None) -> dict:
+        """Runs the pipeline to completion.
+
+        Args:
+            out: A path or text file to write the results to, one JSON object
+                with the `source` and `result` of each image per line. If not
+                given, the results are discarded.
+
+        Returns:
+            The throughput statistics of the run (see `stats()`).
+
+        Raises:
+            TypeError: If an image is not a byte buffer or a path.
+            OSError: If an image or the output file cannot be accessed.
+            FFIError: If the operation fails.
+        """
+        if out is None:
+            for _ in self:
+                pass
+        elif isinstance(out, (str, os.PathLike)):
+            with Path(out).open("w") as f:
+                self._write(f)
+        else:
+            self._write(out)
+        return self.stats()
+
+    def _write(self, f: TextIO) -> None:
+        for key, result in self:
+            source = key if isinstance(key, int) else os.fspath(key)
+            f.write(json.dumps({"source": source, "result": result}) + "\n")
+
+    def stats(self) -> dict:
+        """Returns the throughput statistics of the current or last run.
+
+        Returns:
+            A dict with the number of processed `images` and image `bytes`,
+            the elapsed `seconds` and the `images_per_second`.
+        """
+        with self._lock:
+            images, nbytes, seconds = self._images, self._bytes, self._elapsed
+        return {
+            "images": images,
+            "bytes": nbytes,
+            "seconds": seconds,
+            "images_per_second": images / seconds if seconds else 0.0,
+        }
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pool of aligned tensor and resource data buffers."""
+
+import math
+import threading
+import weakref
+from typing import Any, Final
+
+from ._c_types.staging import DEFAULT_ALIGNMENT, _Lease, aligned_empty
+from ._lazy import LazyModule, is_available
+
+np = LazyModule("numpy")
+HAS_NUMPY = is_available("numpy")
+
+DEFAULT_MAX_CACHED_BYTES: Final[int] = 256 * 1024 * 1024
+DEFAULT_MAX_PER_KEY: Final[int] = 8
+
+
+class BufferPool:
+    """Bounded free-list of aligned buffers, keyed by dtype and shape.
+
+    Buffers handed out by the pool are recycled once the returned array and
+    every view of it (including tensors and resources created from it) have
+    been released, so repeated requests with the same inputs reuse memory that
+    is already allocated and faulted in.
+
+    Attributes:
+        alignment (int): The alignment of the handed out buffers in bytes.
+        max_cached_bytes (int): The maximum number of bytes kept in the
+            free-list.
+        max_per_key (int): The maximum number of buffers of the same dtype and
+            shape kept in the free-list.
+        hits (int): The number of buffers served from the free-list.
+        misses (int): The number of buffers that required a new allocation.
+    """
+
+    def __init__(
+        self,
+        alignment: int = DEFAULT_ALIGNMENT,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES,
+        max_per_key: int = DEFAULT_MAX_PER_KEY,
+    ):
+        """Initializes a new `BufferPool` object.
+
+        Args:
+            alignment: The alignment of the handed out buffers in bytes. Must
+                be a power of two.
+            max_cached_bytes: The maximum number of bytes to keep cached for
+                reuse.
+            max_per_key: The maximum number of buffers of the same dtype and
+                shape to keep cached for reuse.
+
+        Raises:
+            ValueError: If `alignment` is not a power of two.
+        """
+        if alignment <= 0 or alignment & (alignment - 1):
+            msg = f"Alignment must be a power of two, got {alignment}"
+            raise ValueError(msg)
+
+        self.alignment = alignment
+        self.max_cached_bytes = max_cached_bytes
+        self.max_per_key = max_per_key
+        self.hits = 0
+        self.misses = 0
+        self._free = {}
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self, key: tuple[str, tuple[int, ...]], nbytes: int):
+        with self._lock:
+            bucket = self._free.get(key)
+            if bucket:
+                self._cached_bytes -= nbytes
+                self.hits += 1
+                return bucket.pop()
+            self.misses += 1
+        return aligned_empty(nbytes, self.alignment)
+
+    def _release(
+        self, key: tuple[str, tuple[int, ...]], buffer: "np.ndarray"
+    ) -> None:
+        nbytes = buffer.nbytes
+        with self._lock:
+            if self._cached_bytes + nbytes > self.max_cached_bytes:
+                return
+            bucket = self._free.setdefault(key, [])
+            if len(bucket) >= self.max_per_key:
+                return
+            bucket.append(buffer)
+            self._cached_bytes += nbytes
+
+    def empty(
+        self, shape: int | tuple[int, ...], dtype: Any = "float32"
+    ) -> "np.ndarray":
+        """Takes an uninitialized, aligned array from the pool.
+
+        The buffer of the array returns to the pool once the array and all
+        its views have been released.
+
+        Args:
+            shape: The shape of the array.
+            dtype: The data type of the array. Defaults to float32.
+
+        Returns:
+            A C-contiguous NumPy array whose data is aligned to `alignment`.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+        """
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        dtype = np.dtype(dtype)
+        key = (dtype.str, shape)
+        nbytes = math.prod(shape) * dtype.itemsize
+
+        lease = _Lease(self._acquire(key, nbytes))
+        weakref.finalize(lease, self._release, key, lease.buffer)
+        return np.asarray(lease).view(dtype).reshape(shape)
+
+    def buffer(self, nbytes: int) -> memoryview:
+        """Takes an uninitialized, aligned byte buffer from the pool.
+
+        Args:
+            nbytes: The size of the buffer in bytes.
+
+        Returns:
+            A writable, byte-formatted `memoryview` of `nbytes` bytes.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+        """
+        return memoryview(self.empty(nbytes, np.uint8))
+
+    def is_aligned(self, data: Any) -> bool:
+        """Checks if data can be passed to C as is.
+
+        Args:
+            data: A NumPy array or byte-like object.
+
+        Returns:
+            True if the data is C-contiguous and aligned to `alignment`.
+        """
+        if not isinstance(data, np.ndarray):
+            data = np.frombuffer(data, dtype=np.uint8)
+        return (
+            data.flags.c_contiguous and data.ctypes.data % self.alignment == 0
+        )
+
+    def aligned(self, data: Any, *, allow_copy: bool = True) -> Any:
+        """Returns data that is aligned, copying it into the pool if needed.
+
+        Args:
+            data: A NumPy array or byte-like object.
+            allow_copy: Whether unaligned data may be copied. Defaults to True.
+
+        Returns:
+            `data` if it is already aligned and C-contiguous. Otherwise, a
+            pooled copy; a NumPy array for NumPy input and a `memoryview` for
+            byte-like input.
+
+        Raises:
+            NotImplementedError: If NumPy is not installed.
+            ValueError: If `data` must be copied and `allow_copy` is False.
+        """
+        if not HAS_NUMPY:
+            msg = "NumPy is not available"
+            raise NotImplementedError(msg)
+
+        if self.is_aligned(data):
+            return data
+        if not allow_copy:
+            msg = (
+                f"Data is not C-contiguous and aligned to {self.alignment} "
+                "bytes and copying is not allowed"
+            )
+            raise ValueError(msg)
+        if isinstance(data, np.ndarray):
+            copy = self.empty(data.shape, data.dtype)
+            np.copyto(copy, data, casting="no")
+            return copy
+        src = np.frombuffer(data, dtype=np.uint8)
+        copy = self.empty(src.shape, np.uint8)
+        copy[...] = src
+        return memoryview(copy)
+
+    def stats(self) -> dict[str, int]:
+        """Returns the pool allocation and cache statistics.
+
+        Returns:
+            A dict with the number of `hits`, `misses` and the currently
+            `cached_bytes`.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_bytes": self._cached_bytes,
+            }
+
+    def clear(self) -> None:
+        """Drops all cached buffers."""
+        with self._lock:
+            self._free.clear()
+            self._cached_bytes = 0
+
+
+buffer_pool = BufferPool()
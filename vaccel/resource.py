@@ -2,41 +2,40 @@
 
 """Interface to the `struct vaccel_resource` C object."""
 
-import logging
+import weakref
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from ._c_types import CBytes, CList, CNumpyArray, CType
+from ._c_types import CBytes, CList, CNumpyArray, OwnedCType
 from ._c_types.utils import CEnumBuilder
+from ._ipc import pickle_buffer, unpickle_buffer
+from ._lazy import is_available
 from ._libvaccel import ffi, lib
 from .error import FFIError, NullPointerError
+from .pool import BufferPool
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from vaccel.session import (
         BaseSession as Session,  # Type hint only, not imported at runtime
     )
 
-try:
-    import numpy as np  # noqa: TC002
-
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
-
-logger = logging.getLogger(__name__)
+HAS_NUMPY = is_available("numpy")
 
 enum_builder = CEnumBuilder(lib)
 ResourceType = enum_builder.from_prefix("ResourceType", "VACCEL_RESOURCE_")
 
 
-class Resource(CType):
+class Resource(OwnedCType):
     """Wrapper for the `struct vaccel_resource` C object.
 
     Manages the creation and initialization of a C `struct vaccel_resource` and
     provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _paths (list[Path] | list[str] | Path | str): The path(s) to the
@@ -46,6 +45,8 @@ class Resource(CType):
             passed to the C struct.
         _c_obj_ptr (ffi.CData): A double pointer to the underlying
             `struct vaccel_resource` C object.
+        _sessions (weakref.WeakSet[Session]): The sessions the resource is
+            registered with.
     """
 
     def __init__(
@@ -66,6 +67,7 @@ class Resource(CType):
         self._type = type_
         self._c_data = None
         self._c_obj_ptr = ffi.NULL
+        self._sessions = weakref.WeakSet()
         super().__init__()
 
     def _init_c_obj(self):
@@ -102,51 +104,131 @@ class Resource(CType):
         cls,
         data: bytes | bytearray | memoryview,
         type_: ResourceType,
+        *,
+        pool: BufferPool | None = None,
     ) -> "Resource":
         """Initializes a new `Resource` object from byte-like data.
 
         Args:
             data: The data to be passed to the C struct.
             type_: The type of the resource.
+            pool: A pool to copy `data` into if it is not aligned to the pool
+                alignment. The pooled buffer is returned to the pool when the
+                resource is released.
 
         Returns:
             A new `Resource` object
+
+        Raises:
+            NotImplementedError: If `pool` is given and NumPy is not installed.
         """
+        if pool is not None:
+            data = pool.aligned(data)
+
         inst = cls.__new__(cls)
         inst._data = data
         inst._type = type_
         inst._c_data = CBytes(inst._data)
         inst._c_paths = None
         inst._c_obj_ptr = ffi.NULL
+        inst._sessions = weakref.WeakSet()
         super().__init__(inst)
         return inst
 
     @classmethod
-    def from_numpy(cls, data: "np.ndarray") -> "Resource":
+    def from_numpy(
+        cls,
+        data: "np.ndarray",
+        *,
+        allow_copy: bool = True,
+        pool: BufferPool | None = None,
+    ) -> "Resource":
         """Initializes a new `Resource` object from a NumPy array.
 
+        C-contiguous arrays are passed to the C struct without copying; other
+        layouts are copied into a reusable aligned staging buffer.
+
         Args:
             data: The NumPy array containing the resource data.
+            allow_copy: Whether a non C-contiguous array may be copied.
+                Defaults to True.
+            pool: A pool to copy `data` into if it is not C-contiguous and
+                aligned to the pool alignment. The pooled buffer is returned to
+                the pool when the resource is released.
 
         Returns:
             A new `Resource` object
 
         Raises:
             NotImplementedError: If NumPy is not installed.
+            ValueError: If `data` must be copied and `allow_copy` is False.
         """
         if not HAS_NUMPY:
             msg = "NumPy is not available"
             raise NotImplementedError(msg)
 
+        if pool is not None:
+            data = pool.aligned(data, allow_copy=allow_copy)
+
         inst = cls.__new__(cls)
         inst._data = data
         inst._type = ResourceType.DATA
-        inst._c_data = CNumpyArray(inst._data)
+        inst._c_data = CNumpyArray(inst._data, allow_copy=allow_copy)
         inst._c_paths = None
         inst._c_obj_ptr = ffi.NULL
+        inst._sessions = weakref.WeakSet()
         super().__init__(inst)
         return inst
 
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """Supports pickling of the resource.
+
+        With pickle protocol 5, the data of data resources is exported as an
+        out-of-band `pickle.PickleBuffer`, so it can be transferred without
+        copying (e.g. with a `buffer_callback`). The unpickled resource is not
+        registered with any session.
+
+        Args:
+            protocol: The pickle protocol in use.
+
+        Returns:
+            The reconstruction callable and its arguments.
+        """
+        if self._c_data is None:
+            return (self._from_pickle, (self._paths, int(self._type)))
+        data = pickle_buffer(self._c_data.value, protocol)
+        return (self._from_pickle, (data, int(self._type)))
+
+    @classmethod
+    def _from_pickle(cls, source: Any, type_: int) -> "Resource":
+        if isinstance(source, list):
+            return cls(source, ResourceType(type_))
+        return cls.from_buffer(unpickle_buffer(source), ResourceType(type_))
+
+    def close(self) -> None:
+        """Releases the underlying C object and the resource data.
+
+        The resource is dropped from the resources of the sessions it is
+        registered with (see `BaseSession.resources`).
+
+        Raises:
+            FFIError: If the C object deletion fails.
+        """
+        for session in list(self._sessions):
+            session._resources.pop(id(self), None)
+        self._sessions.discard(session)
+        self._sessions.clear()
+        super().close()
+
+    def _release_data(self) -> None:
+        """Drops the resource data once the C object has been released.
+
+        Data buffers taken from a `BufferPool` are returned to the pool once
+        no other reference to them remains.
+        """
+        self._data = None
+        self._c_data = None
+
     @property
     def value(self) -> ffi.CData:
         """Returns the value of the underlying C struct.
@@ -156,27 +238,19 @@ class Resource(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Deletes the underlying `struct vaccel_resource` C object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If resource deletion fails.
         """
-        ret = lib.vaccel_resource_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_resource_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not delete resource")
-        self._c_obj = ffi.NULL
-
-    def __del__(self):
-        try:
-            if self.id <= 0:
-                return
-
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up Resource")
 
     @property
     def id(self) -> int:
@@ -215,6 +289,8 @@ class Resource(CType):
                 f"Could not register resource {self.id} "
                 f"with session {session.id}",
             )
+        session._resources[id(self)] = self
+        self._sessions.add(session)
 
     def unregister(self, session: "Session") -> None:
         """Unregisters the resource from a session.
@@ -235,6 +311,8 @@ class Resource(CType):
                 f"Could not unregister resource {self.id} "
                 f"from session {session.id}",
             )
+        session._resources.pop(id(self), None)
+        self._sessions.discard(session)
 
     def sync(self, session: "Session") -> None:
         """Synchronizes the resource data to reflect any remote changes.
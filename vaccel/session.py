@@ -3,8 +3,12 @@
 """Interface to the `struct vaccel_session` C object."""
 
 import logging
+import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 
-from ._c_types import CType
+from ._c_types import OwnedCType
 from ._libvaccel import ffi, lib
 from .error import FFIError, NullPointerError
 from .ops.blas import BlasMixin
@@ -23,17 +27,22 @@ from .resource import Resource
 logger = logging.getLogger(__name__)
 
 
-class BaseSession(CType):
+class BaseSession(OwnedCType):
     """Wrapper for the `struct vaccel_session` C object.
 
     Manages the creation and initialization of a C `struct vaccel_session` and
     provides access to it through Python properties.
 
     Inherits:
-        CType: Abstract base class for defining C data types.
+        OwnedCType: Abstract base class for C types that own their underlying
+            C object.
 
     Attributes:
         _flags (PluginType): The flags used to create the session.
+        _resources (weakref.WeakValueDictionary[int, Resource]): The
+            resources registered with the session, keyed by object ID.
+        _clones (list[BaseSession]): The idle sessions created by `clone()`.
+        _clones_lock (threading.Lock): Serializes access to `_clones`.
         _c_obj_ptr (ffi.CData): A double pointer to the underlying
             `struct vaccel_session` C object.
     """
@@ -45,6 +54,9 @@ class BaseSession(CType):
             flags: The flags to configure the session creation. Defaults to 0.
         """
         self._flags = PluginType(flags)
+        self._resources = weakref.WeakValueDictionary()
+        self._clones = []
+        self._clones_lock = threading.Lock()
         self._c_obj_ptr = ffi.NULL
         super().__init__()
 
@@ -62,6 +74,24 @@ class BaseSession(CType):
         self._c_obj = self._c_obj_ptr[0]
         self._c_size = ffi.sizeof("struct vaccel_session")
 
+    def close(self) -> None:
+        """Releases the underlying C object.
+
+        Forgets the resources registered with the session, without
+        unregistering them, and closes the sessions created by `clone()`.
+
+        Raises:
+            FFIError: If the C object deletion fails.
+        """
+        for resource in self.resources:
+            resource._sessions.discard(self)
+        self._resources.clear()
+        super().close()
+        with self._clones_lock:
+            clones, self._clones = self._clones, []
+        for session in clones:
+            _release_clone(session)
+
     @property
     def value(self) -> ffi.CData:
         """Returns the value of the underlying C struct.
@@ -71,27 +101,19 @@ class BaseSession(CType):
         """
         return self._c_ptr_or_raise[0]
 
-    def _del_c_obj(self):
+    @staticmethod
+    def _del_c_obj(c_obj: ffi.CData) -> None:
         """Releases the underlying C `struct vaccel_session` object.
 
+        Args:
+            c_obj: A pointer to the C object to delete.
+
         Raises:
             FFIError: If session release fails.
         """
-        ret = lib.vaccel_session_delete(self._c_ptr_or_raise)
+        ret = lib.vaccel_session_delete(c_obj)
         if ret != 0:
             raise FFIError(ret, "Could not release session")
-        self._c_obj = ffi.NULL
-
-    def __del__(self):
-        try:
-            if self.id <= 0:
-                return
-
-            self._del_c_obj()
-        except NullPointerError:
-            pass
-        except FFIError:
-            logger.exception("Failed to clean up BaseSession")
 
     @property
     def id(self) -> int:
@@ -130,6 +152,56 @@ class BaseSession(CType):
         """
         return bool(self._c_ptr_or_raise.is_virtio)
 
+    @property
+    def resources(self) -> list[Resource]:
+        """The resources registered with the session.
+
+        Returns:
+            The resources registered with `Resource.register()` and not yet
+                unregistered or closed.
+        """
+        return list(self._resources.values())
+
+    @contextmanager
+    def clone(self) -> Iterator["BaseSession"]:
+        """Provides a session with the flags and resources of this session.
+
+        Used to run operations of this session from other threads, each on its
+        own session. Sessions are created on first use and reused by later
+        calls, so there are at most as many as the calls that were active at
+        the same time. The resources registered with this session are
+        registered with the provided session, and resources no longer
+        registered with this session are unregistered from it. The sessions
+        are closed when this session is closed.
+
+        Yields:
+            A session of the same type as this session, used by no other
+            `clone()` block until this block exits.
+
+        Raises:
+            FFIError: If session creation or resource registration fails.
+        """
+        with self._clones_lock:
+            session = self._clones.pop() if self._clones else None
+        if session is None:
+            session = type(self)(self._flags)
+        try:
+            resources = dict(self._resources)
+            for key, resource in list(session._resources.items()):
+                if resources.get(key) is not resource:
+                    resource.unregister(session)
+            for key, resource in resources.items():
+                if session._resources.get(key) is not resource:
+                    resource.register(session)
+            yield session
+        finally:
+            with self._clones_lock:
+                reuse = not self.closed
+                if reuse:
+                    self._clones.append(session)
+            if not reuse:
+                _release_clone(session)
+
     def has_resource(self, resource: Resource) -> bool:
         """Checks if a resource is registered with the session.
 
@@ -184,7 +256,8 @@ class Session(
     """Extended session with operations' functionalities.
 
     Inherits from `BaseSession` and the operation mixins, adding support for the
-    operation functions.
+    operation functions. The operation modules import their optional
+    dependencies (NumPy, PyTorch) lazily, on first use.
 
     Inherits:
         BaseSession: Core session management.
@@ -195,5 +268,92 @@ class Session(
         BlasMixin: BLAS operations.
         FpgaMixin: FPGA operations.
         MinmaxMixin: Minmax operations.
-        TensorflowMixin: TensorFlow operations.
+        TFMixin: TensorFlow operations.
+        TFLiteMixin: TensorFlow Lite operations.
+        TorchMixin: PyTorch operations.
+    """
+
+
+def _release_clone(session: BaseSession) -> None:
+    """Unregisters the resources of a cloned session and closes it."""
+    for resource in session.resources:
+        resource.unregister(session)
+    session.close()
+
+
+class _Sentinel:
+    """Weak-referenceable object that lives as long as its thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _close_local_sessions(
+    sessions: dict[int, tuple[Session, dict[int, Resource]]],
+) -> None:
+    """Unregisters the resources of thread-local sessions and closes them."""
+    for session, resources in sessions.values():
+        for resource in resources.values():
+            try:
+                resource.unregister(session)
+            except (FFIError, NullPointerError):  # noqa: PERF203
+                logger.exception("Failed to unregister thread-local resource")
+        try:
+            session.close()
+        except FFIError:
+            logger.exception("Failed to clean up thread-local Session")
+    sessions.clear()
+
+
+_local = threading.local()
+
+
+def _thread_sessions() -> dict[int, tuple[Session, dict[int, Resource]]]:
+    """Returns the sessions of the calling thread, keyed by session flags.
+
+    The thread-local state is dropped when the thread exits, which triggers the
+    finalizer of its sentinel and closes the sessions. The state is created on
+    first use, so the finalizer of the main thread runs before the library is
+    cleaned up at exit.
+    """
+    sessions = getattr(_local, "sessions", None)
+    if sessions is None:
+        sessions = _local.sessions = {}
+        _local.sentinel = _Sentinel()
+        weakref.finalize(_local.sentinel, _close_local_sessions, sessions)
+    return sessions
+
+
+def local_session(
+    flags: PluginType | int = 0, resources: Iterable[Resource] = ()
+) -> Session:
+    """Returns the session of the calling thread.
+
+    The session is created on the first call from each thread and reused by
+    later calls with the same flags, so threads never share a session and no
+    locking is needed. Resources are registered with the session once per
+    thread. When the thread exits, the resources are unregistered and the
+    session is closed.
+
+    Args:
+        flags: The flags of the session.
+        resources: The resources to register with the session, if not
+            already registered.
+
+    Returns:
+        The `Session` object of the calling thread for `flags`.
+
+    Raises:
+        FFIError: If session creation or resource registration fails.
     """
+    sessions = _thread_sessions()
+    key = int(flags)
+    entry = sessions.get(key)
+    if entry is None or entry[0].closed:
+        entry = sessions[key] = (Session(flags), {})
+
+    session, registered = entry
+    for resource in resources:
+        if id(resource) not in registered:
+            resource.register(session)
+            registered[id(resource)] = resource
+    return session
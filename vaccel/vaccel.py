@@ -2,8 +2,10 @@
 
 """Interface to common vaccel C functions."""
 
-import atexit
+import sys
+import weakref
 
+from ._c_types import OwnedCType
 from ._libvaccel import lib
 from .config import Config
 from .error import FFIError
@@ -27,7 +29,6 @@ def bootstrap(config: Config | None = None) -> None:
         raise FFIError(ret, "Could not bootstrap vAccel library")
 
 
-@atexit.register
 def cleanup() -> None:
     """Cleans up the vAccel library resources.
 
@@ -40,3 +41,34 @@ def cleanup() -> None:
     ret = lib.vaccel_cleanup()
     if ret != 0:
         raise FFIError(ret, "Could not cleanup vAccel library objects")
+
+
+# Registered as a finalizer instead of an `atexit` handler, since finalizers
+# run in reverse order of creation at exit: the library is cleaned up after
+# the C objects of all vAccel objects still alive have been released.
+_cleanup_finalizer = weakref.finalize(sys.modules[__name__], cleanup)
+
+
+def release(*objs: OwnedCType) -> None:
+    """Releases the underlying C objects of multiple vAccel objects.
+
+    The objects are closed in the given order. All objects are closed even if
+    releasing one of them fails. The C objects of objects with live zero-copy
+    views of their data are released once the last view is released.
+
+    Args:
+        *objs: The objects to release (e.g. sessions, resources, args, tensors).
+
+    Raises:
+        FFIError: If releasing any of the C objects fails. The first error is
+            raised after all objects have been processed.
+    """
+    error = None
+    for obj in objs:
+        try:
+            obj.close()
+        except FFIError as e:  # noqa: PERF203
+            if error is None:
+                error = e
+    if error is not None:
+        raise error